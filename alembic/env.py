@@ -33,7 +33,7 @@ async def run_async_migrations() -> None:
     """Create an async engine and execute migrations within an async context."""
 
     connectable = create_async_engine(
-        db.DB_URL,
+        db.database_url(),
         poolclass=pool.NullPool,
     )
 
@@ -0,0 +1,115 @@
+"""Issuing many signup OTPs: per-command loop versus `MessageBus.handle_many`.
+
+Both variants run the real `IssueSignupOtpCommand` handlers with the outbox
+enabled (so SMS delivery stays out of the measurement) and report OTPs/s:
+
+- loop: `bus.handle` per phone, i.e. one session, lookup, commit per OTP;
+- batch: `bus.handle_many` in chunks of `--batch-size`, i.e. one session, one
+  user lookup, multi-row inserts and one commit per chunk.
+
+Usage (against the dev Postgres, after `make pgup migrate`)::
+
+    uv run python -m benchmarks.bench_batch --otps 5000 --batch-size 500
+
+or, without Postgres::
+
+    uv run python -m benchmarks.bench_batch \\
+        --db-url sqlite+aiosqlite:///.cache/bench.db --create-tables
+"""
+
+import argparse
+import asyncio
+import functools
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from fastup.core import bus, commands
+from fastup.infra import db
+from fastup.infra.hash_services import HMACHasher
+from fastup.infra.orm_mapper import start_orm_mapper
+from fastup.infra.pydantic_config import get_config
+from fastup.infra.snowflake_idgen import SnowflakeIDGenerator
+from fastup.infra.sql_unit_of_work import SQLUnitOfwWork
+
+
+def build_bus(sessionmaker) -> bus.MessageBus:
+    from fastup.core import handlers
+
+    handlers.load_all()
+
+    uow = functools.partial(
+        SQLUnitOfwWork, session_factory=sessionmaker, use_outbox=True
+    )
+    deps = {
+        "config": get_config(),
+        "uow": bus.Provider(uow),
+        "idgen": SnowflakeIDGenerator(),
+        "hmac_hasher": HMACHasher(),
+        "event_queue": bus.Provider(bus.current_event_queue),
+    }
+    return bus.MessageBus(
+        command_handlers={
+            commands.IssueSignupOtpCommand: bus.inject_dependencies(
+                bus.COMMAND_HANDLERS[commands.IssueSignupOtpCommand], deps
+            )
+        },
+        batch_command_handlers={
+            commands.IssueSignupOtpCommand: bus.inject_dependencies(
+                bus.BATCH_COMMAND_HANDLERS[commands.IssueSignupOtpCommand], deps
+            )
+        },
+        event_handlers={},
+    )
+
+
+def make_commands(n: int, offset: int) -> list[commands.IssueSignupOtpCommand]:
+    return [
+        commands.IssueSignupOtpCommand(phone=f"+98912{offset + i:07}", ipaddr="::1")
+        for i in range(n)
+    ]
+
+
+async def run_loop(message_bus: bus.MessageBus, cmds: list) -> float:
+    start = time.perf_counter()
+    for cmd in cmds:
+        await message_bus.handle(cmd)
+    return time.perf_counter() - start
+
+
+async def run_batches(message_bus: bus.MessageBus, cmds: list, size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(cmds), size):
+        results = await message_bus.handle_many(cmds[i : i + size])
+        assert not any(isinstance(r, Exception) for r in results), results
+    return time.perf_counter() - start
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.db_url) if args.db_url else db.get_engine()
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    start_orm_mapper()
+    if args.create_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(db.mapper_registry.metadata.create_all)
+
+    message_bus = build_bus(sessionmaker)
+    elapsed = await run_loop(message_bus, make_commands(args.otps, 0))
+    print(f"{'loop':<8} {args.otps / elapsed:10.1f} OTPs/s")
+
+    cmds = make_commands(args.otps, args.otps)
+    elapsed = await run_batches(message_bus, cmds, args.batch_size)
+    print(f"{'batch':<8} {args.otps / elapsed:10.1f} OTPs/s")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--otps", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--db-url", default=None)
+    parser.add_argument("--create-tables", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,109 @@
+"""Signup throughput on thread and process pools, with and without the GIL.
+
+`--signups` signups run `--concurrency` at a time. Each gets its ID from a
+shared `SnowflakeIDGenerator` on the event loop, then hashes the password with
+Argon2 and encodes an access and a refresh token on the pool's workers:
+
+- process: a pool of `--workers` processes, the default of GIL builds;
+- thread: a pool of `--workers` threads, the default of free-threaded builds.
+
+Argon2 releases the GIL while hashing, but token encoding is Python code, so
+threads only scale it on a free-threaded build. Run it with both builds and
+compare::
+
+    uv run --python 3.13 python -m benchmarks.bench_free_threading
+    uv run --python 3.13t python -m benchmarks.bench_free_threading
+
+Usage::
+
+    uv run python -m benchmarks.bench_free_threading --signups 64 --workers 4
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import datetime
+import multiprocessing
+import secrets
+import sys
+import time
+
+from fastup.core.bus import OffloadExecutor, gil_enabled
+from fastup.infra.hash_services import Argon2PasswordHasher
+from fastup.infra.pyjwt_service import PyJWTService
+from fastup.infra.snowflake_idgen import SnowflakeIDGenerator
+
+TTL = datetime.timedelta(minutes=15)
+
+
+def signup_work(
+    hasher: Argon2PasswordHasher, tokens: PyJWTService, password: str, user_id: int
+) -> tuple[str, str, str]:
+    """The CPU work of a signup: the password hash and the user's tokens."""
+    pwdhash = hasher.hash(password)
+    access = tokens.encode(str(user_id), "access", TTL)
+    refresh = tokens.encode(str(user_id), "refresh", TTL)
+    return pwdhash, access.raw, refresh.raw
+
+
+async def bench(
+    name: str,
+    pool: concurrent.futures.Executor,
+    workers: int,
+    signups: int,
+    concurrency: int,
+) -> None:
+    executor = OffloadExecutor(name, pool, workers)
+    hasher = Argon2PasswordHasher()
+    tokens = PyJWTService(secrets.token_urlsafe(32))
+    idgen = SnowflakeIDGenerator()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def signup() -> None:
+        async with slots:
+            user_id = await idgen.next_id()
+            password = secrets.token_urlsafe(12)
+            await executor.run(signup_work, hasher, tokens, password, user_id)
+
+    # start the workers
+    await asyncio.gather(*(signup() for _ in range(workers)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(signup() for _ in range(signups)))
+    elapsed = time.perf_counter() - start
+    executor.shutdown()
+    print(
+        f"{name:>8}: {signups / elapsed:7.1f} signups/s"
+        f" ({elapsed / signups * 1e3:6.1f} ms each)"
+    )
+
+
+async def main(signups: int, concurrency: int, workers: int) -> None:
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {gil_enabled()}")
+    await bench(
+        "process",
+        concurrent.futures.ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("forkserver")
+        ),
+        workers,
+        signups,
+        concurrency,
+    )
+    await bench(
+        "thread",
+        concurrent.futures.ThreadPoolExecutor(workers),
+        workers,
+        signups,
+        concurrency,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Signup throughput on thread and process pools."
+    )
+    parser.add_argument("--signups", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.signups, args.concurrency, args.workers))
@@ -0,0 +1,80 @@
+"""Private memory of forked workers after a full collection, with and without
+`gc.freeze()` in the master.
+
+Each run starts a fresh interpreter that preloads the app like
+`fastup.serve` does, with or without freezing, and forks `--workers`
+children. Each child runs one full collection, as a long-lived worker
+eventually does, then waits while the parent reports the memory of every
+process with `fastup.memory_report`. Without freezing, the collection writes
+to the header of every preloaded object, so their pages are copied into each
+worker; frozen objects are skipped and stay shared.
+
+Usage::
+
+    uv run python -m benchmarks.bench_gc_freeze --workers 4
+"""
+
+import argparse
+import gc
+import os
+import signal
+import subprocess
+import sys
+
+
+def child_process(freeze: bool, workers: int) -> None:
+    if freeze:
+        gc.disable()
+    import fastup.api.app  # noqa: F401
+
+    if freeze:
+        gc.freeze()
+
+    from fastup.memory_report import report
+
+    ready_r, ready_w = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            gc.enable()
+            gc.collect()
+            os.write(ready_w, b".")
+            signal.pause()
+            os._exit(0)
+        pids.append(pid)
+    for _ in range(workers):
+        os.read(ready_r, 1)
+
+    usages = report(os.getpid())
+    for pid in pids:
+        os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+
+    master, children = usages[0], usages[1:]
+    private = sum(usage.private for usage in children) / len(children)
+    shared = sum(usage.shared for usage in children) / len(children)
+    total = sum(usage.pss for usage in usages)
+    print(
+        f"{'frozen' if freeze else 'not frozen':>10}: master rss {master.rss / 1024:6.1f}"
+        f" MiB, per worker shared {shared / 1024:6.1f} MiB"
+        f" private {private / 1024:6.1f} MiB, total pss {total / 1024:6.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Private memory of forked workers, with and without gc.freeze."
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--child", choices=["frozen", "not-frozen"])
+    args = parser.parse_args()
+    if args.child:
+        child_process(args.child == "frozen", args.workers)
+    else:
+        for mode in ("not-frozen", "frozen"):
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_gc_freeze", "--child", mode]
+                + ["--workers", str(args.workers)],
+                check=True,
+            )
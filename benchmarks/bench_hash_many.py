@@ -0,0 +1,89 @@
+"""Batch hashing versus the per-item loop.
+
+HMAC: `--codes` OTP codes hashed
+
+- per item, keyed: `hmac.new` for every code, as `HMACHasher` used to;
+- per item: `HMACHasher.hash` in a loop, copying the pre-keyed object;
+- batch: one `HMACHasher.hash_many` call.
+
+Argon2: `--passwords` passwords hashed on a process pool of `--workers`
+
+- per item: `ahash` awaited in a loop, one pool call per password;
+- batch: one `ahash_many` call, split into one chunk per worker.
+
+Usage::
+
+    uv run python -m benchmarks.bench_hash_many --codes 100000 --passwords 16
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import hashlib
+import hmac
+import multiprocessing
+import secrets
+import time
+
+from fastup.core.bus import OffloadExecutor
+from fastup.infra.hash_services import Argon2PasswordHasher, HMACHasher
+
+
+def bench_hmac(count: int) -> None:
+    key = secrets.token_bytes(32)
+    hasher = HMACHasher(key)
+    codes = [f"{secrets.randbelow(10_000):04d}" for _ in range(count)]
+
+    def keyed() -> list[str]:
+        return [
+            hmac.new(key, code.encode("utf-8"), hashlib.sha256).hexdigest()
+            for code in codes
+        ]
+
+    for name, run in {
+        "per item, keyed": keyed,
+        "per item": lambda: [hasher.hash(code) for code in codes],
+        "batch": lambda: hasher.hash_many(codes),
+    }.items():
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"hmac   {name:>16}: {elapsed / count * 1e9:7.0f} ns/code")
+
+
+async def bench_argon2(count: int, workers: int) -> None:
+    executor = OffloadExecutor(
+        "process",
+        concurrent.futures.ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("forkserver")
+        ),
+        workers,
+    )
+    hasher = Argon2PasswordHasher(executor=executor)
+    passwords = [secrets.token_urlsafe(12) for _ in range(count)]
+    await hasher.ahash_many(["warm-up"] * workers)  # start the workers
+
+    async def per_item() -> list[str]:
+        return [await hasher.ahash(password) for password in passwords]
+
+    for name, run in {
+        "per item": per_item,
+        "batch": lambda: hasher.ahash_many(passwords),
+    }.items():
+        start = time.perf_counter()
+        await run()
+        elapsed = time.perf_counter() - start
+        print(f"argon2 {name:>16}: {elapsed / count * 1e3:7.1f} ms/password")
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Batch hashing versus the per-item loop."
+    )
+    parser.add_argument("--codes", type=int, default=100_000)
+    parser.add_argument("--passwords", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    bench_hmac(args.codes)
+    asyncio.run(bench_argon2(args.passwords, args.workers))
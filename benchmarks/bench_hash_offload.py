@@ -0,0 +1,105 @@
+"""Event-loop lag caused by Argon2 password hashing under concurrent signups.
+
+Runs `--signups` password hashes, `--concurrency` at a time, while a probe
+task sleeps 1 ms in a loop and records how late it wakes up: the time every
+other request on the worker waits for the loop. Hashes run:
+
+- inline: `Argon2PasswordHasher.hash` called from the coroutine;
+- thread: `ahash` without an executor, on the default thread pool;
+- process: `ahash` on a process pool of `--workers`, bounded to
+  `--max-in-flight` calls, as configured by the bootstrap.
+
+Reports hashes/s and the probe's lag percentiles, plus the queue time of the
+process pool calls.
+
+Usage::
+
+    uv run python -m benchmarks.bench_hash_offload --signups 64 --workers 2
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import multiprocessing
+import statistics
+import time
+
+from fastup.core.bus import OffloadExecutor
+from fastup.infra.hash_services import Argon2PasswordHasher
+
+PROBE_INTERVAL = 0.001
+
+
+async def probe(lags: list[float], stop: asyncio.Event) -> None:
+    """Sleep in a loop, recording how much later than asked each wake-up is."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def signups(hasher: Argon2PasswordHasher, mode: str, args) -> float:
+    """Hash `--signups` passwords, `--concurrency` at a time; returns seconds."""
+    slots = asyncio.Semaphore(args.concurrency)
+
+    async def signup(index: int) -> None:
+        async with slots:
+            if mode == "inline":
+                hasher.hash(f"password-{index}")
+            else:
+                await hasher.ahash(f"password-{index}")
+            await asyncio.sleep(0)  # the rest of the request
+
+    start = time.perf_counter()
+    await asyncio.gather(*(signup(index) for index in range(args.signups)))
+    return time.perf_counter() - start
+
+
+async def measure(mode: str, args: argparse.Namespace) -> None:
+    waits: list[float] = []
+    executor = None
+    if mode == "process":
+        executor = OffloadExecutor(
+            "process",
+            concurrent.futures.ProcessPoolExecutor(
+                args.workers, mp_context=multiprocessing.get_context("forkserver")
+            ),
+            args.workers,
+            on_wait=lambda name, waited: waits.append(waited),
+            max_in_flight=args.max_in_flight,
+        )
+    hasher = Argon2PasswordHasher(executor=executor)
+    if mode != "inline":
+        await hasher.ahash("warm-up")  # start the workers
+        waits.clear()
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(lags, stop))
+    elapsed = await signups(hasher, mode, args)
+    stop.set()
+    await prober
+    if executor is not None:
+        executor.shutdown()
+
+    quantiles = statistics.quantiles(lags, n=100, method="inclusive")
+    print(
+        f"{mode:>8}: {args.signups / elapsed:6.1f} hashes/s  loop lag"
+        f" p50 {quantiles[49] * 1e3:7.2f} ms  p99 {quantiles[98] * 1e3:7.2f} ms"
+        f"  max {max(lags) * 1e3:7.2f} ms"
+        + (f"  queue p50 {statistics.median(waits) * 1e3:.1f} ms" if waits else "")
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Event-loop lag caused by Argon2 hashing under concurrent signups."
+    )
+    parser.add_argument("--signups", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"])
+    args = parser.parse_args()
+    for mode in args.modes:
+        asyncio.run(measure(mode, args))
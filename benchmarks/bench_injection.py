@@ -0,0 +1,145 @@
+"""Per-dispatch overhead of dependency injection.
+
+Invokes a no-op handler taking five dependencies `--calls` times through:
+
+- direct: the handler called with its dependencies, as a baseline;
+- partial: the previous injector, i.e. a coroutine wrapper merging the
+  dependencies as keyword arguments on every call;
+- functools.partial: the dependencies bound with `functools.partial`;
+- container: the invoker compiled by `bus.Container`.
+
+Each scenario runs with singletons only, and with a COMMAND-scoped provider
+built on every call (like the unit of work), and reports the overhead per call
+over the baseline. Wrapping cost is reported too: the previous injector
+inspected the signature on every wrap, the container compiles once per handler.
+
+Usage::
+
+    uv run python -m benchmarks.bench_injection --calls 500000
+"""
+
+import argparse
+import asyncio
+import functools
+import inspect
+import time
+import typing
+
+from fastup.core import bus
+from fastup.core.commands import Command
+
+
+class Dep:
+    """Stands for a service or a unit of work."""
+
+
+class A(Dep): ...
+
+
+class B(Dep): ...
+
+
+class C(Dep): ...
+
+
+class D(Dep): ...
+
+
+class E(Dep): ...
+
+
+async def handler(cmd: Command, a: A, b: B, c: C, d: D, e: E) -> None:
+    return None
+
+
+def partial_inject(handler: bus.Handler, deps: dict) -> bus.Handler:
+    """The injector as it was: names looked up, kwargs merged on each call."""
+    params = inspect.signature(handler).parameters
+    static = {n: d for n, d in deps.items() if n in params and n != "cmd"}
+    factories = {n: d.factory for n, d in static.items() if isinstance(d, bus.Provider)}
+    for name in factories:
+        del static[name]
+
+    @functools.wraps(handler)
+    async def wrapper(message):
+        kwargs = dict(static)
+        for name, factory in factories.items():
+            kwargs[name] = factory()
+        return await handler(message, **kwargs)
+
+    return wrapper
+
+
+def scenarios(scoped: bool) -> dict[str, typing.Callable]:
+    instances = {"a": A(), "b": B(), "c": C(), "d": D(), "e": E()}
+    deps: dict[str, typing.Any] = dict(instances)
+    if scoped:
+        deps["e"] = bus.Provider(E)
+
+    container = bus.Container()
+    for name, dep in deps.items():
+        container.bind(type(instances[name]), dep)
+
+    def direct(message):
+        e = E() if scoped else instances["e"]
+        return handler(
+            message, instances["a"], instances["b"], instances["c"], instances["d"], e
+        )
+
+    result = {
+        "direct": direct,
+        "partial": partial_inject(handler, deps),
+        "container": container.inject(handler),
+    }
+    if not scoped:
+        result["functools.partial"] = functools.partial(handler, **instances)
+    return result
+
+
+async def run(invoker: typing.Callable, calls: int) -> float:
+    command = Command()
+    start = time.perf_counter()
+    for _ in range(calls):
+        await invoker(command)
+    return time.perf_counter() - start
+
+
+def wrap_cost(calls: int) -> None:
+    deps = {"a": A(), "b": B(), "c": C(), "d": D(), "e": E()}
+    container = bus.Container()
+    for dep in deps.values():
+        container.bind(type(dep), dep)
+
+    for name, wrap in {
+        "partial": lambda: partial_inject(handler, deps),
+        "container": lambda: container.inject(handler),
+    }.items():
+        start = time.perf_counter()
+        for _ in range(calls):
+            wrap()
+        elapsed = time.perf_counter() - start
+        print(f"wrap {name:>17}: {elapsed / calls * 1e6:>7.2f} us/handler")
+
+
+async def main(calls: int) -> None:
+    for scoped in (False, True):
+        print("with a COMMAND-scoped provider" if scoped else "singletons only")
+        invokers = scenarios(scoped)
+        await run(invokers["direct"], calls // 10)  # warm-up
+        baseline = await run(invokers["direct"], calls)
+        for name, invoker in invokers.items():
+            elapsed = baseline if name == "direct" else await run(invoker, calls)
+            print(
+                f"{name:>22}: {elapsed / calls * 1e9:>7.0f} ns/call "
+                f"(+{(elapsed - baseline) / calls * 1e9:>4.0f} ns)"
+            )
+    wrap_cost(calls // 100)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-dispatch overhead of dependency injection."
+    )
+    parser.add_argument("--calls", type=int, default=500_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
@@ -0,0 +1,74 @@
+"""Overhead of the bus middleware pipeline.
+
+Handles `--commands` no-op commands (each raising one event with one handler)
+through a `MessageBus` without middleware, and with the metrics middleware, and
+reports the per-command cost of each. Without middleware the bus calls handlers
+directly, so its cost should match the baseline.
+
+Usage::
+
+    uv run python -m benchmarks.bench_middleware --commands 100000
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import time
+
+from fastup.core import bus
+from fastup.core.commands import Command
+from fastup.core.events import Event
+from fastup.core.metrics import MetricsRegistry
+
+
+@dataclasses.dataclass(frozen=True)
+class PingCommand(Command): ...
+
+
+@dataclasses.dataclass(frozen=True)
+class PingedEvent(Event): ...
+
+
+async def handle_ping(cmd: PingCommand) -> None:
+    bus.current_event_queue().put_nowait(PingedEvent())
+
+
+async def handle_pinged(event: PingedEvent) -> None:
+    return None
+
+
+def build_bus(middleware: list[bus.Middleware]) -> bus.MessageBus:
+    return bus.MessageBus(
+        command_handlers={PingCommand: handle_ping},
+        event_handlers={PingedEvent: [handle_pinged]},
+        middleware=middleware,
+    )
+
+
+async def run(message_bus: bus.MessageBus, commands: int) -> float:
+    command = PingCommand()
+    start = time.perf_counter()
+    for _ in range(commands):
+        await message_bus.handle(command)
+    return time.perf_counter() - start
+
+
+async def main(commands: int) -> None:
+    scenarios = {
+        "no middleware": build_bus([]),
+        "metrics": build_bus([bus.MetricsMiddleware(MetricsRegistry())]),
+    }
+    await run(scenarios["no middleware"], commands // 10)  # warm-up
+    for name, message_bus in scenarios.items():
+        elapsed = await run(message_bus, commands)
+        print(
+            f"{name:>14}: {commands / elapsed:>10.0f} commands/s "
+            f"{elapsed / commands * 1e6:>7.2f} us/command"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.commands))
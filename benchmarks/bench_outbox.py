@@ -0,0 +1,148 @@
+"""Throughput of inline event dispatch versus the transactional outbox relay.
+
+Runs the real `IssueSignupOtpCommand` flow against a database, with an SMS
+provider that sleeps `--sms-latency-ms` per message, and reports:
+
+- inline: command latency includes `handle_otp_issued_event` (SMS + publish);
+- outbox: command latency only covers the transaction (OTP + outbox row), then
+  the relay drains the outbox in batches and reports events/s.
+
+Usage (against the dev Postgres, after `make pgup migrate`)::
+
+    uv run python -m benchmarks.bench_outbox --commands 2000 --concurrency 50
+
+or, without Postgres (no SKIP LOCKED, keep concurrency at 1)::
+
+    uv run python -m benchmarks.bench_outbox \\
+        --db-url sqlite+aiosqlite:///.cache/bench.db --create-tables --concurrency 1
+"""
+
+import argparse
+import asyncio
+import functools
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from fastup.core import bus, commands
+from fastup.core.enums import EventType
+from fastup.core.services import SMSService
+from fastup.infra import db
+from fastup.infra.hash_services import HMACHasher
+from fastup.infra.orm_mapper import start_orm_mapper
+from fastup.infra.pydantic_config import get_config
+from fastup.infra.snowflake_idgen import SnowflakeIDGenerator
+from fastup.infra.sql_unit_of_work import SQLUnitOfwWork
+
+
+class SlowSMSService(SMSService):
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+
+    async def send_sms(self, phone: str, text: str) -> int:
+        await asyncio.sleep(self.latency)
+        return 1
+
+
+class NullPublisher:
+    async def publish(self, type: EventType, payload: dict) -> None:
+        return None
+
+
+def build_bus(sessionmaker, use_outbox: bool, sms_latency: float) -> bus.MessageBus:
+    from fastup.core import handlers
+
+    handlers.load_all()
+
+    uow = functools.partial(
+        SQLUnitOfwWork, session_factory=sessionmaker, use_outbox=use_outbox
+    )
+    deps = {
+        "config": get_config(),
+        "uow": bus.Provider(uow),
+        "idgen": SnowflakeIDGenerator(),
+        "hmac_hasher": HMACHasher(),
+        "argon2_hasher": None,
+        "sms_service": SlowSMSService(sms_latency),
+        "event_queue": bus.Provider(bus.current_event_queue),
+        "publisher": NullPublisher(),
+    }
+    return bus.MessageBus(
+        command_handlers={
+            cmd: bus.inject_dependencies(h, deps)
+            for cmd, h in bus.COMMAND_HANDLERS.items()
+        },
+        event_handlers={
+            ev: [bus.inject_dependencies(h, deps) for h in hs]
+            for ev, hs in bus.EVENT_HANDLERS.items()
+        },
+    )
+
+
+async def run_commands(message_bus: bus.MessageBus, n: int, concurrency: int):
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(i: int) -> None:
+        cmd = commands.IssueSignupOtpCommand(phone=f"+98912{i:07}", ipaddr="::1")
+        async with sem:
+            start = time.perf_counter()
+            await message_bus.handle(cmd)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n)))
+    return time.perf_counter() - start, latencies
+
+
+def report(name: str, elapsed: float, n: int, latencies: list[float]) -> None:
+    q = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<16} {n / elapsed:10.1f}/s   "
+        f"p50={q[49] * 1e3:7.2f}ms  p99={q[98] * 1e3:7.2f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.db_url) if args.db_url else db.get_engine()
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    start_orm_mapper()
+    if args.create_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(db.mapper_registry.metadata.create_all)
+
+    latency = args.sms_latency_ms / 1000
+    inline_bus = build_bus(sessionmaker, use_outbox=False, sms_latency=latency)
+    elapsed, lat = await run_commands(inline_bus, args.commands, args.concurrency)
+    report("inline commands", elapsed, args.commands, lat)
+
+    outbox_bus = build_bus(sessionmaker, use_outbox=True, sms_latency=latency)
+    elapsed, lat = await run_commands(outbox_bus, args.commands, args.concurrency)
+    report("outbox commands", elapsed, args.commands, lat)
+
+    relay = bus.OutboxRelay(
+        uow_factory=functools.partial(SQLUnitOfwWork, session_factory=sessionmaker),
+        deliver=outbox_bus.deliver,
+        batch_size=args.batch_size,
+    )
+    start = time.perf_counter()
+    relayed = 0
+    while claimed := await relay.run_once():
+        relayed += claimed
+    elapsed = time.perf_counter() - start
+    print(f"{'outbox relay':<16} {relayed / elapsed:10.1f}/s   ({relayed} events)")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--sms-latency-ms", type=float, default=20.0)
+    parser.add_argument("--db-url", default=None)
+    parser.add_argument("--create-tables", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,130 @@
+"""Throughput of `fastup.serve` with one worker versus several.
+
+Starts the server for each `--workers` count and, once `GET /ready` answers,
+loads `GET /health` for `--duration` seconds from `--clients` processes,
+each keeping `--connections` keep-alive connections busy with a minimal
+HTTP/1.1 client, then reports requests/s and latency percentiles.
+
+The load generator shares the machine with the server, so leave it cores:
+e.g. on 8 cores, compare 1 and 4 workers with 3 client processes. The health
+route does no I/O, so this measures the server and framework overhead that
+extra workers parallelize; database-bound routes scale with the pool instead.
+
+Usage (needs Redis, e.g. `make redisup`; warm-up failures are only logged)::
+
+    uv run python -m benchmarks.bench_serve --workers 1 4 --clients 3
+
+Add `--reuse-port` to give each worker its own SO_REUSEPORT socket.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+PATH = "/api/v1/fastup/health"
+READY = "/api/v1/fastup/ready"
+
+
+async def request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str
+) -> int:
+    """Send one keep-alive GET and read the whole response; returns the status."""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            await reader.readexactly(int(line.split(b":")[1]))
+    return status
+
+
+async def connection(port: int, deadline: float, latencies: list[float]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if await request(reader, writer, PATH) != 200:
+                raise RuntimeError("unexpected response status")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+def client(port: int, connections: int, duration: float) -> list[float]:
+    """Load the server from this process; returns the request latencies."""
+    latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def run() -> None:
+        await asyncio.gather(
+            *(connection(port, deadline, latencies) for _ in range(connections))
+        )
+
+    asyncio.run(run())
+    return latencies
+
+
+async def wait_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            status = await request(reader, writer, READY)
+            writer.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.2)
+    raise TimeoutError("server did not become ready")
+
+
+def measure(workers: int, args: argparse.Namespace) -> None:
+    command = [
+        *(sys.executable, "-m", "fastup.serve", "--port", str(args.port)),
+        *("--workers", str(workers)),
+        "--reuse-port" if args.reuse_port else "--no-reuse-port",
+    ]
+    server = subprocess.Popen(
+        command,
+        env=os.environ | {"FASTUP_SERVER_ACCESS_LOG": "false"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        asyncio.run(wait_ready(args.port))
+        with multiprocessing.Pool(args.clients) as pool:
+            results = pool.starmap(
+                client, [(args.port, args.connections, args.duration)] * args.clients
+            )
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+    latencies = sorted(latency for result in results for latency in result)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"workers {workers:>2}: {len(latencies) / args.duration:>8.0f} req/s  "
+        f"p50 {quantiles[49] * 1e3:6.2f} ms  p99 {quantiles[98] * 1e3:6.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Throughput of fastup.serve with one worker versus several."
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--clients", type=int, default=2)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--reuse-port", action="store_true")
+    args = parser.parse_args()
+    for workers in args.workers:
+        measure(workers, args)
@@ -0,0 +1,115 @@
+"""Cold start of the API process: eager versus lazy handler registration.
+
+Each run starts a fresh interpreter that imports `fastup.api.app`, runs the
+app's lifespan (bootstrap and bus start) and serves one `POST /otps` through
+an in-process ASGI client. It reports the median of `--runs` runs of:
+
+- import: importing the app module and everything it pulls in;
+- startup: the lifespan startup, i.e. `abootstrap()`, warm-up included, and
+  `bus.start()`;
+- first request: the first command, including importing its handlers when
+  they are lazy;
+- total: the sum of the above, leaving out the benchmark's own database setup.
+
+Usage (against the dev Postgres and Redis, after `make pgup migrate`)::
+
+    uv run python -m benchmarks.bench_startup --runs 10
+
+or, without Postgres::
+
+    uv run python -m benchmarks.bench_startup \\
+        --db-url sqlite+aiosqlite:///.cache/bench.db --create-tables
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+STEPS = ("import", "startup", "first request", "total")
+
+
+async def measure(db_url: str | None, create_tables: bool) -> dict[str, float]:
+    """Time the cold start of this interpreter, which must be a fresh one."""
+    start = time.perf_counter()
+    from fastup.api import app
+
+    imported = time.perf_counter()
+
+    import httpx
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from fastup.infra import db
+
+    if db_url:
+        engine = create_async_engine(db_url)
+        db.get_sessionmaker().configure(bind=engine)
+        if create_tables:
+            from fastup.infra.orm_mapper import start_orm_mapper
+
+            start_orm_mapper()
+            async with engine.begin() as conn:
+                await conn.run_sync(db.mapper_registry.metadata.create_all)
+            from sqlalchemy.orm import clear_mappers
+
+            clear_mappers()
+
+    before_startup = time.perf_counter()
+    async with app.app.router.lifespan_context(app.app):
+        started = time.perf_counter()
+        transport = httpx.ASGITransport(app=app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://b") as c:
+            phone = f"+98912{random.randrange(10**7):07}"
+            response = await c.post(
+                "/api/v1/fastup/otps", json={"phone": phone, "intent": "sign_up"}
+            )
+        served = time.perf_counter()
+    response.raise_for_status()
+
+    return {
+        "import": imported - start,
+        "startup": started - before_startup,
+        "first request": served - started,
+        "total": (served - started) + (started - before_startup) + (imported - start),
+    }
+
+
+def run_child(lazy: bool, args: argparse.Namespace) -> dict[str, float]:
+    command = [sys.executable, "-m", "benchmarks.bench_startup", "--child"]
+    if args.db_url:
+        command += ["--db-url", args.db_url]
+    if args.create_tables:
+        command.append("--create-tables")
+    env = os.environ | {"FASTUP_LAZY_HANDLERS": str(lazy).lower()}
+    output = subprocess.run(
+        command, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(args: argparse.Namespace) -> None:
+    for lazy in (False, True):
+        runs = [run_child(lazy, args) for _ in range(args.runs)]
+        medians = {step: statistics.median(r[step] for r in runs) for step in STEPS}
+        cells = "  ".join(f"{step} {medians[step] * 1e3:7.1f} ms" for step in STEPS)
+        print(f"{'lazy' if lazy else 'eager':<6} {cells}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Cold start: eager versus lazy handler registration."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--db-url", default=None)
+    parser.add_argument("--create-tables", action="store_true")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(asyncio.run(measure(args.db_url, args.create_tables))))
+    else:
+        main(args)
@@ -5,10 +5,12 @@ from contextlib import asynccontextmanager
 import fastapi
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import clear_mappers
 
-from fastup.bootstrap import bootstrap
+from fastup.bootstrap import abootstrap
 from fastup.core.exceptions import BaseExc
+from fastup.core.metrics import REGISTRY
 from fastup.infra.pydantic_config import get_config
 
 from .v1.exc_handlers import core_exception_handler, http_validation_exception_handler
@@ -21,10 +23,24 @@ config = get_config()
 
 @asynccontextmanager
 async def lifespan(app: fastapi.FastAPI) -> typing.AsyncGenerator[None, None]:
-    """Manage application lifespan events."""
+    """Manage application lifespan events.
+
+    The app reports ready (see `GET /ready`) once the bus is started and the
+    connections and hashers are warmed up, until shutdown begins. A launcher
+    may set `app.state.config` to give this process its own settings, e.g. the
+    Snowflake worker ID of a server worker; it defaults to the process-wide
+    configuration and applies to both startup and shutdown.
+    """
+    app.state.ready = False
+    if getattr(app.state, "config", None) is None:
+        app.state.config = config
     try:
-        app.state.bus = bootstrap()
+        app.state.bus = await abootstrap(app.state.config)
+        await app.state.bus.start()
+        app.state.ready = True
         yield
+        app.state.ready = False
+        await app.state.bus.stop(timeout=app.state.config.event_drain_timeout_sec)
 
     except RuntimeError as e:
         logger.error(f"Application failed to start: {e}")
@@ -53,3 +69,13 @@ app.include_router(router, prefix="/api/v1/fastup")
 
 app.add_exception_handler(BaseExc, core_exception_handler)  # type: ignore
 app.add_exception_handler(RequestValidationError, http_validation_exception_handler)  # type: ignore
+
+
+if config.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        """Expose the default metrics registry in the Prometheus text format."""
+        return PlainTextResponse(
+            REGISTRY.render(), media_type="text/plain; version=0.0.4"
+        )
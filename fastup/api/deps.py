@@ -1,10 +1,10 @@
 import functools
 import logging
-from typing import Annotated
+from typing import Annotated, AsyncGenerator
 
 from fastapi import Depends, HTTPException, Request
 
-from fastup.core.bus import MessageBus
+from fastup.core.bus import MessageBus, request_scope
 from fastup.infra.pydantic_config import PydanticConfig, get_config
 from fastup.infra.pyjwt_service import PyJWTService
 
@@ -17,9 +17,14 @@ def get_ipaddr(request: Request) -> str:
     return request.client.host
 
 
-def get_bus(request: Request) -> MessageBus:
-    """Dependency to get the message bus from the application state."""
-    return request.app.state.bus
+async def get_bus(request: Request) -> AsyncGenerator[MessageBus, None]:
+    """Dependency to get the message bus from the application state.
+
+    Opens a request scope so REQUEST-scoped dependencies are shared by every
+    command handled while serving this request.
+    """
+    async with request_scope():
+        yield request.app.state.bus
 
 
 @functools.cache
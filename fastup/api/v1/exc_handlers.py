@@ -1,4 +1,5 @@
 import logging
+import typing
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
@@ -13,6 +14,10 @@ exc_map = {
     exceptions.ConflictExc: status.HTTP_409_CONFLICT,
     exceptions.AccessDeniedExc: status.HTTP_403_FORBIDDEN,
     exceptions.AttemptLimitReached: status.HTTP_429_TOO_MANY_REQUESTS,
+    exceptions.TooManyRequestsExc: status.HTTP_429_TOO_MANY_REQUESTS,
+    exceptions.ServiceUnavailableExc: status.HTTP_503_SERVICE_UNAVAILABLE,
+    exceptions.OverloadedExc: status.HTTP_503_SERVICE_UNAVAILABLE,
+    exceptions.DeadlineExceeded: status.HTTP_504_GATEWAY_TIMEOUT,
 }
 
 
@@ -24,19 +29,41 @@ async def core_exception_handler(
     This function maps domain exception types to HTTP status codes, providing a
     central point of control for handling business logic errors.
     """
-    exc_type = type(exc)
-    status_code = exc_map.get(exc_type)
-    if status_code is None:
-        logger.critical(f"Unmapped domain exception caught: {exc_type.__name__}")
-        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    if type(exc) not in exc_map:
+        logger.critical(f"Unmapped domain exception caught: {type(exc).__name__}")
+    return JSONResponse(status_code=error_status(exc), content=error_content(exc))
 
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "errors": [exc.message],
-            "extra": [exc.extra] if exc.extra else [],
-        },
-    )
+
+def error_status(exc: Exception) -> int:
+    """Map an exception to its HTTP status code, 500 when it is not mapped."""
+    return exc_map.get(type(exc), status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def log_unmapped(excs: typing.Iterable[Exception]) -> None:
+    """Log the exceptions answered with 500 by `error_status`, in one record.
+
+    Used where one request reports many errors, such as a batch.
+    """
+    unmapped = [exc for exc in excs if type(exc) not in exc_map]
+    if unmapped:
+        names = ", ".join(sorted({type(exc).__name__ for exc in unmapped}))
+        logger.error(
+            f"{len(unmapped)} unmapped exceptions caught: {names}",
+            exc_info=unmapped[0],
+        )
+
+
+def error_content(exc: Exception) -> dict:
+    """Build the standard error body for an exception.
+
+    Messages of non-domain exceptions are never exposed.
+    """
+    if not isinstance(exc, exceptions.BaseExc):
+        exc = exceptions.InternalExc()
+    return {
+        "errors": [exc.message],
+        "extra": [exc.extra] if exc.extra else [],
+    }
 
 
 def http_validation_exception_handler(
@@ -15,6 +15,10 @@ class IssueOtpReq(pydantic.BaseModel):
     intent: enums.OtpIntent
 
 
+class IssueOtpBatchReq(pydantic.BaseModel):
+    items: list[IssueOtpReq] = pydantic.Field(min_length=1, max_length=1000)
+
+
 class SignUpReq(pydantic.BaseModel):
     otp_code: int
     sex: enums.UserSex
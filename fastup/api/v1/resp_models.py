@@ -15,6 +15,17 @@ class OtpResp(pydantic.BaseModel):
     expires_at: datetime.datetime
 
 
+class OtpBatchItemResp(pydantic.BaseModel):
+    status: int
+    otp: OtpResp | None = None
+    errors: list[str] = []
+    extra: list[dict] = []
+
+
+class OtpBatchResp(pydantic.BaseModel):
+    results: list[OtpBatchItemResp]
+
+
 class TokenResp(pydantic.BaseModel):
     raw: str
     exp: datetime.datetime
@@ -1,5 +1,6 @@
 from typing import Annotated
 
+from fastapi import Request
 from fastapi.params import Depends
 from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRouter
@@ -7,7 +8,9 @@ from redis.asyncio.client import Redis
 
 from fastup.api import deps
 from fastup.api.v1 import req_models, resp_models, views
+from fastup.api.v1.exc_handlers import error_content, error_status, log_unmapped
 from fastup.core import commands, entities, enums
+from fastup.core.exceptions import ServiceUnavailableExc
 from fastup.core.bus import MessageBus
 from fastup.infra.pydantic_config import PydanticConfig, get_config
 from fastup.infra.pyjwt_service import PyJWTService
@@ -22,6 +25,14 @@ async def health():
     return {"status": "ok"}
 
 
+@router.get("/ready", status_code=200, response_model=resp_models.HealthResp)
+async def ready(request: Request):
+    """Readiness check, failing with 503 until startup and warm-up are done."""
+    if not getattr(request.app.state, "ready", False):
+        raise ServiceUnavailableExc("The service is not ready.")
+    return {"status": "ready"}
+
+
 @router.post("/otps", status_code=202, response_model=resp_models.OtpResp)
 async def issue_otp(
     data: req_models.IssueOtpReq,
@@ -41,6 +52,35 @@ async def issue_otp(
     return otp
 
 
+@router.post("/otps:batch", status_code=207, response_model=resp_models.OtpBatchResp)
+async def issue_otp_batch(
+    data: req_models.IssueOtpBatchReq,
+    ipaddr: Annotated[str, Depends(deps.get_ipaddr)],
+    bus: Annotated[MessageBus, Depends(deps.get_bus)],
+):
+    """Issue OTPs for many phone numbers at once.
+
+    All OTPs are created in a single transaction. Each item of the response
+    reports the status of the matching request item: 202 with the OTP, or the
+    error status and messages when that item failed.
+    """
+    # only signup OTPs exist so far; other intents are rejected by pydantic
+    cmds = [
+        commands.IssueSignupOtpCommand(phone=item.phone, ipaddr=ipaddr)
+        for item in data.items
+    ]
+    results = await bus.handle_many(cmds)
+    log_unmapped(result for result in results if isinstance(result, Exception))
+    return {
+        "results": [
+            {"status": error_status(result), **error_content(result)}
+            if isinstance(result, Exception)
+            else {"status": 202, "otp": result}
+            for result in results
+        ]
+    }
+
+
 @router.post("/accounts/signup", status_code=201, response_model=resp_models.TokenResp)
 async def signup_user(
     data: req_models.SignUpReq,
@@ -1,39 +1,65 @@
 import asyncio
+import concurrent.futures
+import functools
+import logging
+import multiprocessing
+import time
+import typing
 
 from fastup.core import bus
+from fastup.core.config import Config
+from fastup.core.services import HashService, IDGenerator, Publisher, SMSService
+from fastup.core.unit_of_work import UnitOfWork, UnitOfWorkFactory
 from fastup.infra.hash_services import Argon2PasswordHasher, HMACHasher
+from fastup.infra import db, warmup
 from fastup.infra.local_sms_service import LocalSMSService
 from fastup.infra.orm_mapper import start_orm_mapper
 from fastup.infra.pydantic_config import PydanticConfig, get_config
 from fastup.infra.redis_client import redis_client_provider
 from fastup.infra.redis_publisher import RedisPublisher
+from fastup.infra.redis_stream_transport import RedisStreamTransport
 from fastup.infra.snowflake_idgen import SnowflakeIDGenerator
 from fastup.infra.sql_unit_of_work import SQLUnitOfwWork
 
+logger = logging.getLogger(__name__)
+
 
 def bootstrap(
     config: PydanticConfig | None = None, start_orm: bool = True
 ) -> bus.MessageBus:
     """Build the application's MessageBus.
 
-    The handlers signatures are inspected and dependencies are injected,
-    so they must have type hints for all their parameters.
+    The handlers signatures are inspected and dependencies are injected by
+    type, so they must have type hints for all their parameters; the two hash
+    services are told apart by their "hmac" and "argon2" qualifiers.
 
     :param config: Application configuration object.
     :param start_orm: Whether ORM mappings should be initialized before wiring.
     :return: A fully configured :class:`MessageBus` with injected handlers.
-    :raises RuntimeError: If dependency injection fails (missing deps for a handler).
+    :raises RuntimeError: If dependency injection fails (missing deps for a handler),
+        or if events leave the process without a configured `hmac_secret_key`.
     """
 
-    # intentional side-effect import
-    #
-    # Ensures all handler modules load and register themselves in the registry.
-    # `handlers/__init__.py` must import each handler;
-    # Without this import, no handlers get registered at runtime.
-    from fastup.core import handlers  # noqa: F401
+    from fastup.core import handlers
 
     config = config or get_config()
 
+    # OTP codes are derived with the HMAC key, again by whichever process sends
+    # them, so a key drawn at random in each process would send wrong codes
+    if (
+        config.outbox_enabled or config.event_stream_enabled
+    ) and "hmac_secret_key" not in config.model_fields_set:
+        raise RuntimeError(
+            "hmac_secret_key must be set when events are handled by other "
+            "processes (outbox_enabled or event_stream_enabled)."
+        )
+
+    # Handler modules register themselves in the registry when imported; every
+    # module must be listed in `handlers.MANIFEST`. Loading them all up front
+    # makes missing dependencies fail here rather than on first dispatch.
+    if not config.lazy_handlers:
+        handlers.load_all()
+
     if start_orm:
         start_orm_mapper()
 
@@ -41,30 +67,246 @@ def bootstrap(
 
     redis = redis_client_provider()
 
-    deps = {
-        "config": config or get_config(),
-        "uow": SQLUnitOfwWork(),
-        "idgen": SnowflakeIDGenerator(),
-        "hmac_hasher": HMACHasher(),
-        "argon2_hasher": Argon2PasswordHasher(),
-        "sms_service": LocalSMSService(),
-        "event_queue": queue,
-        "publisher": RedisPublisher(redis),
-    }
+    metrics = bus.MetricsMiddleware() if config.metrics_enabled else None
+    executors = build_executors(config, metrics)
+
+    container = bus.Container()
+    container.bind(Config, config)
+    uow_factory = functools.partial(SQLUnitOfwWork, use_outbox=config.outbox_enabled)
+    container.bind(UnitOfWork, bus.Provider(uow_factory, scope=bus.Scope.COMMAND))
+    container.bind(UnitOfWorkFactory, uow_factory)
+    container.bind(
+        IDGenerator,
+        SnowflakeIDGenerator(
+            epoch=config.snowflake_epoch,
+            node_id=config.snowflake_node_id,
+            worker_id=config.snowflake_worker_id,
+        ),
+    )
+    container.bind(HashService, HMACHasher(config.hmac_secret_key), qualifier="hmac")
+    container.bind(
+        HashService,
+        Argon2PasswordHasher(
+            admission=(
+                bus.AdmissionController(
+                    "argon2",
+                    limit=config.hash_concurrency_limit,
+                    max_queue=config.hash_max_queue,
+                    max_wait=config.hash_max_queue_wait_sec,
+                )
+                if config.hash_concurrency_limit > 0
+                else None
+            ),
+            time_cost=config.argon2_time_cost,
+            memory_cost=config.argon2_memory_cost_kib,
+            parallelism=config.argon2_parallelism,
+        ),
+        qualifier="argon2",
+    )
+    container.bind(SMSService, LocalSMSService(timeout=config.sms_timeout_sec))
+    container.bind(asyncio.Queue, bus.Provider(bus.current_event_queue))
+    container.bind(Publisher, RedisPublisher(redis))
 
     try:
         message_bus = bus.MessageBus(
             event_handlers={
-                ev: [bus.inject_dependencies(h, deps) for h in handlers]
+                ev: [container.inject(h) for h in handlers]
                 for ev, handlers in bus.EVENT_HANDLERS.items()
             },
             command_handlers={
-                cmd: bus.inject_dependencies(h, deps)
-                for cmd, h in bus.COMMAND_HANDLERS.items()
+                cmd: container.inject(h) for cmd, h in bus.COMMAND_HANDLERS.items()
+            },
+            batch_command_handlers={
+                cmd: container.inject(h)
+                for cmd, h in bus.BATCH_COMMAND_HANDLERS.items()
             },
             queue=queue,
+            concurrent_fanout=config.event_concurrent_fanout,
+            dead_letters=(
+                bus.DeadLetterStore(SQLUnitOfwWork)
+                if config.dead_letters_enabled
+                else None
+            ),
+            middleware=[metrics] if metrics else [],
+            dedupe_window=config.command_dedupe_window_sec,
+            command_timeout=config.command_timeout_sec,
+            partition_keys=dict(bus.EVENT_PARTITION_KEYS),
+            executors=executors,
+            loader=(
+                bus.HandlerLoader(handlers.MANIFEST, container.inject)
+                if config.lazy_handlers
+                else None
+            ),
+            container=container,
         )
     except RuntimeError as e:
         raise e
 
+    if config.event_stream_enabled:
+        message_bus.dispatcher = RedisStreamTransport(
+            redis,
+            stream=config.event_stream_name,
+            group=config.event_stream_group,
+            maxlen=config.event_stream_maxlen,
+        )
+    elif config.event_workers > 0 and config.event_partitioned:
+        message_bus.dispatcher = bus.PartitionedDispatcher(
+            dispatch=message_bus.dispatch,
+            partition_key=message_bus.partition_key,
+            workers=config.event_workers,
+            maxsize=config.event_queue_maxsize,
+        )
+    elif config.event_workers > 0:
+        message_bus.dispatcher = bus.BackgroundDispatcher(
+            dispatch=message_bus.dispatch,
+            workers=config.event_workers,
+            maxsize=config.event_queue_maxsize,
+            high_watermark=config.event_queue_high_watermark,
+            low_watermark=config.event_queue_low_watermark,
+            priority=message_bus.event_priority,
+            lane_weights={
+                bus.Priority[lane.upper()]: weight
+                for lane, weight in config.event_lane_weights.items()
+            },
+            on_wait=metrics.observe_lane_wait if metrics else None,
+        )
+
+    if metrics:
+        metrics.observe_queues(message_bus.queue_depths)
+        metrics.observe_executors(executors.values())
+        if isinstance(message_bus.dispatcher, bus.BackgroundDispatcher):
+            dispatcher = message_bus.dispatcher
+            metrics.observe_lanes(lambda: dispatcher.stats().lanes)
+
+    return message_bus
+
+
+def build_executors(
+    config: PydanticConfig, metrics: bus.MetricsMiddleware | None = None
+) -> dict[bus.ExecutionPolicy, bus.OffloadExecutor]:
+    """Build the executors backing the THREAD and PROCESS execution policies.
+
+    Pools start their workers lazily, on the first offloaded call.
+
+    :param config: Application configuration object.
+    :param metrics: Records the queue wait of offloaded calls, when given.
+    :return: Executor by policy; a policy configured with 0 workers is left out.
+    """
+    on_wait = metrics.observe_executor_wait if metrics else None
+    executors: dict[bus.ExecutionPolicy, bus.OffloadExecutor] = {}
+    if (workers := config.thread_executor_workers) > 0:
+        executors[bus.ExecutionPolicy.THREAD] = bus.OffloadExecutor(
+            "thread",
+            concurrent.futures.ThreadPoolExecutor(
+                workers, thread_name_prefix="fastup-offload"
+            ),
+            workers,
+            on_wait,
+        )
+    if (workers := config.process_executor_workers) > 0:
+        use_threads = config.process_executor_use_threads
+        if use_threads is None:
+            use_threads = not bus.gil_enabled()
+        executors[bus.ExecutionPolicy.PROCESS] = bus.OffloadExecutor(
+            "process",
+            concurrent.futures.ThreadPoolExecutor(
+                workers, thread_name_prefix="fastup-cpu"
+            )
+            if use_threads
+            else concurrent.futures.ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("forkserver")
+            ),
+            workers,
+            on_wait,
+            max_in_flight=config.process_executor_max_in_flight,
+        )
+    return executors
+
+
+async def abootstrap(
+    config: PydanticConfig | None = None, start_orm: bool = True
+) -> bus.MessageBus:
+    """Build the MessageBus and warm the process up, concurrently.
+
+    While :func:`bootstrap` runs in a thread, `config.warmup_db_connections`
+    database connections are opened with the hot statements prepared on each,
+    `config.warmup_redis_connections` Redis connections are opened. Once built,
+    the bus's hashers hash once, which starts the workers of the Argon2 pool,
+    so the first requests find everything ready. Each step
+    is logged with its duration. A failing or timed out warm-up step is only
+    logged, as the app still works without it.
+
+    :param config: Application configuration object.
+    :param start_orm: Whether ORM mappings should be initialized before wiring.
+    :return: A fully configured :class:`MessageBus` with injected handlers.
+    :raises RuntimeError: If dependency injection fails (missing deps for a handler).
+    """
+    config = config or get_config()
+    start = time.perf_counter()
+
+    # the statements prepared by the database warm-up need the mappings
+    if start_orm:
+        await _timed("orm", asyncio.to_thread(start_orm_mapper))
+
+    async def build() -> bus.MessageBus | None:
+        message_bus = await _timed("bus", asyncio.to_thread(bootstrap, config, False))
+        if config.warmup_hashers and message_bus and message_bus.container:
+            await _timed(
+                "hashers",
+                warmup.warm_hashers(
+                    message_bus.container.resolve(HashService, "hmac"),
+                    message_bus.container.resolve(HashService, "argon2"),
+                    message_bus.executors.get(bus.ExecutionPolicy.PROCESS),
+                ),
+                config.warmup_timeout_sec,
+                required=False,
+            )
+        return message_bus
+
+    warmups = {}
+    if config.warmup_db_connections > 0:
+        warmups["database"] = warmup.warm_database(
+            db.get_sessionmaker(), config.warmup_db_connections
+        )
+    if config.warmup_redis_connections > 0:
+        warmups["redis"] = warmup.warm_redis(
+            redis_client_provider(), config.warmup_redis_connections
+        )
+
+    message_bus, *_ = await asyncio.gather(
+        build(),
+        *(
+            _timed(name, step, config.warmup_timeout_sec, required=False)
+            for name, step in warmups.items()
+        ),
+    )
+    logger.info(f"Startup finished in {(time.perf_counter() - start) * 1e3:.1f} ms")
+    assert message_bus is not None  # a failing required step raises
     return message_bus
+
+
+async def _timed[T](
+    name: str,
+    step: typing.Awaitable[T],
+    timeout: float | None = None,
+    required: bool = True,
+) -> T | None:
+    """Await a startup step, logging how long it took.
+
+    :raises Exception: What a required step raised; others are logged only.
+    """
+    start = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            result = await step
+    except Exception as e:
+        elapsed = (time.perf_counter() - start) * 1e3
+        if required:
+            logger.error(f"Startup step {name} failed after {elapsed:.1f} ms: {e!r}")
+            raise
+        logger.warning(f"Startup step {name} failed after {elapsed:.1f} ms: {e!r}")
+        return None
+    logger.info(
+        f"Startup step {name} took {(time.perf_counter() - start) * 1e3:.1f} ms"
+    )
+    return result
@@ -0,0 +1,142 @@
+"""Pick Argon2 parameters for a target hashing latency on this machine.
+
+Usage:
+    python -m fastup.calibrate_argon2 [--target-ms MS] [--max-memory-mib MIB]
+                                      [--parallelism N] [--env-file PATH]
+
+Run it on the hardware serving the API. Memory is what makes Argon2 costly
+to attack, so the most memory allowed is kept, and halved only while a single
+pass is slower than the target; passes are then added while a hash stays
+within the target. The chosen parameters are printed as settings, or written
+to `--env-file`. Hashes stored with the previous parameters are upgraded when
+their user logs in.
+"""
+
+import argparse
+import dataclasses
+import pathlib
+import statistics
+import time
+import typing
+
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from fastup.infra.pydantic_config import get_config
+
+# OWASP's minimum memory for Argon2id
+MIN_MEMORY_COST = 19 * 1024
+MAX_TIME_COST = 16
+
+type Measure = typing.Callable[[int, int, int], float]
+
+
+@dataclasses.dataclass(frozen=True)
+class Argon2Params:
+    """Argon2 parameters and how long one hash takes with them."""
+
+    time_cost: int
+    memory_cost: int  # KiB
+    parallelism: int
+    seconds: float
+
+    def settings(self) -> dict[str, str]:
+        """Return the parameters as the environment variables of the settings."""
+        return {
+            "FASTUP_ARGON2_TIME_COST": str(self.time_cost),
+            "FASTUP_ARGON2_MEMORY_COST_KIB": str(self.memory_cost),
+            "FASTUP_ARGON2_PARALLELISM": str(self.parallelism),
+        }
+
+
+def measure(
+    time_cost: int, memory_cost: int, parallelism: int, samples: int = 3
+) -> float:
+    """Return the median seconds one hash takes with the given parameters."""
+    hasher = Argon2Hasher(
+        time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+    )
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash("calibration")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def calibrate(
+    target: float,
+    max_memory_cost: int,
+    parallelism: int,
+    measure: Measure = measure,
+) -> Argon2Params:
+    """Pick the costliest parameters hashing within `target` seconds.
+
+    The memory never goes below :data:`MIN_MEMORY_COST`, even if a hash then
+    exceeds the target; check `seconds` of the result.
+
+    :param target: Seconds one hash may take.
+    :param max_memory_cost: KiB of memory one hash may use.
+    :param parallelism: Lanes of each hash.
+    :param measure: Returns the seconds one hash takes for a time cost, memory
+        cost and parallelism.
+    """
+    memory_cost = max(max_memory_cost, MIN_MEMORY_COST)
+    seconds = measure(1, memory_cost, parallelism)
+    while seconds > target and memory_cost > MIN_MEMORY_COST:
+        memory_cost = max(memory_cost // 2, MIN_MEMORY_COST)
+        seconds = measure(1, memory_cost, parallelism)
+
+    time_cost = 1
+    while time_cost < MAX_TIME_COST:
+        slower = measure(time_cost + 1, memory_cost, parallelism)
+        if slower > target:
+            break
+        time_cost, seconds = time_cost + 1, slower
+    return Argon2Params(time_cost, memory_cost, parallelism, seconds)
+
+
+def update_env_file(path: pathlib.Path, settings: dict[str, str]) -> None:
+    """Set `settings` in a dotenv file, replacing their previous values."""
+    lines = path.read_text().splitlines() if path.exists() else []
+    pending = dict(settings)
+    for index, line in enumerate(lines):
+        name = line.split("=", 1)[0].strip().upper()
+        if "=" in line and name in pending:
+            lines[index] = f"{name}={pending.pop(name)}"
+    lines += [f"{name}={value}" for name, value in pending.items()]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def main():
+    """Entry point of the Argon2 calibration."""
+    config = get_config()
+    parser = argparse.ArgumentParser(
+        description="Pick Argon2 parameters for a target hashing latency."
+    )
+    parser.add_argument(
+        "--target-ms", type=float, default=250.0, help="latency of one hash"
+    )
+    parser.add_argument(
+        "--max-memory-mib", type=int, default=config.argon2_memory_cost_kib // 1024
+    )
+    parser.add_argument("--parallelism", type=int, default=config.argon2_parallelism)
+    parser.add_argument("--env-file", type=pathlib.Path, help="dotenv file to update")
+    args = parser.parse_args()
+
+    params = calibrate(
+        args.target_ms / 1e3, args.max_memory_mib * 1024, args.parallelism
+    )
+    print(
+        f"time_cost={params.time_cost} memory_cost={params.memory_cost} KiB"
+        f" parallelism={params.parallelism}: {params.seconds * 1e3:.0f} ms per hash"
+    )
+    if args.env_file:
+        update_env_file(args.env_file, params.settings())
+        print(f"Updated {args.env_file}")
+    else:
+        for name, value in params.settings().items():
+            print(f"{name}={value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,95 @@
-from .injector import inject_dependencies
+from .admission import AdmissionController, AdmissionStats
+from .background import drain_detached, run_detached
+from .collector import collect_events, current_event_queue, drain_collected_events
+from .dead_letters import DeadLetterSink, DeadLetterStore
+from .deadline import current_deadline, deadline_scope, time_left
+from .dispatcher import BackgroundDispatcher, DispatcherStats, EventSink
+from .executors import (
+    ExecutionPolicy,
+    ExecutorStats,
+    OffloadExecutor,
+    bind_executor,
+    bound_executor,
+    gil_enabled,
+    offload,
+)
+from .injector import Container, Provider, Scope, inject_dependencies, request_scope
+from .lanes import LaneQueue, Priority
+from .lazy import HandlerLoader, LoadedHandlers
 from .message_bus import MessageBus
+from .middleware import MetricsMiddleware, Middleware
+from .outbox_relay import OutboxRelay
+from .partitioned import PartitionedDispatcher
 from .registry import (
+    BATCH_COMMAND_HANDLERS,
     COMMAND_HANDLERS,
     EVENT_HANDLERS,
+    EVENT_PARTITION_KEYS,
+    CommandHandlerOptions,
+    EventHandlerOptions,
     Handler,
+    command_handler_options,
+    event_handler_options,
+    handler_name,
+    register_batch_command,
     register_command,
     register_event,
+    register_partition_key,
 )
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
 
 __all__ = [
     "Handler",
     "EVENT_HANDLERS",
     "COMMAND_HANDLERS",
+    "BATCH_COMMAND_HANDLERS",
     "register_command",
+    "register_batch_command",
     "register_event",
+    "EVENT_PARTITION_KEYS",
+    "register_partition_key",
+    "CommandHandlerOptions",
+    "command_handler_options",
+    "EventHandlerOptions",
+    "event_handler_options",
+    "handler_name",
+    "RetryPolicy",
+    "Priority",
+    "AdmissionController",
+    "AdmissionStats",
+    "ExecutionPolicy",
+    "ExecutorStats",
+    "OffloadExecutor",
+    "bind_executor",
+    "bound_executor",
+    "gil_enabled",
+    "offload",
+    "run_detached",
+    "drain_detached",
+    "LaneQueue",
+    "SingleFlight",
     "inject_dependencies",
+    "Container",
+    "Provider",
+    "Scope",
+    "request_scope",
     "MessageBus",
+    "HandlerLoader",
+    "LoadedHandlers",
+    "Middleware",
+    "MetricsMiddleware",
+    "BackgroundDispatcher",
+    "DispatcherStats",
+    "PartitionedDispatcher",
+    "EventSink",
+    "OutboxRelay",
+    "DeadLetterSink",
+    "DeadLetterStore",
+    "collect_events",
+    "current_event_queue",
+    "drain_collected_events",
+    "deadline_scope",
+    "current_deadline",
+    "time_left",
 ]
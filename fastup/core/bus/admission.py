@@ -0,0 +1,132 @@
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import typing
+
+from fastup.core.exceptions import OverloadedExc, TooManyRequestsExc
+
+
+@dataclasses.dataclass(frozen=True)
+class AdmissionStats:
+    """Point-in-time snapshot of an :class:`AdmissionController`."""
+
+    name: str
+    running: int
+    queued: int
+    admitted: int
+    rejected: int
+    timed_out: int
+
+
+class AdmissionController:
+    """Bounds the concurrency of expensive work, shedding what would wait too long.
+
+    At most `limit` slots are held at once and callers wanting up to `max_queue`
+    more wait for them, in arrival order. A caller usually takes one slot, and
+    a batch one per item. A caller finding the queue full is rejected right
+    away with :class:`TooManyRequestsExc`, and one still waiting after
+    `max_wait` seconds gives up with :class:`OverloadedExc`, so a burst fails
+    fast instead of slowing every request down until they all time out.
+    """
+
+    def __init__(
+        self, name: str, limit: int, max_queue: int, max_wait: float | None = None
+    ) -> None:
+        """Initialize the controller.
+
+        :param name: Identifies the controller in stats.
+        :param limit: Slots held at once.
+        :param max_queue: Slots callers may wait for; 0 rejects every caller
+            arriving while too few slots are free.
+        :param max_wait: Seconds a caller may wait for a slot; unbounded when None.
+        :raises ValueError: If the limit is not positive or a bound is negative.
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive.")
+        if max_queue < 0 or (max_wait is not None and max_wait < 0):
+            raise ValueError("max_queue and max_wait must not be negative.")
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._running = 0
+        self._queued = 0
+        self._waiters: collections.deque[tuple[asyncio.Future[None], int]] = (
+            collections.deque()
+        )
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    @contextlib.asynccontextmanager
+    async def admit(self, weight: int = 1) -> typing.AsyncIterator[None]:
+        """Hold `weight` slots for the duration of the block.
+
+        :param weight: Slots taken, e.g. the size of a batch; at most `limit`
+            are, so that a large batch can still be admitted.
+        :raises TooManyRequestsExc: If the queue is full.
+        :raises OverloadedExc: If no slot was free within `max_wait` seconds.
+        """
+        weight = min(max(weight, 1), self.limit)
+        await self._acquire(weight)
+        try:
+            yield
+        finally:
+            self._release(weight)
+
+    def stats(self) -> AdmissionStats:
+        """Return a snapshot of the slots held and waited for."""
+        return AdmissionStats(
+            name=self.name,
+            running=self._running,
+            queued=self._queued,
+            admitted=self._admitted,
+            rejected=self._rejected,
+            timed_out=self._timed_out,
+        )
+
+    async def _acquire(self, weight: int) -> None:
+        if self._running + weight <= self.limit and not self._waiters:
+            self._running += weight
+            self._admitted += 1
+            return
+        if self._queued + weight > self.max_queue:
+            self._rejected += 1
+            raise TooManyRequestsExc
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (waiter, weight)
+        self._waiters.append(entry)
+        self._queued += weight
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await waiter
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                self._release(weight)  # handed its slots just as it gave up
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                self._queued -= weight
+                self._wake()  # the callers behind it may fit now
+            if isinstance(e, TimeoutError):
+                self._timed_out += 1
+                raise OverloadedExc from None
+            raise
+        self._admitted += 1
+
+    def _release(self, weight: int) -> None:
+        """Free slots, handing them to the oldest waiters they are enough for."""
+        self._running -= weight
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            waiter, weight = self._waiters[0]
+            if not waiter.done() and self._running + weight > self.limit:
+                return
+            self._waiters.popleft()
+            self._queued -= weight
+            if not waiter.done():
+                self._running += weight
+                waiter.set_result(None)
@@ -0,0 +1,42 @@
+import asyncio
+import contextvars
+import logging
+import typing
+
+logger = logging.getLogger(__name__)
+
+_tasks: set[asyncio.Task] = set()
+
+
+def run_detached(coro: typing.Coroutine[typing.Any, typing.Any, None]) -> asyncio.Task:
+    """Run `coro` in a task outliving the handler that started it.
+
+    The task runs in an empty context, so the deadline and the event queue of
+    the current command do not apply to it. A reference is kept until it is
+    done, and its failure is logged, as nobody awaits it.
+    """
+    task = asyncio.get_running_loop().create_task(coro, context=contextvars.Context())
+    _tasks.add(task)
+    task.add_done_callback(_finished)
+    return task
+
+
+async def drain_detached(timeout: float | None = None) -> None:
+    """Wait for the running detached tasks, cancelling those left after `timeout`.
+
+    :param timeout: Maximum seconds to wait; unbounded when None.
+    """
+    if not _tasks:
+        return
+    _, pending = await asyncio.wait(set(_tasks), timeout=timeout)
+    if pending:
+        logger.warning(f"Cancelling {len(pending)} detached tasks still running")
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _finished(task: asyncio.Task) -> None:
+    _tasks.discard(task)
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.error(f"Detached task {task.get_name()} failed: {exc!r}")
@@ -0,0 +1,58 @@
+import asyncio
+import contextlib
+import contextvars
+import typing
+
+from fastup.core.events import Event
+
+_current_queue: contextvars.ContextVar[asyncio.Queue[Event] | None] = (
+    contextvars.ContextVar("fastup_event_queue", default=None)
+)
+
+
+@contextlib.contextmanager
+def collect_events(
+    queue: asyncio.Queue[Event] | None = None,
+) -> typing.Iterator[asyncio.Queue[Event]]:
+    """Bind an event queue to the current context.
+
+    Handlers running inside the block put their events on the bound queue, so
+    each command invocation only sees the events it raised itself.
+
+    :param queue: Queue to bind; a fresh one is created when omitted.
+    :return: The bound queue.
+    """
+    queue = queue if queue is not None else asyncio.Queue()
+    token = _current_queue.set(queue)
+    try:
+        yield queue
+    finally:
+        _current_queue.reset(token)
+
+
+def current_event_queue() -> asyncio.Queue[Event]:
+    """Return the event queue bound to the current context.
+
+    Meant to be registered as a COMMAND-scoped provider for handlers that
+    raise events.
+
+    :raises RuntimeError: If called outside of `collect_events()`.
+    """
+    queue = _current_queue.get()
+    if queue is None:
+        raise RuntimeError("No event queue bound to the current context.")
+    return queue
+
+
+def drain_collected_events() -> list[Event]:
+    """Remove and return the events collected so far in the current context.
+
+    Used by transactional outboxes to persist events in the same transaction as
+    the state change that raised them; returns an empty list outside of
+    `collect_events()`.
+    """
+    queue = _current_queue.get()
+    events: list[Event] = []
+    while queue is not None and not queue.empty():
+        events.append(queue.get_nowait())
+    return events
@@ -0,0 +1,88 @@
+import logging
+import typing
+
+from fastup.core.events import Event
+from fastup.core.repositories import DeadLetter
+from fastup.core.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class DeadLetterSink(typing.Protocol):
+    """Destination for events whose handler failed for good."""
+
+    async def add(
+        self, event: Event, handler: str, error: BaseException, attempts: int
+    ) -> None: ...
+
+
+class DeadLetterStore:
+    """Persists events a handler gave up on and replays them on demand."""
+
+    def __init__(self, uow_factory: typing.Callable[[], UnitOfWork]) -> None:
+        """Initialize the store.
+
+        :param uow_factory: Builds a unit of work for each operation.
+        """
+        self._uow_factory = uow_factory
+
+    async def add(
+        self, event: Event, handler: str, error: BaseException, attempts: int
+    ) -> None:
+        """Store a failed delivery in its own transaction."""
+        async with self._uow_factory() as uow:
+            await uow.dead_letters.add(event, handler, _describe(error), attempts)
+            await uow.commit()
+        logger.warning(f"Dead-lettered {event.name=} for {handler} after {attempts=}")
+
+    async def list(
+        self, limit: int = 100, ids: typing.Sequence[int] | None = None
+    ) -> list[DeadLetter]:
+        """Return up to `limit` dead letters, oldest first."""
+        async with self._uow_factory() as uow:
+            return await uow.dead_letters.fetch(limit, ids)
+
+    async def replay(
+        self,
+        redeliver: typing.Callable[[Event, str], typing.Awaitable[None]],
+        limit: int = 100,
+        ids: typing.Sequence[int] | None = None,
+    ) -> tuple[int, int]:
+        """Redeliver dead letters to the handler that failed them, oldest first.
+
+        Replayed letters are deleted; letters failing again are kept with their
+        attempt count incremented, and undecodable ones are left untouched.
+
+        :param redeliver: Coroutine function running one named handler for an
+            event and raising on failure (e.g. `MessageBus.redeliver`).
+        :param limit: Maximum number of letters to replay.
+        :param ids: Replay only these letters when given.
+        :return: The number of replayed and of failed letters.
+        """
+        async with self._uow_factory() as uow:
+            letters = await uow.dead_letters.fetch(limit, ids)
+            replayed: list[int] = []
+            failed = 0
+            for letter in letters:
+                try:
+                    event = Event.from_payload(letter.event_type, letter.payload)
+                except (LookupError, TypeError) as exc:
+                    logger.error(f"Skipping undecodable dead letter {letter.id}: {exc}")
+                    failed += 1
+                    continue
+                try:
+                    await redeliver(event, letter.handler)
+                except Exception as exc:
+                    logger.error(f"Replay of dead letter {letter.id} failed: {exc}")
+                    await uow.dead_letters.record_failure(letter.id, _describe(exc))
+                    failed += 1
+                else:
+                    replayed.append(letter.id)
+
+            await uow.dead_letters.delete_many(replayed)
+            await uow.commit()
+        return len(replayed), failed
+
+
+def _describe(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
@@ -0,0 +1,45 @@
+import contextlib
+import contextvars
+import time
+import typing
+
+_current_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "fastup_deadline", default=None
+)
+
+
+@contextlib.contextmanager
+def deadline_scope(timeout: float | None) -> typing.Iterator[float | None]:
+    """Bind a deadline, `timeout` seconds from now, to the current context.
+
+    Code running inside the block, such as units of work and services, reads it
+    with :func:`time_left` to bound its own I/O. A scope never extends the
+    deadline of an enclosing one.
+
+    :param timeout: Seconds allowed for the block; only the enclosing deadline,
+        if any, applies when None.
+    :return: The deadline in effect, on the :func:`time.monotonic` clock.
+    """
+    deadline = _current_deadline.get()
+    if timeout is not None:
+        own = time.monotonic() + timeout
+        deadline = own if deadline is None else min(deadline, own)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> float | None:
+    """Return the deadline bound to the current context, if any."""
+    return _current_deadline.get()
+
+
+def time_left() -> float | None:
+    """Return the seconds left before the current deadline, None without one.
+
+    The result is negative once the deadline has passed.
+    """
+    deadline = _current_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
@@ -0,0 +1,190 @@
+import asyncio
+import dataclasses
+import logging
+import typing
+
+from fastup.core.events import Event
+
+from .lanes import DEFAULT_LANE_WEIGHTS, LaneQueue, Priority, WaitObserver
+
+logger = logging.getLogger(__name__)
+
+
+class EventSink(typing.Protocol):
+    """Destination the bus hands collected events to instead of dispatching them
+    in-process, e.g. a local worker pool or an external transport."""
+
+    @property
+    def is_running(self) -> bool: ...
+
+    def start(self) -> None: ...
+
+    async def stop(self, timeout: float | None = None) -> None: ...
+
+    async def submit(self, event: Event) -> None: ...
+
+
+@dataclasses.dataclass(frozen=True)
+class DispatcherStats:
+    """Point-in-time snapshot of a background dispatcher."""
+
+    workers: int
+    depth: int
+    max_depth: int
+    capacity: int
+    throttled: bool
+    submitted: int
+    processed: int
+    failed: int
+    throttle_waits: int
+    lanes: dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+class BackgroundDispatcher:
+    """Pool of asyncio workers consuming events from a bounded queue.
+
+    Producers are throttled once the queue depth reaches the high watermark and
+    resume only after workers drain it down to the low watermark, so a burst of
+    events slows producers down instead of growing memory unbounded.
+
+    The queue is split into priority lanes served by weighted fair scheduling
+    (see :class:`LaneQueue`), so a burst of background events cannot hold back
+    critical ones.
+    """
+
+    def __init__(
+        self,
+        dispatch: typing.Callable[[Event], typing.Awaitable[None]],
+        workers: int = 4,
+        maxsize: int = 1000,
+        high_watermark: int | None = None,
+        low_watermark: int | None = None,
+        priority: typing.Callable[[Event], Priority] | None = None,
+        lane_weights: typing.Mapping[Priority, int] = DEFAULT_LANE_WEIGHTS,
+        on_wait: WaitObserver | None = None,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        :param dispatch: Coroutine function processing a single event.
+        :param workers: Number of worker tasks.
+        :param maxsize: Hard capacity of the queue.
+        :param high_watermark: Depth at which producers start waiting (default 80%).
+        :param low_watermark: Depth at which waiting producers resume (default 20%).
+        :param priority: Returns the lane of an event, e.g.
+            :meth:`MessageBus.event_priority`; every event is NORMAL when None.
+        :param lane_weights: Share of the workers' turns of each lane.
+        :param on_wait: Called with the lane and the seconds an event waited in
+            it, whenever a worker takes one.
+        :raises ValueError: If the sizes or weights are inconsistent.
+        """
+        high = high_watermark if high_watermark is not None else maxsize * 8 // 10
+        low = low_watermark if low_watermark is not None else maxsize * 2 // 10
+        if workers < 1:
+            raise ValueError("At least one worker is required.")
+        if not 0 <= low < high <= maxsize:
+            raise ValueError("Expected 0 <= low_watermark < high_watermark <= maxsize.")
+
+        self._dispatch = dispatch
+        self._workers = workers
+        self._high = high
+        self._low = low
+        self._queue = LaneQueue(
+            priority or _normal_priority, maxsize, lane_weights, on_wait
+        )
+        self._resume = asyncio.Event()
+        self._resume.set()
+        self._tasks: list[asyncio.Task] = []
+        self._max_depth = 0
+        self._submitted = 0
+        self._processed = 0
+        self._failed = 0
+        self._throttle_waits = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker tasks are running and accepting events."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Spawn the worker tasks on the running event loop."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"event-worker-{i}")
+            for i in range(self._workers)
+        ]
+        logger.info(f"Started {self._workers} event dispatch workers")
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Stop accepting events, drain the queue and stop the workers.
+
+        :param timeout: Maximum seconds to wait for the drain; pending events are
+            dropped (and logged) once it expires.
+        """
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except TimeoutError:
+            logger.error(
+                f"Event queue drain timed out; dropping {self._queue.qsize()} events"
+            )
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Stopped event dispatch workers")
+
+    async def submit(self, event: Event) -> None:
+        """Enqueue an event, waiting while the queue is above its watermarks.
+
+        :raises RuntimeError: If the dispatcher is not running.
+        """
+        if not self.is_running:
+            raise RuntimeError("Background dispatcher is not running.")
+        if not self._resume.is_set():
+            self._throttle_waits += 1
+            await self._resume.wait()
+
+        await self._queue.put(event)
+        self._submitted += 1
+        depth = self._queue.qsize()
+        self._max_depth = max(self._max_depth, depth)
+        if depth >= self._high and self._resume.is_set():
+            logger.warning(f"Event queue reached high watermark ({depth=})")
+            self._resume.clear()
+
+    def stats(self) -> DispatcherStats:
+        """Return a snapshot of the queue depth and worker counters."""
+        return DispatcherStats(
+            workers=len(self._tasks),
+            depth=self._queue.qsize(),
+            max_depth=self._max_depth,
+            capacity=self._queue.maxsize,
+            throttled=not self._resume.is_set(),
+            submitted=self._submitted,
+            processed=self._processed,
+            failed=self._failed,
+            throttle_waits=self._throttle_waits,
+            lanes={lane.label: n for lane, n in self._queue.depths().items()},
+        )
+
+    async def _work(self) -> None:
+        """Worker loop: process events until cancelled."""
+        while True:
+            event = await self._queue.get()
+            if not self._resume.is_set() and self._queue.qsize() <= self._low:
+                logger.info("Event queue drained to low watermark")
+                self._resume.set()
+            try:
+                await self._dispatch(event)
+                self._processed += 1
+            except Exception as exc:
+                self._failed += 1
+                logger.error(f"Error dispatching event {event.name=}: {exc}")
+            finally:
+                self._queue.task_done()
+
+
+def _normal_priority(event: Event) -> Priority:
+    return Priority.NORMAL
@@ -0,0 +1,160 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import dataclasses
+import enum
+import functools
+import sys
+import time
+import typing
+
+type WaitObserver = typing.Callable[[str, float], None]
+
+
+def gil_enabled() -> bool:
+    """Whether the GIL serializes Python threads in this interpreter.
+
+    False on free-threaded builds (3.13t and later) running without it, where
+    pure-Python CPU work scales on threads as well as on processes.
+    """
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class ExecutionPolicy(enum.StrEnum):
+    """Where the blocking work of a handler, passed to :func:`offload`, runs."""
+
+    LOOP = enum.auto()  # inline, on the event loop
+    THREAD = enum.auto()  # on the thread pool, for code releasing the GIL
+    PROCESS = enum.auto()  # on the process pool, for pure-Python CPU work
+
+
+@dataclasses.dataclass(frozen=True)
+class ExecutorStats:
+    """Point-in-time snapshot of an :class:`OffloadExecutor`."""
+
+    name: str
+    workers: int
+    pending: int
+    completed: int
+    failed: int
+
+    @property
+    def saturation(self) -> float:
+        """Pending calls per worker; above 1 means calls are queueing."""
+        return self.pending / self.workers
+
+
+class OffloadExecutor:
+    """Runs blocking callables on a :mod:`concurrent.futures` executor.
+
+    Tracks the calls submitted but not finished yet, and measures how long each
+    one waited in the executor's queue before a worker picked it up. With
+    `max_in_flight`, calls beyond it wait on the event loop instead of piling up
+    in the executor's queue; that wait counts as queue time too.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        executor: concurrent.futures.Executor,
+        workers: int,
+        on_wait: WaitObserver | None = None,
+        max_in_flight: int | None = None,
+    ) -> None:
+        """Initialize the executor.
+
+        :param name: Identifies the executor in stats and metrics.
+        :param executor: Thread or process pool running the calls.
+        :param workers: Number of workers of `executor`.
+        :param on_wait: Called with the name and the seconds a call waited for a
+            worker, whenever one completes.
+        :param max_in_flight: Maximum calls handed to `executor` at once;
+            unbounded when None.
+        """
+        self.name = name
+        self.executor = executor
+        self.workers = workers
+        self.on_wait = on_wait
+        self.max_in_flight = max_in_flight
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+
+    async def run[T](self, fn: typing.Callable[..., T], *args: typing.Any) -> T:
+        """Run `fn(*args)` on the executor and return its result.
+
+        For process pools, `fn` and `args` must be picklable.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(_timed, fn, time.time())
+        self._pending += 1
+        try:
+            async with self._slots or contextlib.nullcontext():
+                started, result = await loop.run_in_executor(self.executor, call, *args)
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+        self._completed += 1
+        if self.on_wait is not None:
+            self.on_wait(self.name, started)
+        return result
+
+    def stats(self) -> ExecutorStats:
+        """Return a snapshot of the pending and completed calls."""
+        return ExecutorStats(
+            name=self.name,
+            workers=self.workers,
+            pending=self._pending,
+            completed=self._completed,
+            failed=self._failed,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the workers once the calls already submitted are done."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _timed(fn: typing.Callable, submitted_at: float, *args: typing.Any) -> tuple:
+    """Call `fn`, returning the seconds it waited for a worker with its result.
+
+    Runs in the worker; the wall clock is used as it is shared by processes.
+    """
+    waited = max(time.time() - submitted_at, 0.0)
+    return waited, fn(*args)
+
+
+_current_executor: contextvars.ContextVar[OffloadExecutor | None] = (
+    contextvars.ContextVar("fastup_executor", default=None)
+)
+
+
+@contextlib.contextmanager
+def bind_executor(executor: OffloadExecutor | None) -> typing.Iterator[None]:
+    """Make :func:`offload` use `executor` inside the block; inline when None."""
+    token = _current_executor.set(executor)
+    try:
+        yield
+    finally:
+        _current_executor.reset(token)
+
+
+def bound_executor() -> OffloadExecutor | None:
+    """Return the executor bound for the running handler; None runs inline."""
+    return _current_executor.get()
+
+
+async def offload[T](fn: typing.Callable[..., T], *args: typing.Any) -> T:
+    """Run blocking `fn(*args)` where the calling handler's policy says.
+
+    The bus binds the executor of the handler's :class:`ExecutionPolicy` while
+    it runs, so handlers stay unaware of the executors; outside of a handler,
+    or under the LOOP policy, `fn` is called inline.
+    """
+    executor = _current_executor.get()
+    if executor is None:
+        return fn(*args)
+    return await executor.run(fn, *args)
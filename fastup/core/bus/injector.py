@@ -1,5 +1,10 @@
+import asyncio
+import contextlib
+import contextvars
+import enum
 import functools
 import inspect
+import typing
 
 from fastup.core.commands import Command
 from fastup.core.events import Event
@@ -7,39 +12,352 @@ from fastup.core.events import Event
 from .registry import Handler
 
 
-def inject_dependencies(handler: Handler, deps: dict) -> Handler:
-    """Inject dependencies into a handler using type hints.
+class Scope(enum.StrEnum):
+    """Lifetime of a dependency produced by a :class:`Provider`."""
 
-    :param handler: The handler function to inject dependencies into.
-    :param deps: A mapping of dependency names to their instances.
-    :return: A new handler with dependencies injected.
-    :raises RuntimeError: If a required dependency is missing or a parameter lacks a type annotation.
+    SINGLETON = enum.auto()  # built once, shared by every handler invocation
+    COMMAND = enum.auto()  # built for each handler invocation
+    REQUEST = enum.auto()  # built once per `request_scope()`, shared inside it
+
+
+class Provider[T]:
+    """Describes how a dependency is built and how long it lives.
+
+    The factory is either a plain callable returning the dependency, or an async
+    generator function yielding it (a resource); resources are closed when the
+    scope that built them ends.
     """
-    params = inspect.signature(handler).parameters
-    handler_deps = {}
-    for name, param in params.items():
-        annotation = param.annotation
+
+    def __init__(
+        self,
+        factory: typing.Callable[[], T] | typing.Callable[[], typing.AsyncIterator[T]],
+        scope: Scope = Scope.COMMAND,
+    ) -> None:
+        """Initialize the provider.
+
+        :param factory: Zero-argument callable or async generator function.
+        :param scope: Lifetime of the built dependency.
+        :raises ValueError: If a resource factory is declared as singleton.
+        """
+        self.factory = factory
+        self.scope = scope
+        self.is_resource = inspect.isasyncgenfunction(factory)
+        if self.is_resource and scope is Scope.SINGLETON:
+            raise ValueError("Singleton providers cannot be async resources.")
+        self._instance: T | None = None
+
+    async def build(self, stack: contextlib.AsyncExitStack) -> T:
+        """Build a new instance, registering resource cleanup on the given stack."""
+        if self.is_resource:
+            cm = contextlib.asynccontextmanager(self.factory)()  # type: ignore
+            return await stack.enter_async_context(cm)
+        return self.factory()  # type: ignore
+
+    def singleton(self) -> T:
+        """Return the shared instance, building it on first use."""
+        if self._instance is None:
+            self._instance = self.factory()  # type: ignore
+        return self._instance  # type: ignore
+
+    def __repr__(self) -> str:
+        name = getattr(self.factory, "__name__", repr(self.factory))
+        return f"Provider({name}, scope={self.scope})"
+
+
+class _RequestCache:
+    """Instances built for REQUEST-scoped providers within one request scope."""
+
+    def __init__(self, stack: contextlib.AsyncExitStack) -> None:
+        self.stack = stack
+        self.instances: dict[Provider, typing.Any] = {}
+        self.lock = asyncio.Lock()
+
+    async def get(self, provider: Provider) -> typing.Any:
+        async with self.lock:
+            if provider not in self.instances:
+                self.instances[provider] = await provider.build(self.stack)
+            return self.instances[provider]
+
+
+_request_cache: contextvars.ContextVar[_RequestCache | None] = contextvars.ContextVar(
+    "fastup_request_cache", default=None
+)
+
+
+@contextlib.asynccontextmanager
+async def request_scope() -> typing.AsyncIterator[None]:
+    """Open a request scope for REQUEST-scoped providers.
+
+    Every command handled inside the scope shares one instance per provider;
+    resources are closed when the scope exits. Outside of a request scope,
+    REQUEST-scoped providers behave like COMMAND-scoped ones.
+    """
+    async with contextlib.AsyncExitStack() as stack:
+        token = _request_cache.set(_RequestCache(stack))
+        try:
+            yield
+        finally:
+            _request_cache.reset(token)
+
+
+async def _resolve(provider: Provider, stack: contextlib.AsyncExitStack):
+    """Resolve a scoped provider for the current handler invocation."""
+    if provider.scope is Scope.REQUEST:
+        cache = _request_cache.get()
+        if cache is not None:
+            return await cache.get(provider)
+    return await provider.build(stack)
+
+
+class _Dependency(typing.NamedTuple):
+    """A handler parameter to inject."""
+
+    name: str
+    interface: type
+    qualifier: str | None
+    positional: bool  # whether it can be passed positionally, after the message
+
+
+def _unwrap(annotation: typing.Any) -> tuple[typing.Any, str | None]:
+    """Split `Annotated[T, "qualifier"]` into `T` and its qualifier.
+
+    Parametrized generics are reduced to their class, e.g. `asyncio.Queue[Event]`
+    to `asyncio.Queue`.
+    """
+    qualifier = None
+    if typing.get_origin(annotation) is typing.Annotated:
+        annotation, *metadata = typing.get_args(annotation)
+        qualifier = next((m for m in metadata if isinstance(m, str)), None)
+    origin = typing.get_origin(annotation)
+    if isinstance(origin, type):
+        annotation = origin
+    return annotation, qualifier
+
+
+def _dependencies(handler: Handler) -> list[_Dependency]:
+    """Return the parameters of a handler which must be injected.
+
+    :raises RuntimeError: If a parameter lacks a type annotation.
+    """
+    try:
+        hints = typing.get_type_hints(handler, include_extras=True)
+    except NameError as e:
+        raise RuntimeError(
+            f"Cannot resolve the annotations of handler {handler.__name__!r}: {e}"
+        ) from e
+
+    dependencies = []
+    positional = True
+    for index, (name, param) in enumerate(
+        inspect.signature(handler).parameters.items()
+    ):
+        interface, qualifier = _unwrap(hints.get(name, inspect.Parameter.empty))
 
         # Require annotation on every parameter
-        if annotation is inspect._empty or not isinstance(annotation, type):
+        if not isinstance(interface, type) or interface is inspect.Parameter.empty:
             raise RuntimeError(
-                f"Handler {handler.__name__!r} has parameter {name!r} without a type annotation. "
-                "All handler parameters must be explicitly typed."
+                f"Handler {handler.__name__!r} has parameter {name!r} without a "
+                "type annotation. All handler parameters must be explicitly typed."
             )
 
-        # Skip parameters typed as Command / Event
-        if issubclass(annotation, (Command, Event)):
+        # Skip parameters typed as Command / Event, and optional ones (with a
+        # default); parameters after them can only be passed by keyword
+        if issubclass(interface, (Command, Event)) or param.default is not param.empty:
+            positional = positional and index == 0
             continue
 
-        # If it has a default, it's optional — skip requirement
-        if param.default is not inspect._empty:
-            continue
+        positional = positional and param.kind is param.POSITIONAL_OR_KEYWORD
+        dependencies.append(_Dependency(name, interface, qualifier, positional))
+    return dependencies
+
 
-        if name not in deps:
+def _compile(
+    handler: Handler, resolved: list[tuple[_Dependency, typing.Any]]
+) -> Handler:
+    """Build the invoker calling `handler` with its resolved dependencies.
+
+    The call plan is fixed here, so an invocation does no lookup: instances and
+    singletons are bound once, COMMAND-scoped factories are called inline, and
+    only resources and REQUEST-scoped providers need an async wrapper. Without
+    them the invoker is a plain function returning the handler's coroutine,
+    which saves a coroutine frame per call.
+    """
+    static: dict[str, typing.Any] = {}
+    factories: dict[str, typing.Callable[[], typing.Any]] = {}
+    scoped: dict[str, Provider] = {}
+    for dependency, dep in resolved:
+        if not isinstance(dep, Provider):
+            static[dependency.name] = dep
+        elif dep.scope is Scope.SINGLETON:
+            static[dependency.name] = dep.singleton()
+        elif dep.is_resource or dep.scope is Scope.REQUEST:
+            scoped[dependency.name] = dep
+        else:
+            factories[dependency.name] = dep.factory  # type: ignore
+    positional = all(dependency.positional for dependency, _ in resolved)
+
+    if scoped:
+
+        @functools.wraps(handler)
+        async def scoped_invoker(message):
+            async with contextlib.AsyncExitStack() as stack:
+                kwargs = dict(static)
+                for name, factory in factories.items():
+                    kwargs[name] = factory()
+                for name, provider in scoped.items():
+                    kwargs[name] = await _resolve(provider, stack)
+                return await handler(message, **kwargs)
+
+        return scoped_invoker
+
+    if factories and positional:
+        # a copy of the arguments with the factories' slots filled per call
+        template = [static.get(dependency.name) for dependency, _ in resolved]
+        slots = [
+            (index, factories[dependency.name])
+            for index, (dependency, _) in enumerate(resolved)
+            if dependency.name in factories
+        ]
+
+        def invoker(message):
+            args = template.copy()
+            for index, factory in slots:
+                args[index] = factory()
+            return handler(message, *args)
+
+    elif factories:
+
+        def invoker(message):
+            kwargs = static.copy()
+            for name, factory in factories.items():
+                kwargs[name] = factory()
+            return handler(message, **kwargs)
+
+    elif positional:
+        args = tuple(static.values())
+
+        def invoker(message):
+            return handler(message, *args)
+
+    else:
+
+        def invoker(message):
+            return handler(message, **static)
+
+    functools.update_wrapper(invoker, handler)
+    return inspect.markcoroutinefunction(invoker)
+
+
+def inject_dependencies(handler: Handler, deps: dict) -> Handler:
+    """Inject dependencies into a handler, matching them by parameter name.
+
+    Values in `deps` are either ready instances, shared as-is, or
+    :class:`Provider` objects, resolved according to their scope each time the
+    returned handler is invoked. Qualifiers are ignored; see :class:`Container`
+    for resolving dependencies by type.
+
+    :param handler: The handler function to inject dependencies into.
+    :param deps: A mapping of dependency names to their instances or providers.
+    :return: A new handler with dependencies injected.
+    :raises RuntimeError: If a required dependency is missing or a parameter lacks
+        a type annotation.
+    """
+    resolved = []
+    for dependency in _dependencies(handler):
+        if dependency.name not in deps:
+            raise RuntimeError(
+                f"Missing dependency {dependency.name!r} "
+                f"for handler {handler.__name__!r}."
+            )
+        resolved.append((dependency, deps[dependency.name]))
+    return _compile(handler, resolved)
+
+
+class Container:
+    """Resolves the dependencies of handlers by their annotated type.
+
+    Dependencies are bound to the type handlers annotate them with, usually a
+    protocol such as :class:`HashService`; when several implementations of one
+    type are bound, each gets a qualifier and handlers pick one with
+    `typing.Annotated`::
+
+        container.bind(HashService, Argon2PasswordHasher(), qualifier="argon2")
+
+        async def handle(
+            cmd: LoginCommand, hasher: Annotated[HashService, "argon2"]
+        ): ...
+
+    Parameter names do not matter. Each handler is resolved and compiled once,
+    on its first :meth:`inject`, and the invoker is cached.
+    """
+
+    def __init__(self) -> None:
+        self._bindings: dict[tuple[type, str | None], typing.Any] = {}
+        self._invokers: dict[Handler, Handler] = {}
+
+    def bind[T](
+        self,
+        interface: type[T],
+        dependency: T | Provider[T],
+        qualifier: str | None = None,
+    ) -> None:
+        """Bind an instance or a :class:`Provider` to a type.
+
+        :param interface: Type handlers annotate the dependency with.
+        :param dependency: Ready instance, shared as-is, or provider.
+        :param qualifier: Distinguishes implementations of the same type.
+        :raises RuntimeError: If the type and qualifier are already bound.
+        """
+        key = (interface, qualifier)
+        if key in self._bindings:
             raise RuntimeError(
-                f"Missing dependency {name!r} for handler {handler.__name__!r}."
+                f"{interface.__name__} is already bound"
+                + (f" with qualifier {qualifier!r}." if qualifier else ".")
             )
+        self._bindings[key] = dependency
+        self._invokers.clear()
+
+    def resolve(self, interface: type, qualifier: str | None = None) -> typing.Any:
+        """Return the instance or provider bound to a type.
+
+        Without a qualifier, a type bound only once resolves to that binding,
+        whatever its qualifier.
+
+        :raises RuntimeError: If nothing, or more than one binding, matches.
+        """
+        if (interface, qualifier) in self._bindings:
+            return self._bindings[(interface, qualifier)]
+        if qualifier is None:
+            qualifiers = [q for (t, q) in self._bindings if t is interface]
+            if len(qualifiers) == 1:
+                return self._bindings[(interface, qualifiers[0])]
+            if qualifiers:
+                choices = ", ".join(repr(q) for q in qualifiers)
+                raise RuntimeError(
+                    f"{interface.__name__} is ambiguous, annotate it with one of "
+                    f"the qualifiers {choices}."
+                )
+        raise RuntimeError(
+            f"No dependency bound to {interface.__name__}"
+            + (f" with qualifier {qualifier!r}." if qualifier else ".")
+        )
 
-        handler_deps[name] = deps[name]
+    def inject(self, handler: Handler) -> Handler:
+        """Return the invoker of a handler, calling it with its dependencies.
 
-    return functools.partial(handler, **handler_deps)
+        :raises RuntimeError: If a dependency cannot be resolved or a parameter
+            lacks a type annotation.
+        """
+        if handler not in self._invokers:
+            resolved = []
+            for dependency in _dependencies(handler):
+                try:
+                    dep = self.resolve(dependency.interface, dependency.qualifier)
+                except RuntimeError as e:
+                    raise RuntimeError(
+                        f"Cannot inject {dependency.name!r} into handler "
+                        f"{handler.__name__!r}: {e}"
+                    ) from e
+                resolved.append((dependency, dep))
+            self._invokers[handler] = _compile(handler, resolved)
+        return self._invokers[handler]
@@ -0,0 +1,205 @@
+import asyncio
+import collections
+import enum
+import time
+import typing
+
+from fastup.core.events import Event
+
+
+class Priority(enum.IntEnum):
+    """Lane an event is processed in by the background dispatcher."""
+
+    BACKGROUND = 0
+    NORMAL = 1
+    CRITICAL = 2
+
+    @property
+    def label(self) -> str:
+        """Lowercase name, used in configuration and metric labels."""
+        return self.name.lower()
+
+
+DEFAULT_LANE_WEIGHTS: typing.Mapping[Priority, int] = {
+    Priority.CRITICAL: 8,
+    Priority.NORMAL: 3,
+    Priority.BACKGROUND: 1,
+}
+
+type WaitObserver = typing.Callable[[Priority, float], None]
+
+
+class _Lanes:
+    """One FIFO per priority, served by smooth weighted round-robin."""
+
+    def __init__(
+        self,
+        lane_of: typing.Callable[[Event], Priority],
+        weights: typing.Mapping[Priority, int],
+        on_wait: WaitObserver | None,
+    ) -> None:
+        self._lane_of = lane_of
+        self._weights = weights
+        self._on_wait = on_wait
+        self._fifos = {lane: collections.deque() for lane in Priority}
+        self._credit = dict.fromkeys(Priority, 0)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, event: Event) -> None:
+        self._fifos[self._lane_of(event)].append((time.monotonic(), event))
+        self._size += 1
+
+    def popleft(self) -> Event:
+        lane = self._next_lane()
+        enqueued_at, event = self._fifos[lane].popleft()
+        self._size -= 1
+        if self._on_wait is not None:
+            self._on_wait(lane, time.monotonic() - enqueued_at)
+        return event
+
+    def depths(self) -> dict[Priority, int]:
+        return {lane: len(fifo) for lane, fifo in self._fifos.items()}
+
+    def _next_lane(self) -> Priority:
+        """Pick the busy lane owed the most turns (nginx's smooth weighted RR).
+
+        Every busy lane earns its weight, the chosen one pays back the total, so
+        each lane gets turns in proportion to its weight, evenly spread. Idle
+        lanes lose their credit rather than bank it for a later burst.
+        """
+        total = 0
+        chosen: Priority | None = None
+        for lane, fifo in self._fifos.items():
+            if not fifo:
+                self._credit[lane] = 0
+                continue
+            weight = self._weights[lane]
+            self._credit[lane] += weight
+            total += weight
+            if chosen is None or self._credit[lane] > self._credit[chosen]:
+                chosen = lane
+        if chosen is None:
+            raise IndexError("pop from empty lanes")
+        self._credit[chosen] -= total
+        return chosen
+
+
+class LaneQueue:
+    """Queue serving events from priority lanes with weighted fair scheduling.
+
+    Each lane is a FIFO. While several lanes hold events, `get` takes from each
+    in proportion to its weight, e.g. 8 critical, 3 normal and 1 background event
+    out of every 12 with the default weights, so a burst of low-priority events
+    delays critical ones only a little and never starves any lane. `maxsize`
+    bounds all lanes together.
+
+    It offers the methods of :class:`asyncio.Queue` the dispatcher uses, with the
+    same semantics.
+    """
+
+    def __init__(
+        self,
+        lane_of: typing.Callable[[Event], Priority],
+        maxsize: int = 0,
+        weights: typing.Mapping[Priority, int] = DEFAULT_LANE_WEIGHTS,
+        on_wait: WaitObserver | None = None,
+    ) -> None:
+        """Initialize the queue.
+
+        :param lane_of: Returns the lane of an event.
+        :param maxsize: Capacity of all lanes together; unbounded when 0.
+        :param weights: Share of turns of each lane.
+        :param on_wait: Called with the lane and the seconds an event waited in
+            it, whenever one is taken from the queue.
+        :raises ValueError: If a lane has no positive weight.
+        """
+        if any(weights.get(lane, 0) < 1 for lane in Priority):
+            raise ValueError("Every lane needs a positive weight.")
+        self.maxsize = maxsize
+        self._lanes = _Lanes(lane_of, weights, on_wait)
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._all_done = asyncio.Event()
+        self._all_done.set()
+        self._unfinished = 0
+
+    def qsize(self) -> int:
+        """Return the number of events waiting in all lanes."""
+        return len(self._lanes)
+
+    def empty(self) -> bool:
+        """Return whether no event is waiting."""
+        return not self._lanes
+
+    def full(self) -> bool:
+        """Return whether `maxsize` events are waiting."""
+        return 0 < self.maxsize <= len(self._lanes)
+
+    def depths(self) -> dict[Priority, int]:
+        """Return the number of events waiting in each lane."""
+        return self._lanes.depths()
+
+    async def put(self, event: Event) -> None:
+        """Enqueue an event, waiting while the queue is full."""
+        while self.full():
+            await self._not_full.wait()
+        self.put_nowait(event)
+
+    def put_nowait(self, event: Event) -> None:
+        """Enqueue an event.
+
+        :raises asyncio.QueueFull: If the queue is full.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._lanes.append(event)
+        self._unfinished += 1
+        self._all_done.clear()
+        self._update()
+
+    async def get(self) -> Event:
+        """Take the next event, waiting while the queue is empty."""
+        while self.empty():
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def get_nowait(self) -> Event:
+        """Take the next event.
+
+        :raises asyncio.QueueEmpty: If the queue is empty.
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        event = self._lanes.popleft()
+        self._update()
+        return event
+
+    def task_done(self) -> None:
+        """Mark an event taken from the queue as processed.
+
+        :raises ValueError: If called more times than events were put.
+        """
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._all_done.set()
+
+    async def join(self) -> None:
+        """Wait until every event put in the queue has been processed."""
+        await self._all_done.wait()
+
+    def _update(self) -> None:
+        """Wake the getters or putters the last change unblocked."""
+        if self._lanes:
+            self._not_empty.set()
+        else:
+            self._not_empty.clear()
+        if self.full():
+            self._not_full.clear()
+        else:
+            self._not_full.set()
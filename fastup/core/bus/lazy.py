@@ -0,0 +1,60 @@
+import importlib
+import typing
+
+from . import registry
+from .registry import Handler
+
+
+class LoadedHandlers(typing.NamedTuple):
+    """Handlers registered for one message type, ready to be called by the bus."""
+
+    command: Handler | None
+    batch_command: Handler | None
+    events: list[Handler]
+    partition_key: typing.Callable | None
+
+
+class HandlerLoader:
+    """Imports the handlers of a message type the first time it is dispatched.
+
+    Handler modules are listed per message type in a manifest of dotted module
+    paths, so a process only pays for importing the handlers it actually uses,
+    and only when it first needs them. Importing a module runs its
+    `register_*` decorators as usual.
+    """
+
+    def __init__(
+        self,
+        manifest: typing.Mapping[type, typing.Sequence[str]],
+        wrap: typing.Callable[[Handler], Handler] | None = None,
+    ) -> None:
+        """Initialize the loader.
+
+        :param manifest: mapping message class -> modules registering its handlers.
+        :param wrap: Applied to every loaded handler, e.g. to inject its
+            dependencies with :func:`inject_dependencies`.
+        """
+        self.manifest = manifest
+        self.wrap = wrap
+
+    def load(self, message_type: type) -> LoadedHandlers:
+        """Import the modules of a message type and return its handlers.
+
+        :raises ImportError: If a module of the manifest cannot be imported.
+        :raises RuntimeError: If `wrap` fails, e.g. on missing dependencies.
+        """
+        for module in self.manifest.get(message_type, ()):
+            importlib.import_module(module)
+
+        command = registry.COMMAND_HANDLERS.get(message_type)
+        batch_command = registry.BATCH_COMMAND_HANDLERS.get(message_type)
+        events = registry.EVENT_HANDLERS.get(message_type, [])
+        return LoadedHandlers(
+            command=self._wrap(command) if command else None,
+            batch_command=self._wrap(batch_command) if batch_command else None,
+            events=[self._wrap(handler) for handler in events],
+            partition_key=registry.EVENT_PARTITION_KEYS.get(message_type),
+        )
+
+    def _wrap(self, handler: Handler) -> Handler:
+        return self.wrap(handler) if self.wrap else handler
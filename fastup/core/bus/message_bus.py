@@ -1,11 +1,31 @@
 import asyncio
 import logging
+import time
+import typing
 
-from fastup.core.commands import Command
+from fastup.core.commands import Command, CommandBatch
 from fastup.core.entities import Entity
 from fastup.core.events import Event
+from fastup.core.exceptions import DeadlineExceeded
 
-from .registry import Handler
+from .background import drain_detached
+from .collector import collect_events
+from .dead_letters import DeadLetterSink
+from .deadline import deadline_scope
+from .dispatcher import BackgroundDispatcher, EventSink
+from .executors import ExecutionPolicy, OffloadExecutor, bind_executor
+from .injector import Container
+from .lanes import Priority
+from .lazy import HandlerLoader
+from .partitioned import PartitionedDispatcher
+from .middleware import Message, Middleware, run_pipeline
+from .registry import (
+    Handler,
+    command_handler_options,
+    event_handler_options,
+    handler_name,
+)
+from .single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -17,46 +37,320 @@ class MessageBus:
         self,
         command_handlers: dict[type[Command], Handler],
         event_handlers: dict[type[Event], list[Handler]],
-        queue: asyncio.Queue[Event],
+        queue: asyncio.Queue[Event] | None = None,
+        isolate_events: bool = True,
+        dispatcher: EventSink | None = None,
+        concurrent_fanout: bool = False,
+        dead_letters: DeadLetterSink | None = None,
+        middleware: typing.Sequence[Middleware] = (),
+        batch_command_handlers: dict[type[Command], Handler] | None = None,
+        dedupe_window: float = 0.0,
+        command_timeout: float | None = None,
+        partition_keys: dict[type[Event], typing.Callable[[Event], typing.Hashable]]
+        | None = None,
+        executors: typing.Mapping[ExecutionPolicy, OffloadExecutor] | None = None,
+        loader: HandlerLoader | None = None,
+        container: Container | None = None,
     ) -> None:
         """Initialize the message bus with command and event handlers.
 
         :param command_handlers: mapping Command class -> async callable
         :param event_handlers: mapping Event class -> set of async callables
-        :param queue: An asyncio queue for managing internal events.
+        :param queue: Shared queue for events processed in the background.
+        :param isolate_events: If True, events raised while handling a command are
+            collected per invocation and dispatched before `handle` returns. If
+            False, they are put on the shared queue and left for a background
+            consumer calling `dispatch_pending`.
+        :param dispatcher: Optional event sink, such as a background worker pool or
+            an external transport. While it is running, collected events are
+            submitted to it and `handle` returns without waiting for event handlers.
+        :param concurrent_fanout: If True, the handlers of one event run concurrently
+            instead of one after another, except those registered as sequential.
+        :param dead_letters: Optional store receiving events whose handler failed
+            and exhausted its retry policy; such events are only logged otherwise.
+        :param middleware: Hooks wrapped around every command handler and event
+            handler invocation, outermost first. Handlers are called directly
+            when there is none.
+        :param batch_command_handlers: mapping Command class -> async callable
+            handling a :class:`CommandBatch` of such commands, see `handle_many`.
+        :param dedupe_window: Seconds the result of a coalesced command keeps being
+            shared with identical commands after it completed, see
+            :class:`CommandHandlerOptions`.
+        :param command_timeout: Seconds a command handler may take when neither
+            the command nor its handler's options set a timeout; unbounded when
+            None.
+        :param partition_keys: mapping Event class -> function returning the key
+            its events are ordered by in a :class:`PartitionedDispatcher`.
+        :param executors: Executors backing the THREAD and PROCESS execution
+            policies; handlers whose policy has none run their offloaded work on
+            the event loop. They are shut down by `stop`.
+        :param loader: Optional loader importing the handlers of a message type
+            the first time it is dispatched, for types missing from the mappings
+            above.
+        :param container: Container the handlers were injected from, to reach
+            the services they share, e.g. to warm them up.
         """
         self.command_handlers = command_handlers
         self.event_handlers = event_handlers
-        self.queue = queue
+        self.queue = queue if queue is not None else asyncio.Queue()
+        self.isolate_events = isolate_events
+        self.dispatcher = dispatcher
+        self.concurrent_fanout = concurrent_fanout
+        self.dead_letters = dead_letters
+        self.middleware = tuple(middleware)
+        self.batch_command_handlers = batch_command_handlers or {}
+        self._single_flight = SingleFlight(dedupe_window)
+        self.command_timeout = command_timeout
+        self.partition_keys = partition_keys or {}
+        self.executors = dict(executors or {})
+        self.loader = loader
+        self.container = container
+        self._loaded: set[type] = set()
+        self._handler_limits: dict[Handler, asyncio.Semaphore] = {}
+        self._event_priorities: dict[type[Event], Priority] = {}
+        self._scheduled_retries: dict[
+            asyncio.TimerHandle, tuple[Handler, Event, Exception, int]
+        ] = {}
+        self._retries: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start the event sink, if any."""
+        if self.dispatcher is not None:
+            self.dispatcher.start()
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Drain and stop the event sink, if any, and abandon scheduled retries.
+
+        Retries already running are awaited, while events still waiting out their
+        backoff are dead-lettered instead of being lost. Detached tasks are then
+        awaited, and executors are shut down last, as those tasks may use them.
+
+        :param timeout: Maximum seconds to wait for queued events to be handled,
+            and then for detached tasks to finish.
+        """
+        if self.dispatcher is not None:
+            await self.dispatcher.stop(timeout)
+        while self._scheduled_retries or self._retries:
+            scheduled, self._scheduled_retries = self._scheduled_retries, {}
+            for timer, (handler, event, exc, attempt) in scheduled.items():
+                timer.cancel()
+                await self._dead_letter(handler, event, exc, attempt)
+            await asyncio.gather(*self._retries, return_exceptions=True)
+        await drain_detached(timeout)
+        for executor in self.executors.values():
+            await asyncio.to_thread(executor.shutdown)
 
     async def handle(self, command: Command) -> Entity:
         """Handle a command by dispatching it to the appropriate handler.
 
-        Executes the command handler, collects any events raised by the resulting entity,
-        dispatches those events, and clears the entity's event queue.
+        Executes the command handler and collects the events it raised. Those
+        events are handed to the background dispatcher when it is running, or
+        dispatched before returning otherwise. Events raised by other concurrent
+        commands are never dispatched here.
+
+        Commands registered with a `coalesce_key` share the execution, events and
+        result of an identical command already in flight, or completed within the
+        dedupe window.
+
+        The handler runs under a deadline taken from the command's `timeout`, its
+        registered timeout or the bus's `command_timeout`, in that order. Units of
+        work and services read it with :func:`time_left` to bound their own I/O.
+        Event handlers are not bound by it.
 
         :param command: The command instance to handle.
         :return: The entity resulting from handling the command.
         :raises HandlerNotRegistered: If no handler is registered for the command type.
+        :raises DeadlineExceeded: If the handler did not complete in time.
         """
+        self._ensure_loaded(command.type)
         handler = self.command_handlers.get(command.type)
 
         if handler is None:
             raise RuntimeError(f"No handler registered for {command.name=}")
 
+        coalesce_key = command_handler_options(handler).coalesce_key
+        if coalesce_key is None:
+            return await self._handle(handler, command)
+        key = (command.type, coalesce_key(command))
+        return await self._single_flight.do(key, lambda: self._handle(handler, command))
+
+    async def _handle(self, handler: Handler, command: Command) -> Entity:
+        """Run a command handler and publish the events it raised."""
         logger.debug(f"handling {command.name=}")
-        entity = await handler(command)
-        await self._dispatch_events()
+        if not self.isolate_events:
+            with collect_events(self.queue):
+                return await self._run_command(handler, command)
+
+        with collect_events() as events:
+            entity = await self._run_command(handler, command)
+
+        await self._publish(events)
         return entity
 
-    async def _dispatch_events(self) -> None:
+    async def _run_command(self, handler: Handler, command: Command) -> Entity:
+        """Invoke a command handler, cancelling it once its deadline expires."""
+        timeout = command.timeout
+        if timeout is None:
+            timeout = command_handler_options(handler).timeout
+        if timeout is None:
+            timeout = self.command_timeout
+
+        with deadline_scope(timeout) as deadline:
+            if deadline is None:
+                return await self._invoke(handler, command)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceeded
+            scope = asyncio.timeout(remaining)
+            try:
+                async with scope:
+                    return await self._invoke(handler, command)
+            except TimeoutError as exc:
+                if not scope.expired():
+                    raise
+                logger.warning(f"Deadline exceeded handling {command.name=}")
+                raise DeadlineExceeded from exc
+
+    async def handle_many(
+        self, commands: typing.Sequence[Command]
+    ) -> list[Entity | Exception]:
+        """Handle many commands, batching those of the same type where possible.
+
+        Commands whose type has a batch handler are handed to it together, in one
+        invocation, so they can share one unit of work and round trip. The other
+        commands are handled one by one, as with `handle`. A failing command never
+        fails the others.
+
+        :param commands: The commands to handle, possibly of mixed types.
+        :return: For each command, in order, the resulting entity or the
+            exception it failed with.
+        """
+        groups: dict[type[Command], list[int]] = {}
+        for index, command in enumerate(commands):
+            groups.setdefault(command.type, []).append(index)
+
+        results: dict[int, Entity | Exception] = {}
+        for command_type, indexes in groups.items():
+            batch = CommandBatch(tuple(commands[i] for i in indexes))
+            outcomes = await self._handle_batch(command_type, batch)
+            results.update(zip(indexes, outcomes))
+        return [results[i] for i in range(len(commands))]
+
+    async def _handle_batch(
+        self, command_type: type[Command], batch: CommandBatch
+    ) -> list[Entity | Exception]:
+        """Run a batch through its batch handler, or command by command without one.
+
+        The batch handler runs under the same deadline as a single command: the
+        batch's timeout, else the handler's, else the bus's. An exception raised
+        by the batch handler itself, including `DeadlineExceeded`, is the result
+        of every command of the batch.
+        """
+        self._ensure_loaded(command_type)
+        handler = self.batch_command_handlers.get(command_type)
+        if handler is None or not self.isolate_events:
+            outcomes: list[Entity | Exception] = []
+            for command in batch.commands:
+                try:
+                    outcomes.append(await self.handle(command))
+                except Exception as exc:
+                    outcomes.append(exc)
+            return outcomes
+
+        logger.debug(f"handling {batch.name=} of {len(batch.commands)} commands")
+        try:
+            with collect_events() as events:
+                outcomes = typing.cast(
+                    list[Entity | Exception], await self._run_command(handler, batch)
+                )
+        except Exception as exc:
+            logger.error(f"Error handling {batch.name=}: {exc}")
+            return [exc] * len(batch.commands)
+        if len(outcomes) != len(batch.commands):
+            raise RuntimeError(
+                f"Batch handler for {command_type.__name__} returned "
+                f"{len(outcomes)} results for {len(batch.commands)} commands"
+            )
+        await self._publish(events)
+        return outcomes
+
+    async def _publish(self, events: asyncio.Queue[Event]) -> None:
+        """Hand collected events to the running event sink, or dispatch them now."""
+        if self.dispatcher is not None and self.dispatcher.is_running:
+            while not events.empty():
+                await self.dispatcher.submit(events.get_nowait())
+        else:
+            await self._dispatch_events(events)
+
+    async def dispatch(self, event: Event) -> None:
+        """Dispatch a single event, along with any events its handlers raise."""
+        queue: asyncio.Queue[Event] = asyncio.Queue()
+        queue.put_nowait(event)
+        await self._dispatch_events(queue)
+
+    async def deliver(self, event: Event, attempt: int = 1) -> None:
+        """Dispatch an event read from durable storage, such as the outbox.
+
+        Unlike `dispatch`, failed handlers are not retried in memory, where a
+        restart would lose them: a failure the handler's retry policy would
+        retry after `attempt` makes `deliver` raise, so the caller keeps the
+        event and delivers it again later. Failures the policy gives up on are
+        dead-lettered, and only raise if that fails too. Handlers which
+        succeeded run again on the next delivery, so they must be idempotent.
+
+        :param event: The event to handle.
+        :param attempt: How many times the event was delivered, this one included.
+        :raises ExceptionGroup: If the event must be delivered again.
+        """
+        queue: asyncio.Queue[Event] = asyncio.Queue()
+        queue.put_nowait(event)
+        failures: list[Exception] = []
+        await self._dispatch_events(queue, attempt, failures)
+        if failures:
+            raise ExceptionGroup(f"Delivery {attempt} of {event.name} failed", failures)
+
+    async def redeliver(self, event: Event, handler: str) -> None:
+        """Run a single handler of an event, e.g. to replay a dead letter.
+
+        Unlike `dispatch`, errors are not retried nor swallowed. Events raised by
+        the handler are dispatched to all their handlers as usual.
+
+        :param event: The event to handle.
+        :param handler: Dotted path of the handler, see :func:`handler_name`.
+        :raises LookupError: If no such handler is registered for the event.
+        """
+        self._ensure_loaded(event.type)
+        for candidate in self.event_handlers.get(event.type, []):
+            if handler_name(candidate) == handler:
+                break
+        else:
+            raise LookupError(f"No handler {handler} registered for {event.name=}")
+
+        with collect_events() as raised:
+            await self._invoke(candidate, event)
+        await self._dispatch_events(raised)
+
+    async def dispatch_pending(self) -> None:
+        """Dispatch all events currently waiting on the shared queue."""
+        await self._dispatch_events(self.queue)
+
+    async def _dispatch_events(
+        self,
+        queue: asyncio.Queue[Event] | None = None,
+        attempt: int = 1,
+        failures: list[Exception] | None = None,
+    ) -> None:
         """Process all pending events in the queue.
 
-        Pulls events from the internal queue until it's empty and invokes
-        all registered handlers for each event."""
+        Pulls events from the given queue (the shared one by default) until it's
+        empty and invokes all registered handlers for each event. Events raised by
+        those handlers are put on the same queue and processed in the same pass.
+        With `failures`, see `_run_event_handler`.
+        """
+        queue = queue if queue is not None else self.queue
         while True:
             try:
-                event = self.queue.get_nowait()
+                event = queue.get_nowait()
             except asyncio.QueueEmpty:
                 break
 
@@ -64,6 +358,7 @@ class MessageBus:
                 logger.warning(f"Invalid event in queue: {event}")
                 continue
 
+            self._ensure_loaded(event.type)
             handlers = self.event_handlers.get(event.type, [])
             if not handlers:
                 logger.warning(f"No handler registered for {event.name=}")
@@ -71,9 +366,204 @@ class MessageBus:
 
             logger.debug(f"dispatching {event.name=}")
 
+            if self.concurrent_fanout and len(handlers) > 1:
+                await self._fan_out(event, handlers, queue, attempt, failures)
+            else:
+                for handler in handlers:
+                    await self._run_event_handler(
+                        handler, event, queue, attempt, failures
+                    )
+
+    async def _fan_out(
+        self,
+        event: Event,
+        handlers: list[Handler],
+        queue: asyncio.Queue[Event],
+        attempt: int = 1,
+        failures: list[Exception] | None = None,
+    ) -> None:
+        """Run the handlers of one event concurrently.
+
+        Independent handlers each get their own task, while handlers registered as
+        sequential share one task and keep their registration order. Handler errors
+        are logged by `_run_event_handler`, so one failure never cancels the others.
+        """
+        chain = [h for h in handlers if event_handler_options(h).sequential]
+
+        async def run_chain() -> None:
+            for handler in chain:
+                await self._run_event_handler(handler, event, queue, attempt, failures)
+
+        async with asyncio.TaskGroup() as tg:
+            if chain:
+                tg.create_task(run_chain())
             for handler in handlers:
-                try:
-                    await handler(event)
-                    logger.debug(f"handled {event.name=} with {handler.__name__}")
-                except Exception as exc:
-                    logger.error(f"Error handling event {event.name=}: {exc}")
+                if not event_handler_options(handler).sequential:
+                    tg.create_task(
+                        self._run_event_handler(
+                            handler, event, queue, attempt, failures
+                        )
+                    )
+
+    async def _run_event_handler(
+        self,
+        handler: Handler,
+        event: Event,
+        queue: asyncio.Queue[Event],
+        attempt: int = 1,
+        failures: list[Exception] | None = None,
+    ) -> None:
+        """Invoke one event handler within its concurrency cap, logging any error.
+
+        Events raised by the handler are collected separately and appended to
+        `queue` only once it succeeds. A failure is retried in the background
+        according to the handler's retry policy, so it never delays the other
+        events, and dead-lettered once the policy gives up. With `failures`, a
+        failure to retry, or to dead-letter, is appended to it instead.
+        """
+        limit = self._handler_limit(handler)
+        try:
+            with collect_events() as raised:
+                if limit is None:
+                    await self._invoke(handler, event)
+                else:
+                    async with limit:
+                        await self._invoke(handler, event)
+            while not raised.empty():
+                queue.put_nowait(raised.get_nowait())
+            logger.debug(f"handled {event.name=} with {handler.__name__}")
+        except Exception as exc:
+            logger.error(f"Error handling event {event.name=}: {exc}")
+            policy = event_handler_options(handler).retry
+            if not policy.should_retry(exc, attempt):
+                if not await self._dead_letter(handler, event, exc, attempt):
+                    if failures is not None:
+                        failures.append(exc)
+            elif failures is not None:
+                failures.append(exc)
+            else:
+                self._schedule_retry(handler, event, exc, attempt)
+
+    def _schedule_retry(
+        self, handler: Handler, event: Event, exc: Exception, attempt: int
+    ) -> None:
+        """Run the handler again once the backoff of its failed `attempt` expires.
+
+        Waiting retries are plain timers rather than sleeping tasks, so they cost
+        nothing until they fire and can be dead-lettered by `stop`.
+        """
+        delay = event_handler_options(handler).retry.backoff(attempt)
+        logger.warning(
+            f"Retrying {handler_name(handler)} for {event.name=} in {delay:.2f}s "
+            f"(attempt {attempt + 1})"
+        )
+
+        def fire() -> None:
+            del self._scheduled_retries[timer]
+            task = asyncio.create_task(self._retry(handler, event, attempt + 1))
+            self._retries.add(task)
+            task.add_done_callback(self._retries.discard)
+
+        timer = asyncio.get_running_loop().call_later(delay, fire)
+        self._scheduled_retries[timer] = (handler, event, exc, attempt)
+
+    async def _retry(self, handler: Handler, event: Event, attempt: int) -> None:
+        """Retry a handler and dispatch the events it raises."""
+        raised: asyncio.Queue[Event] = asyncio.Queue()
+        await self._run_event_handler(handler, event, raised, attempt)
+        await self._dispatch_events(raised)
+
+    async def _dead_letter(
+        self, handler: Handler, event: Event, exc: Exception, attempts: int
+    ) -> bool:
+        """Hand a failed delivery to the dead-letter store, if any.
+
+        :return: False if the store failed to keep it.
+        """
+        if self.dead_letters is None:
+            return True
+        try:
+            await self.dead_letters.add(event, handler_name(handler), exc, attempts)
+        except Exception as store_exc:
+            logger.exception(f"Failed to dead-letter {event.name=}: {store_exc}")
+            return False
+        return True
+
+    def event_priority(self, event: Event) -> Priority:
+        """Return the lane of an event: the highest priority among its handlers."""
+        priority = self._event_priorities.get(event.type)
+        if priority is None:
+            self._ensure_loaded(event.type)
+            handlers = self.event_handlers.get(event.type, [])
+            priority = max(
+                (event_handler_options(h).priority for h in handlers),
+                default=Priority.NORMAL,
+            )
+            self._event_priorities[event.type] = priority
+        return priority
+
+    def partition_key(self, event: Event) -> typing.Hashable | None:
+        """Return the key ordering an event, None when its type has none."""
+        self._ensure_loaded(event.type)
+        key = self.partition_keys.get(event.type)
+        return None if key is None else key(event)
+
+    def _ensure_loaded(self, message_type: type) -> None:
+        """Load the handlers of a message type through the loader, once."""
+        if self.loader is None or message_type in self._loaded:
+            return
+        loaded = self.loader.load(message_type)
+        self._loaded.add(message_type)
+        if loaded.command is not None:
+            self.command_handlers.setdefault(message_type, loaded.command)
+        if loaded.batch_command is not None:
+            self.batch_command_handlers.setdefault(message_type, loaded.batch_command)
+        if loaded.events:
+            self.event_handlers.setdefault(message_type, loaded.events)
+        if loaded.partition_key is not None:
+            self.partition_keys.setdefault(message_type, loaded.partition_key)
+
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of events waiting in each of the bus's queues."""
+        depths = {
+            "shared": self.queue.qsize(),
+            "retry": len(self._scheduled_retries),
+        }
+        if isinstance(self.dispatcher, (BackgroundDispatcher, PartitionedDispatcher)):
+            depths["dispatcher"] = self.dispatcher.stats().depth
+        return depths
+
+    def _invoke(self, handler: Handler, message: Message) -> typing.Awaitable:
+        """Call a handler, through the middleware chain if there is one."""
+        executor = self._executor(handler, message) if self.executors else None
+        if executor is not None:
+            return self._invoke_on(executor, handler, message)
+        if not self.middleware:
+            return handler(message)
+        return run_pipeline(self.middleware, handler, message)
+
+    async def _invoke_on(
+        self, executor: OffloadExecutor, handler: Handler, message: Message
+    ) -> typing.Any:
+        """Call a handler with `executor` bound for the work it offloads."""
+        with bind_executor(executor):
+            if not self.middleware:
+                return await handler(message)
+            return await run_pipeline(self.middleware, handler, message)
+
+    def _executor(self, handler: Handler, message: Message) -> OffloadExecutor | None:
+        """Return the executor of the handler's execution policy, if any."""
+        if isinstance(message, Event):
+            policy = event_handler_options(handler).execution
+        else:
+            policy = command_handler_options(handler).execution
+        return self.executors.get(policy)
+
+    def _handler_limit(self, handler: Handler) -> asyncio.Semaphore | None:
+        """Return the semaphore enforcing the handler's `max_concurrency`, if any."""
+        max_concurrency = event_handler_options(handler).max_concurrency
+        if max_concurrency is None:
+            return None
+        if handler not in self._handler_limits:
+            self._handler_limits[handler] = asyncio.Semaphore(max_concurrency)
+        return self._handler_limits[handler]
@@ -0,0 +1,188 @@
+import functools
+import time
+import typing
+
+from fastup.core.commands import Command
+from fastup.core.events import Event
+from fastup.core.metrics import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry
+
+from .executors import OffloadExecutor
+from .lanes import Priority
+from .registry import Handler, handler_name
+
+type Message = Command | Event
+type CallNext = typing.Callable[[], typing.Awaitable[typing.Any]]
+
+
+class Middleware(typing.Protocol):
+    """Hook wrapped around every command handler and event handler invocation.
+
+    Implementations must await `call_next()` exactly once and return its result,
+    or raise.
+    """
+
+    async def __call__(
+        self, message: Message, handler: Handler, call_next: CallNext
+    ) -> typing.Any: ...
+
+
+def run_pipeline(
+    middleware: typing.Sequence[Middleware], handler: Handler, message: Message
+) -> typing.Awaitable[typing.Any]:
+    """Invoke `handler(message)` through the middleware chain, outermost first."""
+    call: CallNext = functools.partial(handler, message)
+    for mw in reversed(middleware):
+        call = functools.partial(mw, message, handler, call)
+    return call()
+
+
+class MetricsMiddleware:
+    """Records latency, in-flight and error metrics per message type.
+
+    Series are labelled with `kind` (command or event), `message` (the class
+    name) and `handler`, since one event usually has several handlers.
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY) -> None:
+        """Initialize the middleware and register its metrics.
+
+        :param registry: Registry the metrics are rendered from.
+        """
+        self.registry = registry
+        labels = ("kind", "message", "handler")
+        self.duration = registry.register(
+            Histogram(
+                "fastup_bus_handler_duration_seconds",
+                "Time spent in command and event handlers.",
+                labels,
+            )
+        )
+        self.in_flight = registry.register(
+            Gauge(
+                "fastup_bus_handlers_in_flight",
+                "Handler invocations currently running.",
+                labels,
+            )
+        )
+        self.errors = registry.register(
+            Counter(
+                "fastup_bus_handler_errors",
+                "Handler invocations that raised.",
+                labels,
+            )
+        )
+        self.lane_wait = registry.register(
+            Histogram(
+                "fastup_bus_lane_wait_seconds",
+                "Time events waited in a dispatcher lane before being handled.",
+                ("lane",),
+            )
+        )
+        self.executor_wait = registry.register(
+            Histogram(
+                "fastup_executor_wait_seconds",
+                "Time offloaded calls waited for an executor worker.",
+                ("executor",),
+            )
+        )
+
+    def observe_queues(
+        self, depths: typing.Callable[[], typing.Mapping[str, int]]
+    ) -> None:
+        """Report queue depths read from `depths()` whenever metrics are rendered.
+
+        :param depths: Returns the current depth of each queue by name, e.g.
+            :meth:`MessageBus.queue_depths`.
+        """
+
+        def collect() -> typing.Iterator[tuple[tuple[str, ...], float]]:
+            for queue, depth in depths().items():
+                yield (queue,), depth
+
+        self.registry.unregister("fastup_bus_queue_depth")
+        self.registry.register(
+            Gauge(
+                "fastup_bus_queue_depth",
+                "Events waiting in the bus queues.",
+                ("queue",),
+                collect=collect,
+            )
+        )
+
+    def observe_lanes(
+        self, depths: typing.Callable[[], typing.Mapping[str, int]]
+    ) -> None:
+        """Report dispatcher lane depths read from `depths()` when rendered.
+
+        :param depths: Returns the current depth of each lane by name, e.g.
+            the `lanes` of :meth:`BackgroundDispatcher.stats`.
+        """
+
+        def collect() -> typing.Iterator[tuple[tuple[str, ...], float]]:
+            for lane, depth in depths().items():
+                yield (lane,), depth
+
+        self.registry.unregister("fastup_bus_lane_depth")
+        self.registry.register(
+            Gauge(
+                "fastup_bus_lane_depth",
+                "Events waiting in each background dispatcher lane.",
+                ("lane",),
+                collect=collect,
+            )
+        )
+
+    def observe_executors(self, executors: typing.Iterable[OffloadExecutor]) -> None:
+        """Report the pending calls and saturation of executors when rendered.
+
+        Queue wait times are recorded by :meth:`observe_executor_wait`, to be
+        set as the executors' `on_wait`.
+        """
+        executors = list(executors)
+
+        def pending() -> typing.Iterator[tuple[tuple[str, ...], float]]:
+            for executor in executors:
+                yield (executor.name,), executor.stats().pending
+
+        def saturation() -> typing.Iterator[tuple[tuple[str, ...], float]]:
+            for executor in executors:
+                yield (executor.name,), executor.stats().saturation
+
+        for name, help, collect in (
+            (
+                "fastup_executor_pending",
+                "Offloaded calls submitted and not finished yet.",
+                pending,
+            ),
+            (
+                "fastup_executor_saturation",
+                "Pending offloaded calls per worker; above 1 means queueing.",
+                saturation,
+            ),
+        ):
+            self.registry.unregister(name)
+            self.registry.register(Gauge(name, help, ("executor",), collect=collect))
+
+    def observe_executor_wait(self, executor: str, seconds: float) -> None:
+        """Record how long an offloaded call waited for a worker."""
+        self.executor_wait.observe((executor,), seconds)
+
+    def observe_lane_wait(self, lane: Priority, seconds: float) -> None:
+        """Record how long an event waited in its lane; a dispatcher `on_wait`."""
+        self.lane_wait.observe((lane.label,), seconds)
+
+    async def __call__(
+        self, message: Message, handler: Handler, call_next: CallNext
+    ) -> typing.Any:
+        kind = "event" if isinstance(message, Event) else "command"
+        labels = (kind, message.name, handler_name(handler))
+        self.in_flight.inc(labels)
+        start = time.perf_counter()
+        try:
+            return await call_next()
+        except Exception:
+            self.errors.inc(labels)
+            raise
+        finally:
+            self.duration.observe(labels, time.perf_counter() - start)
+            self.in_flight.dec(labels)
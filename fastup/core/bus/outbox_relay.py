@@ -0,0 +1,124 @@
+import asyncio
+import datetime
+import logging
+import typing
+
+from fastup.core.events import Event
+from fastup.core.unit_of_work import UnitOfWork
+
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Moves events from the transactional outbox to their handlers.
+
+    Each pass claims a batch of rows with `FOR UPDATE SKIP LOCKED`, dispatches
+    the events concurrently and acknowledges the whole batch with a single
+    statement in the same transaction. Row locks are held until the batch is
+    acknowledged, so any number of relays can run side by side on different
+    nodes without handling the same message twice. A message whose delivery
+    failed stays in the outbox, with its attempts counted, until a later pass
+    delivers it again once its backoff expired.
+    """
+
+    def __init__(
+        self,
+        uow_factory: typing.Callable[[], UnitOfWork],
+        deliver: typing.Callable[[Event, int], typing.Awaitable[None]],
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        delete_dispatched: bool = True,
+        backoff: typing.Callable[[int], float] = RetryPolicy(max_delay=60.0).backoff,
+    ) -> None:
+        """Initialize the relay.
+
+        :param uow_factory: Builds a unit of work for each batch.
+        :param deliver: Coroutine function handling one event and its delivery
+            count, raising if it must be delivered again (e.g. `MessageBus.deliver`).
+        :param batch_size: Maximum number of rows claimed per pass.
+        :param poll_interval: Seconds to sleep when the outbox has been drained.
+        :param delete_dispatched: Delete acknowledged rows if True, otherwise stamp
+            their `dispatched_at` column.
+        :param backoff: Seconds to wait before delivering a message again after
+            its given (1-based) failed delivery.
+        """
+        self._uow_factory = uow_factory
+        self._deliver = deliver
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._delete_dispatched = delete_dispatched
+        self._backoff = backoff
+        self._stopped = asyncio.Event()
+
+    async def run_once(self) -> int:
+        """Claim, deliver and acknowledge one batch.
+
+        Messages whose delivery raised are left pending and retried by a later
+        pass after their backoff; messages that cannot be deserialized are marked
+        as dispatched and logged so they never block the outbox.
+
+        :return: The number of claimed messages.
+        """
+        async with self._uow_factory() as uow:
+            messages = await uow.outbox.claim(self._batch_size)
+            if not messages:
+                return 0
+
+            events: dict[int, Event] = {}
+            attempts: dict[int, int] = {}
+            undecodable: list[int] = []
+            for msg in messages:
+                attempts[msg.id] = msg.attempts + 1
+                try:
+                    events[msg.id] = Event.from_payload(msg.event_type, msg.payload)
+                except (LookupError, TypeError) as exc:
+                    logger.error(f"Dropping undecodable outbox message {msg.id}: {exc}")
+                    undecodable.append(msg.id)
+
+            results = await asyncio.gather(
+                *(self._deliver(event, attempts[id]) for id, event in events.items()),
+                return_exceptions=True,
+            )
+            done = []
+            retries: dict[int, datetime.datetime] = {}
+            now = datetime.datetime.now(datetime.UTC)
+            for msg_id, result in zip(events, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error relaying outbox message {msg_id}: {result}")
+                    delay = self._backoff(attempts[msg_id])
+                    retries[msg_id] = now + datetime.timedelta(seconds=delay)
+                else:
+                    done.append(msg_id)
+
+            if self._delete_dispatched:
+                await uow.outbox.delete_many(done)
+            else:
+                await uow.outbox.mark_dispatched(done)
+            await uow.outbox.mark_dispatched(undecodable)
+            await uow.outbox.retry_later(retries)
+            await uow.commit()
+
+        logger.debug(f"Relayed {len(done)}/{len(messages)} outbox messages")
+        return len(messages)
+
+    async def run(self) -> None:
+        """Relay batches until `stop()` is called, polling when idle."""
+        logger.info("Starting outbox relay...")
+        while not self._stopped.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception as exc:
+                logger.exception(f"Outbox relay pass failed: {exc}")
+                claimed = 0
+            if claimed < self._batch_size:
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), self._poll_interval)
+                except TimeoutError:
+                    pass
+        logger.info("Outbox relay stopped")
+
+    def stop(self) -> None:
+        """Ask `run()` to return after the current pass."""
+        self._stopped.set()
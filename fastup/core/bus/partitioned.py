@@ -0,0 +1,151 @@
+import asyncio
+import itertools
+import logging
+import typing
+
+from fastup.core.events import Event
+
+from .dispatcher import DispatcherStats
+
+logger = logging.getLogger(__name__)
+
+type PartitionKey = typing.Callable[[Event], typing.Hashable | None]
+
+
+class PartitionedDispatcher:
+    """Pool of asyncio workers, each consuming its own queue in order.
+
+    Events with the same partition key (e.g. the same OTP) always go to the same
+    worker and are therefore handled one after another, in submission order,
+    while events with different keys are handled in parallel. Events without a
+    key are spread round-robin.
+
+    Ordering holds for the first attempt only: a failed handler retried with
+    backoff runs after the events submitted in the meantime.
+    """
+
+    def __init__(
+        self,
+        dispatch: typing.Callable[[Event], typing.Awaitable[None]],
+        partition_key: PartitionKey,
+        workers: int = 4,
+        maxsize: int = 1000,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        :param dispatch: Coroutine function processing a single event.
+        :param partition_key: Returns the key of an event, or None when it can
+            be handled on any worker, e.g. :meth:`MessageBus.partition_key`.
+        :param workers: Number of workers, i.e. of partitions.
+        :param maxsize: Capacity of each worker's queue; submitting to a full
+            partition waits for room.
+        :raises ValueError: If the sizes are inconsistent.
+        """
+        if workers < 1:
+            raise ValueError("At least one worker is required.")
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+
+        self._dispatch = dispatch
+        self._partition_key = partition_key
+        self._queues: list[asyncio.Queue[Event]] = [
+            asyncio.Queue(maxsize=maxsize) for _ in range(workers)
+        ]
+        self._unkeyed = itertools.cycle(range(workers))
+        self._tasks: list[asyncio.Task] = []
+        self._max_depth = 0
+        self._submitted = 0
+        self._processed = 0
+        self._failed = 0
+        self._throttle_waits = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker tasks are running and accepting events."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Spawn one worker task per partition on the running event loop."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(queue), name=f"event-partition-{i}")
+            for i, queue in enumerate(self._queues)
+        ]
+        logger.info(f"Started {len(self._tasks)} partitioned event workers")
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Stop accepting events, drain every partition and stop the workers.
+
+        :param timeout: Maximum seconds to wait for the drain; pending events are
+            dropped (and logged) once it expires.
+        """
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        drained = asyncio.gather(*(queue.join() for queue in self._queues))
+        try:
+            await asyncio.wait_for(drained, timeout)
+        except TimeoutError:
+            logger.error(
+                f"Event partitions drain timed out; dropping {self.depth()} events"
+            )
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Stopped partitioned event workers")
+
+    async def submit(self, event: Event) -> None:
+        """Enqueue an event on the partition of its key, waiting while it is full.
+
+        :raises RuntimeError: If the dispatcher is not running.
+        """
+        if not self.is_running:
+            raise RuntimeError("Partitioned dispatcher is not running.")
+        queue = self._queues[self.partition_of(event)]
+        if queue.full():
+            self._throttle_waits += 1
+        await queue.put(event)
+        self._submitted += 1
+        self._max_depth = max(self._max_depth, queue.qsize())
+
+    def partition_of(self, event: Event) -> int:
+        """Return the index of the worker handling an event."""
+        key = self._partition_key(event)
+        if key is None:
+            return next(self._unkeyed)
+        return hash(key) % len(self._queues)
+
+    def depth(self) -> int:
+        """Return the number of events waiting across all partitions."""
+        return sum(queue.qsize() for queue in self._queues)
+
+    def stats(self) -> DispatcherStats:
+        """Return a snapshot of the queue depths and worker counters.
+
+        `max_depth` and `capacity` are per partition.
+        """
+        return DispatcherStats(
+            workers=len(self._tasks),
+            depth=self.depth(),
+            max_depth=self._max_depth,
+            capacity=self._queues[0].maxsize,
+            throttled=any(queue.full() for queue in self._queues),
+            submitted=self._submitted,
+            processed=self._processed,
+            failed=self._failed,
+            throttle_waits=self._throttle_waits,
+        )
+
+    async def _work(self, queue: asyncio.Queue[Event]) -> None:
+        """Worker loop: process the events of one partition until cancelled."""
+        while True:
+            event = await queue.get()
+            try:
+                await self._dispatch(event)
+                self._processed += 1
+            except Exception as exc:
+                self._failed += 1
+                logger.error(f"Error dispatching event {event.name=}: {exc}")
+            finally:
+                queue.task_done()
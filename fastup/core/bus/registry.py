@@ -1,32 +1,186 @@
-from typing import Callable
+import dataclasses
+from typing import Callable, Hashable
 
 from fastup.core.commands import Command
 from fastup.core.events import Event
 
+from .executors import ExecutionPolicy
+from .lanes import Priority
+from .retry import NO_RETRY, RetryPolicy
+
 type Handler[T, **P] = Callable[P, T]
 
 EVENT_HANDLERS: dict[type["Event"], list[Handler]] = {}
 
 COMMAND_HANDLERS: dict[type[Command], Handler] = {}
 
+BATCH_COMMAND_HANDLERS: dict[type[Command], Handler] = {}
+
+EVENT_PARTITION_KEYS: dict[type[Event], Callable[[Event], Hashable]] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class CommandHandlerOptions:
+    """Handling options declared for a command handler at registration time.
+
+    :param coalesce_key: Opts the command into single-flight handling: commands
+        of the same type with equal keys, handled while another is in flight (or
+        shortly after it completed), share its execution and result instead of
+        running the handler again. Not coalesced when None.
+    :param timeout: Seconds the handler may take unless the command carries its
+        own timeout; the bus default applies when None.
+    :param execution: Where the blocking work the handler passes to
+        :func:`offload` runs.
+    """
+
+    coalesce_key: Callable[[Command], Hashable] | None = None
+    timeout: float | None = None
+    execution: ExecutionPolicy = ExecutionPolicy.LOOP
+
+
+DEFAULT_COMMAND_HANDLER_OPTIONS = CommandHandlerOptions()
+
+
+@dataclasses.dataclass(frozen=True)
+class EventHandlerOptions:
+    """Dispatch options declared for an event handler at registration time.
+
+    :param sequential: Run one after another with the other sequential handlers of
+        the same event, in registration order, instead of concurrently.
+    :param max_concurrency: Maximum number of concurrent invocations of the handler
+        across all events; unbounded when None.
+    :param retry: How failed invocations are retried before being dead-lettered.
+    :param priority: Lane of the event in the background dispatcher; an event
+        takes the highest priority among its handlers.
+    :param execution: Where the blocking work the handler passes to
+        :func:`offload` runs.
+    """
+
+    sequential: bool = False
+    max_concurrency: int | None = None
+    retry: RetryPolicy = NO_RETRY
+    priority: Priority = Priority.NORMAL
+    execution: ExecutionPolicy = ExecutionPolicy.LOOP
+
+
+DEFAULT_EVENT_HANDLER_OPTIONS = EventHandlerOptions()
+
+
+def command_handler_options(handler: Handler) -> CommandHandlerOptions:
+    """Return the options a command handler was registered with."""
+    return getattr(handler, "__command_options__", DEFAULT_COMMAND_HANDLER_OPTIONS)
+
+
+def event_handler_options(handler: Handler) -> EventHandlerOptions:
+    """Return the options an event handler was registered with.
+
+    Options are stored on the function itself, so wrappers built with
+    `functools.wraps` (e.g. by the injector) keep them.
+    """
+    return getattr(handler, "__event_options__", DEFAULT_EVENT_HANDLER_OPTIONS)
 
-def register_command[T, **P](cmd: type[Command]) -> Callable[[Handler], Handler]:
-    """Register a function as the handler for the given Command type."""
+
+def handler_name(handler: Handler) -> str:
+    """Return the dotted path identifying a handler, e.g. in the dead-letter store."""
+    qualname = getattr(handler, "__qualname__", type(handler).__qualname__)
+    return f"{handler.__module__}.{qualname}"
+
+
+def register_command[T, **P](
+    cmd: type[Command],
+    *,
+    coalesce_key: Callable[..., Hashable] | None = None,
+    timeout: float | None = None,
+    execution: ExecutionPolicy = ExecutionPolicy.LOOP,
+) -> Callable[[Handler], Handler]:
+    """Register a function as the handler for the given Command type.
+
+    :param cmd: The command type to handle.
+    :param coalesce_key: See :class:`CommandHandlerOptions`.
+    :param timeout: See :class:`CommandHandlerOptions`.
+    :param execution: See :class:`CommandHandlerOptions`.
+    """
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be positive.")
+    options = CommandHandlerOptions(
+        coalesce_key=coalesce_key, timeout=timeout, execution=execution
+    )
 
     def innder(func: Handler) -> Handler:
         if cmd in COMMAND_HANDLERS:
             raise RuntimeError
+        func.__command_options__ = options  # type: ignore[attr-defined]
         COMMAND_HANDLERS[cmd] = func
         return func
 
     return innder
 
 
-def register_event[T, **P](ev: type[Event]) -> Callable[[Handler], Handler]:
-    """Register a function as an event handler for the given Event type."""
+def register_batch_command(cmd: type[Command]) -> Callable[[Handler], Handler]:
+    """Register a function as the batch handler for the given Command type.
+
+    The handler receives a :class:`CommandBatch` of such commands and returns one
+    result per command, in order: the resulting entity, or the exception that
+    command failed with.
+    """
+
+    def decorator(func: Handler) -> Handler:
+        if cmd in BATCH_COMMAND_HANDLERS:
+            raise RuntimeError
+        BATCH_COMMAND_HANDLERS[cmd] = func
+        return func
+
+    return decorator
+
+
+def register_event[T, **P](
+    ev: type[Event],
+    *,
+    sequential: bool = False,
+    max_concurrency: int | None = None,
+    retry: RetryPolicy = NO_RETRY,
+    priority: Priority = Priority.NORMAL,
+    execution: ExecutionPolicy = ExecutionPolicy.LOOP,
+) -> Callable[[Handler], Handler]:
+    """Register a function as an event handler for the given Event type.
+
+    :param ev: The event type to handle.
+    :param sequential: See :class:`EventHandlerOptions`.
+    :param max_concurrency: See :class:`EventHandlerOptions`.
+    :param retry: See :class:`EventHandlerOptions`.
+    :param priority: See :class:`EventHandlerOptions`.
+    :param execution: See :class:`EventHandlerOptions`.
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer.")
+    options = EventHandlerOptions(
+        sequential=sequential,
+        max_concurrency=max_concurrency,
+        retry=retry,
+        priority=priority,
+        execution=execution,
+    )
 
     def decorator(func: Handler) -> Handler:
+        func.__event_options__ = options  # type: ignore[attr-defined]
         EVENT_HANDLERS.setdefault(ev, []).append(func)
         return func
 
     return decorator
+
+
+def register_partition_key(
+    ev: type[Event], key: Callable[..., Hashable]
+) -> Callable[..., Hashable]:
+    """Register how events of a type are partitioned by ordered event workers.
+
+    Events with equal keys, such as the same `otp_id`, are handled one after
+    another in submission order; see :class:`PartitionedDispatcher`.
+
+    :param ev: The event type.
+    :param key: Returns the partition key of such an event.
+    """
+    if ev in EVENT_PARTITION_KEYS:
+        raise RuntimeError
+    EVENT_PARTITION_KEYS[ev] = key
+    return key
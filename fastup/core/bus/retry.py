@@ -0,0 +1,46 @@
+import dataclasses
+import random
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """How a failing event handler is retried before its event is dead-lettered.
+
+    Delays grow exponentially from `base_delay` and are capped at `max_delay`.
+    With `jitter`, each delay is drawn uniformly between zero and that value
+    ("full jitter"), so handlers failing together do not retry in lockstep.
+
+    :param max_attempts: Total number of attempts, including the first one.
+    :param base_delay: Delay in seconds before the first retry.
+    :param max_delay: Upper bound in seconds for any delay.
+    :param multiplier: Growth factor applied to the delay after each attempt.
+    :param jitter: Randomize delays as described above.
+    :param retry_on: Exception types worth retrying; anything else fails at once.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_on: tuple[type[Exception], ...] = (Exception,)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer.")
+        if not 0 <= self.base_delay <= self.max_delay:
+            raise ValueError("Expected 0 <= base_delay <= max_delay.")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be at least 1.")
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """Whether to try again after `exc` ended the given (1-based) attempt."""
+        return attempt < self.max_attempts and isinstance(exc, self.retry_on)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the seconds to wait after the given (1-based) failed attempt."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
@@ -0,0 +1,56 @@
+import asyncio
+import typing
+
+
+class SingleFlight:
+    """Shares one execution among concurrent calls with the same key.
+
+    The first call for a key runs the work in its own task; calls arriving while
+    it runs, or within `window` seconds after it succeeded, get the same result
+    instead of running it again. Failures are shared with the calls waiting on
+    them but never remembered, so the next call retries.
+    """
+
+    def __init__(self, window: float = 0.0) -> None:
+        """Initialize the group.
+
+        :param window: Seconds a successful result keeps being reused after the
+            work completed; 0 only coalesces calls that overlap.
+        :raises ValueError: If the window is negative.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative.")
+        self.window = window
+        self._calls: dict[typing.Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        """Number of keys currently running or remembered."""
+        return len(self._calls)
+
+    async def do[T](
+        self, key: typing.Hashable, work: typing.Callable[[], typing.Awaitable[T]]
+    ) -> T:
+        """Return the result of `work()`, shared with the other calls for `key`.
+
+        Cancelling one caller never cancels the shared execution.
+
+        :param key: Identifies calls that may share one execution.
+        :param work: Coroutine function run when no execution can be shared.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(work())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._expire(key, done))
+        return await asyncio.shield(call)
+
+    def _expire(self, key: typing.Hashable, call: asyncio.Future) -> None:
+        """Forget a finished call, right away or once its window has elapsed."""
+        if call.cancelled() or call.exception() is not None or not self.window:
+            self._forget(key, call)
+        else:
+            asyncio.get_running_loop().call_later(self.window, self._forget, key, call)
+
+    def _forget(self, key: typing.Hashable, call: asyncio.Future) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -5,7 +5,14 @@ from fastup.core import enums
 
 @dataclasses.dataclass(frozen=True)
 class Command:
-    """Base class for all domain commands."""
+    """Base class for all domain commands.
+
+    :param timeout: Seconds the command may take to be handled, e.g. set by the
+        route from its own budget; the handler's default applies when None. See
+        :meth:`MessageBus.handle`.
+    """
+
+    timeout: float | None = dataclasses.field(default=None, kw_only=True, compare=False)
 
     @property
     def type(self) -> type["Command"]:  # pragma: no cover
@@ -16,6 +23,21 @@ class Command:
         return self.__class__.__name__
 
 
+@dataclasses.dataclass(frozen=True)
+class CommandBatch[C: Command](Command):
+    """Commands of one type handled together by a batch handler.
+
+    See :meth:`MessageBus.handle_many` and :func:`register_batch_command`.
+    """
+
+    commands: tuple[C, ...]
+
+    @property
+    def name(self) -> str:  # pragma: no cover
+        item = self.commands[0].name if self.commands else "Command"
+        return f"{item}Batch"
+
+
 @dataclasses.dataclass(frozen=True)
 class IssueSignupOtpCommand(Command):
     phone: str
@@ -13,10 +13,36 @@ class Event:
     def name(self) -> str:  # pragma: no cover
         return self.__class__.__name__
 
+    @property
+    def type_key(self) -> str:
+        """Fully qualified event type name, stable across processes."""
+        return f"{type(self).__module__}.{type(self).__qualname__}"
+
+    def to_payload(self) -> dict:
+        """Serialize the event fields to a JSON-compatible dictionary."""
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_payload(cls, type_key: str, payload: dict) -> "Event":
+        """Rebuild an event from its `type_key` and `to_payload()` output.
+
+        :raises LookupError: If no loaded Event subclass matches `type_key`.
+        """
+        pending = list(cls.__subclasses__())
+        while pending:
+            sub = pending.pop()
+            if f"{sub.__module__}.{sub.__qualname__}" == type_key:
+                return sub(**payload)
+            pending.extend(sub.__subclasses__())
+        raise LookupError(f"Unknown event type {type_key!r}")
+
 
 @dataclasses.dataclass(frozen=True)
 class OtpIssuedEvent(Event):
-    """Event fired when a OTP has been created and should be delivered."""
+    """Event fired when a OTP has been created and should be delivered.
+
+    Events may be persisted, so the code is not part of it; see
+    :mod:`fastup.core.otp_codes`.
+    """
 
     otp_id: int
-    code: str
@@ -41,3 +41,19 @@ class AttemptLimitReached(BaseExc):
 
 class AuthFailedExc(BaseExc):
     message = "Authentication failed due to invalid credentials."
+
+
+class DeadlineExceeded(BaseExc):
+    message = "The operation did not complete before its deadline."
+
+
+class ServiceUnavailableExc(BaseExc):
+    message = "A required service is temporarily unavailable."
+
+
+class TooManyRequestsExc(BaseExc):
+    message = "Too many requests are waiting to be served; retry later."
+
+
+class OverloadedExc(ServiceUnavailableExc):
+    message = "The server is overloaded and could not serve the request in time."
@@ -1,13 +1,72 @@
-from .issue_signup_otp_handler import handle_issue_signup_otp
-from .login_handler import handle_login
-from .send_otp_handler import handle_otp_issued_event
-from .signup_handler import handle_signup
-from .verify_otp_handler import handle_verify_otp
+"""Command and event handlers.
+
+Importing this package does not import the handler modules: `MANIFEST` maps
+each message type to the modules registering its handlers, so the bus can
+import them the first time the message is dispatched (see
+:class:`fastup.core.bus.HandlerLoader`), while `load_all` registers every
+handler up front. Handler functions are still importable from here, which
+imports their module on first access.
+"""
+
+import importlib
+import typing
+
+from fastup.core.commands import (
+    IssueSignupOtpCommand,
+    LoginCommand,
+    SignupCommand,
+    VerifyOtpCommand,
+)
+from fastup.core.events import OtpIssuedEvent
+
+if typing.TYPE_CHECKING:
+    from .issue_signup_otp_handler import (
+        handle_issue_signup_otp,
+        handle_issue_signup_otp_batch,
+    )
+    from .login_handler import handle_authentication
+    from .send_otp_handler import handle_otp_issued_event
+    from .signup_handler import handle_signup
+    from .verify_otp_handler import handle_verify_otp
+
+MANIFEST: dict[type, tuple[str, ...]] = {
+    IssueSignupOtpCommand: (f"{__name__}.issue_signup_otp_handler",),
+    SignupCommand: (f"{__name__}.signup_handler",),
+    VerifyOtpCommand: (f"{__name__}.verify_otp_handler",),
+    LoginCommand: (f"{__name__}.login_handler",),
+    OtpIssuedEvent: (f"{__name__}.send_otp_handler",),
+}
+
+_EXPORTS = {
+    "handle_issue_signup_otp": "issue_signup_otp_handler",
+    "handle_issue_signup_otp_batch": "issue_signup_otp_handler",
+    "handle_otp_issued_event": "send_otp_handler",
+    "handle_verify_otp": "verify_otp_handler",
+    "handle_signup": "signup_handler",
+    "handle_authentication": "login_handler",
+}
 
 __all__ = [
     "handle_issue_signup_otp",
+    "handle_issue_signup_otp_batch",
     "handle_otp_issued_event",
     "handle_verify_otp",
     "handle_signup",
-    "handle_login",
+    "handle_authentication",
+    "MANIFEST",
+    "load_all",
 ]
+
+
+def load_all() -> None:
+    """Import every handler module, registering all handlers."""
+    for modules in MANIFEST.values():
+        for module in modules:
+            importlib.import_module(module)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+    return getattr(module, name)
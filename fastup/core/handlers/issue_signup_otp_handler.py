@@ -1,26 +1,33 @@
 import asyncio
 import datetime
-import secrets
-import string
+from typing import Annotated
 
-from fastup.core.bus import register_command
-from fastup.core.commands import IssueSignupOtpCommand
+from fastup.core.bus import register_batch_command, register_command
+from fastup.core.commands import CommandBatch, IssueSignupOtpCommand
 from fastup.core.config import Config
-from fastup.core.entities import Otp
+from fastup.core.entities import Otp, User
 from fastup.core.enums import OtpIntent
 from fastup.core.events import OtpIssuedEvent
 from fastup.core.exceptions import ConflictExc
+from fastup.core.otp_codes import otp_code, otp_codes
 from fastup.core.services import HashService, IDGenerator
 from fastup.core.unit_of_work import UnitOfWork
 
 
-@register_command(IssueSignupOtpCommand)
+@register_command(
+    IssueSignupOtpCommand,
+    # double taps and client retries get the OTP of the in-flight request
+    # instead of issuing (and texting) another one
+    coalesce_key=lambda cmd: (cmd.phone, cmd.ipaddr),
+    # a few lookups and one insert; fail fast instead of queueing on locks
+    timeout=5.0,
+)
 async def handle_issue_signup_otp(
     cmd: IssueSignupOtpCommand,
     config: Config,
     uow: UnitOfWork,
     idgen: IDGenerator,
-    hmac_hasher: HashService,
+    hmac_hasher: Annotated[HashService, "hmac"],
     event_queue: asyncio.Queue,
 ) -> Otp:
     """Handle signup OTP issuance.
@@ -30,40 +37,114 @@ async def handle_issue_signup_otp(
     :param uow: Unit of Work for database transactions.
     :param idgen: ID generator service.
     :param hmach_hasher: Hash service for OTP code.
+    :param event_queue: Queue collecting the events raised by this invocation.
     :returns: The created OTP entity.
     :raises ConflictExc: If phone number is already registered.
     """
     async with uow:
         user = await uow.users.get_by_phone(phone=cmd.phone)
         if user is not None:
-            # This logic can be expanded to handle different user statuses.
-            raise ConflictExc(
-                "A user with this phone number already exists.",
-                extra={
-                    "status": user.status,
-                    "created_at": user.created_at.isoformat(),
-                },
-            )
+            raise _phone_taken(user)
 
         current_utc = datetime.datetime.now(datetime.UTC)
-        otp_code = "".join(
-            secrets.choice(string.digits) for _ in range(config.otp_length)
-        )
         otp_id = await idgen.next_id()
-        otp = Otp(
-            id=otp_id,
-            phone=cmd.phone,
-            intent=OtpIntent.SIGN_UP,
-            otp_hash=hmac_hasher.hash(otp_code),
-            attempts=0,
-            ipaddr=cmd.ipaddr,
-            expires_at=current_utc + config.otp_lifetime,
-        )
+        code = otp_code(hmac_hasher, otp_id, config.otp_length)
+        otp = _new_otp(cmd, config, otp_id, hmac_hasher.hash(code), current_utc)
 
         await uow.otps.add(otp)
-        await uow.commit()
 
-        event = OtpIssuedEvent(otp_id=otp_id, code=otp_code)
+        # raised before commit so a transactional outbox can persist it
+        # atomically with the OTP; in-process dispatch only happens once
+        # the handler has returned successfully.
+        event = OtpIssuedEvent(otp_id=otp.id)
         event_queue.put_nowait(event)
 
+        await uow.commit()
+
         return otp
+
+
+@register_batch_command(IssueSignupOtpCommand)
+async def handle_issue_signup_otp_batch(
+    batch: CommandBatch,
+    config: Config,
+    uow: UnitOfWork,
+    idgen: IDGenerator,
+    hmac_hasher: Annotated[HashService, "hmac"],
+    event_queue: asyncio.Queue,
+) -> list[Otp | ConflictExc]:
+    """Handle many signup OTP issuances in one transaction.
+
+    Registered phones are looked up with a single query, the new codes are
+    derived and hashed together, the new OTPs are written with multi-row inserts and
+    everything is committed once.
+
+    :param batch: Batch of `IssueSignupOtpCommand`.
+    :param config: Domain configuration for OTP settings.
+    :param uow: Unit of Work shared by the whole batch.
+    :param idgen: ID generator service.
+    :param hmac_hasher: Hash service for OTP codes.
+    :param event_queue: Queue collecting the events raised by this invocation.
+    :returns: For each command, the created OTP entity, or a ConflictExc if its
+        phone number is already registered.
+    """
+    commands: tuple[IssueSignupOtpCommand, ...] = batch.commands
+    async with uow:
+        registered = {
+            user.phone: user
+            for user in await uow.users.list_by_phones({c.phone for c in commands})
+        }
+
+        issued = [cmd for cmd in commands if cmd.phone not in registered]
+        otp_ids = [await idgen.next_id() for _ in issued]
+        codes = otp_codes(hmac_hasher, otp_ids, config.otp_length)
+        otp_hashes = iter(hmac_hasher.hash_many(codes))
+        ids = iter(otp_ids)
+
+        current_utc = datetime.datetime.now(datetime.UTC)
+        results: list[Otp | ConflictExc] = []
+        otps: list[Otp] = []
+        for cmd in commands:
+            user = registered.get(cmd.phone)
+            if user is not None:
+                results.append(_phone_taken(user))
+                continue
+            otp = _new_otp(cmd, config, next(ids), next(otp_hashes), current_utc)
+            otps.append(otp)
+            results.append(otp)
+            event_queue.put_nowait(OtpIssuedEvent(otp_id=otp.id))
+
+        await uow.otps.add_many(otps)
+        await uow.commit()
+
+        return results
+
+
+def _phone_taken(user: User) -> ConflictExc:
+    # This logic can be expanded to handle different user statuses.
+    return ConflictExc(
+        "A user with this phone number already exists.",
+        extra={
+            "status": user.status,
+            "created_at": user.created_at.isoformat(),
+        },
+    )
+
+
+def _new_otp(
+    cmd: IssueSignupOtpCommand,
+    config: Config,
+    otp_id: int,
+    otp_hash: str,
+    now: datetime.datetime,
+) -> Otp:
+    """Build a signup OTP for the command, storing the hash of its code."""
+    return Otp(
+        id=otp_id,
+        phone=cmd.phone,
+        intent=OtpIntent.SIGN_UP,
+        otp_hash=otp_hash,
+        attempts=0,
+        ipaddr=cmd.ipaddr,
+        expires_at=now + config.otp_lifetime,
+    )
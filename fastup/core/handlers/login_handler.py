@@ -1,20 +1,55 @@
-from fastup.core.bus import register_command
+from typing import Annotated
+
+from fastup.core.bus import ExecutionPolicy, register_command, run_detached
 from fastup.core.commands import LoginCommand
 from fastup.core.entities import User
 from fastup.core.exceptions import AuthFailedExc
 from fastup.core.services import HashService
-from fastup.core.unit_of_work import UnitOfWork
+from fastup.core.unit_of_work import UnitOfWork, UnitOfWorkFactory
 
 
-@register_command(LoginCommand)
+@register_command(LoginCommand, execution=ExecutionPolicy.PROCESS)
 async def handle_authentication(
-    cmd: LoginCommand, uow: UnitOfWork, arog2_hasher: HashService
+    cmd: LoginCommand,
+    uow: UnitOfWork,
+    argon2_hasher: Annotated[HashService, "argon2"],
+    uow_factory: UnitOfWorkFactory,
 ) -> User:
     async with uow:
         user = await uow.users.get_by_phone(cmd.phone)
         if user is None:
             raise AuthFailedExc
-        if not arog2_hasher.verify(cmd.password, user.pwdhash):
+        if not await argon2_hasher.averify(cmd.password, user.pwdhash):
             raise AuthFailedExc
 
-        return user
+    # hashed with older parameters: upgrade it without delaying the login, in a
+    # unit of work of its own as the command's one ends with the command
+    if argon2_hasher.needs_rehash(user.pwdhash):
+        run_detached(
+            upgrade_pwdhash(
+                uow_factory, argon2_hasher, user.id, cmd.password, user.pwdhash
+            )
+        )
+
+    return user
+
+
+async def upgrade_pwdhash(
+    uow_factory: UnitOfWorkFactory,
+    argon2_hasher: HashService,
+    user_id: int,
+    password: str,
+    verified_pwdhash: str,
+) -> None:
+    """Replace the user's password hash by one made with the current parameters.
+
+    The stored hash is left alone if it changed since `password` was verified
+    against it, e.g. after a password change or a concurrent upgrade.
+    """
+    pwdhash = await argon2_hasher.ahash(password)
+    async with uow_factory() as uow:
+        user = await uow.users.get(user_id)
+        if user is None or user.pwdhash != verified_pwdhash:
+            return
+        user.pwdhash = pwdhash
+        await uow.commit()
@@ -1,20 +1,42 @@
 import datetime
 import logging
+from typing import Annotated
 
-from fastup.core.bus import register_event
+from fastup.core.bus import (
+    Priority,
+    RetryPolicy,
+    register_event,
+    register_partition_key,
+)
+from fastup.core.config import Config
 from fastup.core.enums import EventType, OtpStatus
 from fastup.core.events import OtpIssuedEvent
 from fastup.core.exceptions import SmsSendFailed
-from fastup.core.services import Publisher, SMSService
+from fastup.core.otp_codes import otp_code
+from fastup.core.services import HashService, Publisher, SMSService
 from fastup.core.unit_of_work import UnitOfWork
 
 logger = logging.getLogger(__name__)
 
+# a resend must never overtake (nor race) the delivery of the same OTP
+register_partition_key(OtpIssuedEvent, lambda event: event.otp_id)
 
-@register_event(OtpIssuedEvent)
+
+@register_event(
+    OtpIssuedEvent,
+    retry=RetryPolicy(
+        max_attempts=5,
+        base_delay=1.0,
+        retry_on=(SmsSendFailed, ConnectionError, TimeoutError),
+    ),
+    # users are waiting on this SMS to finish signing up
+    priority=Priority.CRITICAL,
+)
 async def handle_otp_issued_event(
     event: OtpIssuedEvent,
+    config: Config,
     uow: UnitOfWork,
+    hmac_hasher: Annotated[HashService, "hmac"],
     sms_service: SMSService,
     publisher: Publisher,
 ) -> None:
@@ -22,10 +44,13 @@ async def handle_otp_issued_event(
 
     Processes an OtpIssuedEvent by retrieving the corresponding OTP record,
     sending the OTP code via SMS using the provided SMS service, and updating
-    the OTP status and metadata in the database.
+    the OTP status and metadata in the database. OTPs no longer in the ISSUED
+    status were already sent and are skipped, so retrying is safe.
 
-    :param event: OtpIssuedEvent instance containing `otp_id` and `code`.
+    :param event: OtpIssuedEvent instance containing `otp_id`.
+    :param config: Domain configuration for the OTP code length.
     :param uow: UnitOfWork used to load the OTP record and persist status/metadata.
+    :param hmac_hasher: Hash service deriving the OTP code.
     :param sms_service: SMSService implementation used to deliver the SMS.
     :param publisher: Publisher for publishing sent notifications.
     :raises SmsSendFailed: If the SMS sending fails.
@@ -40,28 +65,25 @@ async def handle_otp_issued_event(
                 f"OTP record not found for otp_id={event.otp_id}; skipping SMS send"
             )
             return
+        # retries and redeliveries must not text the user again
+        if otp.status != OtpStatus.ISSUED:
+            logger.info(f"OTP already sent for otp_id={event.otp_id}; skipping")
+            return
 
         try:
             message_id = await sms_service.send_otp(
-                phone=otp.phone, otp_code=event.code, intent=otp.intent
-            )
-            await publisher.publish(
-                type=EventType.NOTIFICATION,
-                payload={
-                    "event": "otp_sent",  # alternative to "name"
-                    "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
-                    "data": {
-                        "otp_id": event.otp_id,
-                        "phone": f"***{otp.phone[-4:]}",  # mask for privacy
-                    },
-                },
+                phone=otp.phone,
+                otp_code=otp_code(hmac_hasher, otp.id, config.otp_length),
+                intent=otp.intent,
             )
         except SmsSendFailed as e:
             logger.error(
-                f"Failed to send OTP SMS for otp_id={event.otp_id} phone={otp.phone}; exc={e}"
+                f"Failed to send OTP SMS for otp_id={event.otp_id} "
+                f"phone={otp.phone}; exc={e}"
             )
             raise
 
+        # recorded before anything else can fail and retry the handler
         otp.status = OtpStatus.SENT
         md = otp.metadata.copy()
         md["otp_sent_at"] = datetime.datetime.now(datetime.UTC).isoformat()
@@ -72,3 +94,15 @@ async def handle_otp_issued_event(
         logger.info(
             f"OTP sent and status updated for otp_id={event.otp_id} phone={otp.phone}"
         )
+
+    await publisher.publish(
+        type=EventType.NOTIFICATION,
+        payload={
+            "event": "otp_sent",  # alternative to "name"
+            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+            "data": {
+                "otp_id": event.otp_id,
+                "phone": f"***{otp.phone[-4:]}",  # mask for privacy
+            },
+        },
+    )
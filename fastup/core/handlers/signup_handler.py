@@ -1,17 +1,34 @@
-from fastup.core.bus import register_command
+from typing import Annotated
+
+from fastup.core.bus import ExecutionPolicy, register_command
 from fastup.core.commands import SignupCommand
 from fastup.core.entities.user import User
 from fastup.core.enums import OtpStatus
-from fastup.core.exceptions import ConflictExc
+from fastup.core.exceptions import ConflictExc, NotFoundExc
 from fastup.core.services import HashService
 from fastup.core.services.id_generator import IDGenerator
 from fastup.core.unit_of_work import UnitOfWork
 
 
-@register_command(SignupCommand)
+# Argon2 hashes on the process pool, which runs on threads without the GIL
+@register_command(SignupCommand, execution=ExecutionPolicy.PROCESS)
 async def handle_signup(
-    cmd: SignupCommand, uow: UnitOfWork, argon2_hasher: HashService, idgen: IDGenerator
+    cmd: SignupCommand,
+    uow: UnitOfWork,
+    argon2_hasher: Annotated[HashService, "argon2"],
+    idgen: IDGenerator,
 ) -> User:
+    # Argon2 takes far longer than the transaction, so the OTP is only checked
+    # here and the password hashed before its row is locked
+    async with uow:
+        otp = await uow.otps.get(
+            cmd.otp_id, status=OtpStatus.CONSUMED, ipaddr=cmd.ipaddr
+        )
+    if otp is None:
+        raise NotFoundExc("Otp does not exist.")
+    pwdhash = await argon2_hasher.ahash(cmd.password)
+    user_id = await idgen.next_id()
+
     async with uow:
         otp = await uow.otps.get_for_update(
             id=cmd.otp_id, status=OtpStatus.CONSUMED, ipaddr=cmd.ipaddr
@@ -21,12 +38,10 @@ async def handle_signup(
         otp_md["used_for_signup_ip"] = cmd.ipaddr
         otp.metadata = otp_md
 
-        user_id = await idgen.next_id()
-
         user = User(
             id=user_id,
             phone=otp.phone,
-            pwdhash=argon2_hasher.hash(cmd.password),
+            pwdhash=pwdhash,
             sex=cmd.sex,
             fname=cmd.first_name,
             lname=cmd.last_name,
@@ -1,5 +1,6 @@
 import datetime
 import logging
+from typing import Annotated
 
 from fastup.core.bus import register_command
 from fastup.core.commands import VerifyOtpCommand
@@ -18,7 +19,7 @@ async def handle_verify_otp(
     cmd: VerifyOtpCommand,
     config: Config,
     uow: UnitOfWork,
-    hmac_hasher: HashService,
+    hmac_hasher: Annotated[HashService, "hmac"],
 ) -> Otp:
     """Handle OTP verification requests.
 
@@ -0,0 +1,208 @@
+import bisect
+import math
+import typing
+
+type Labels = tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Metric:
+    """Base class of the metric families rendered by :class:`MetricsRegistry`.
+
+    Values are keyed by a tuple of label values, in the order of `labelnames`.
+    """
+
+    type: typing.ClassVar[str]
+
+    def __init__(self, name: str, help: str, labelnames: Labels = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+
+    @property
+    def family(self) -> str:
+        """Name of the metric in its HELP and TYPE lines."""
+        return self.name
+
+    def samples(self) -> typing.Iterator[tuple[str, dict[str, str], float]]:
+        """Yield `(sample name, labels, value)` for every labelled series."""
+        raise NotImplementedError
+
+    def _labels(self, values: Labels) -> dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Labels = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0)
+
+    @property
+    def family(self) -> str:
+        return f"{self.name}_total"
+
+    def samples(self) -> typing.Iterator[tuple[str, dict[str, str], float]]:
+        for labels, value in self._values.items():
+            yield self.family, self._labels(labels), value
+
+
+class Gauge(Metric):
+    """Value that can go up and down, or be read from a callback at render time."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Labels = (),
+        collect: typing.Callable[[], typing.Iterable[tuple[Labels, float]]]
+        | None = None,
+    ) -> None:
+        """Initialize the gauge.
+
+        :param collect: Optional callback returning `(labels, value)` pairs; when
+            given, it replaces the values set with `set`/`inc`/`dec`.
+        """
+        super().__init__(name, help, labelnames)
+        self._values: dict[Labels, float] = {}
+        self._collect = collect
+
+    def set(self, labels: Labels, value: float) -> None:
+        self._values[labels] = value
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> typing.Iterator[tuple[str, dict[str, str], float]]:
+        values = self._collect() if self._collect else self._values.items()
+        for labels, value in values:
+            yield self.name, self._labels(labels), value
+
+
+class Histogram(Metric):
+    """Distribution of observed values over fixed cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Labels = (),
+        buckets: typing.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per series: [count per bucket..., count above the last bucket], sum
+        self._series: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def count(self, labels: Labels = ()) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> typing.Iterator[tuple[str, dict[str, str], float]]:
+        for labels, (counts, total) in self._series.items():
+            base = self._labels(labels)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", base | {"le": _format(bound)}, cumulative
+            yield f"{self.name}_sum", base, total[0]
+            yield f"{self.name}_count", base, cumulative
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register[M: Metric](self, metric: M) -> M:
+        """Add a metric, or return the one already registered under its name.
+
+        :raises ValueError: If a metric of another type uses the same name.
+        """
+        existing = self._metrics.get(metric.name)
+        if existing is None:
+            self._metrics[metric.name] = metric
+            return metric
+        if type(existing) is not type(metric):
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        return typing.cast(M, existing)
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric, if registered."""
+        self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text format (version 0.0.4)."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.family} {metric.help}")
+            lines.append(f"# TYPE {metric.family} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+"""Process-wide default registry, exposed by the `/metrics` endpoint."""
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = (f'{k}="{_escape(v)}"' for k, v in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,28 @@
+"""OTP codes, derived from the id of their OTP so they are never stored.
+
+A code is the HMAC of its OTP's id reduced to decimal digits, as in HOTP
+(RFC 4226). Only the OTP id travels in events, through the outbox, the event
+stream and dead letters; the SMS handler derives the code again to send it.
+"""
+
+import typing
+
+from fastup.core.services import HashService
+
+
+def otp_code(hmac_hasher: HashService, otp_id: int, length: int) -> str:
+    """Return the code of an OTP.
+
+    :param hmac_hasher: Keyed hash service returning hex digests.
+    :param otp_id: The OTP's id.
+    :param length: Number of digits.
+    """
+    return otp_codes(hmac_hasher, [otp_id], length)[0]
+
+
+def otp_codes(
+    hmac_hasher: HashService, otp_ids: typing.Sequence[int], length: int
+) -> list[str]:
+    """Return the codes of several OTPs with one batch of hashes."""
+    digests = hmac_hasher.hash_many([f"otp-code:{otp_id}" for otp_id in otp_ids])
+    return [str(int(digest, 16) % 10**length).zfill(length) for digest in digests]
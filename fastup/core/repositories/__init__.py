@@ -1,9 +1,15 @@
 from .base_repo import Repository
+from .dead_letter_repo import DeadLetter, DeadLetterRepo
 from .otp_repo import OtpRepo
+from .outbox_repo import OutboxMessage, OutboxRepo
 from .user_repo import UserRepo
 
 __all__ = [
     "Repository",
     "UserRepo",
     "OtpRepo",
+    "OutboxRepo",
+    "OutboxMessage",
+    "DeadLetterRepo",
+    "DeadLetter",
 ]
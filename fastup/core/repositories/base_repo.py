@@ -1,4 +1,5 @@
 import abc
+import typing
 
 
 class Repository[T](abc.ABC):
@@ -18,6 +19,14 @@ class Repository[T](abc.ABC):
         """Adds a new entity to the repository."""
         raise NotImplementedError
 
+    async def add_many(self, entities: typing.Sequence[T]) -> None:
+        """Adds several new entities to the repository.
+
+        :param entities: The entities to add, written together on commit.
+        """
+        for entity in entities:
+            await self.add(entity)
+
     @abc.abstractmethod
     async def delete(self, entity: T) -> None:
         """Deletes an entity from the repository."""
@@ -0,0 +1,54 @@
+import abc
+import typing
+
+from fastup.core.events import Event
+
+
+class DeadLetter(typing.NamedTuple):
+    """A serialized event whose handler kept failing.
+
+    See :meth:`Event.to_payload` and :meth:`Event.from_payload`.
+    """
+
+    id: int
+    event_type: str
+    payload: dict
+    handler: str
+    error: str
+    attempts: int
+
+
+class DeadLetterRepo(abc.ABC):
+    """Repository for events a handler gave up on."""
+
+    @abc.abstractmethod
+    async def add(self, event: Event, handler: str, error: str, attempts: int) -> None:
+        """Store a failed delivery in the current transaction.
+
+        :param event: The event that could not be handled.
+        :param handler: Dotted path of the failing handler.
+        :param error: Description of the last error.
+        :param attempts: Number of attempts made so far.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def fetch(
+        self, limit: int, ids: typing.Sequence[int] | None = None
+    ) -> list[DeadLetter]:
+        """Return up to `limit` dead letters, oldest first.
+
+        :param limit: Maximum number of dead letters to return.
+        :param ids: Restrict the result to these ids when given.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def record_failure(self, id: int, error: str) -> None:
+        """Count one more failed attempt for a dead letter and keep its last error."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete_many(self, ids: typing.Sequence[int]) -> None:
+        """Delete the given dead letters in one statement."""
+        raise NotImplementedError
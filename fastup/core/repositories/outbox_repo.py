@@ -0,0 +1,61 @@
+import abc
+import datetime
+import typing
+
+from fastup.core.events import Event
+
+
+class OutboxMessage(typing.NamedTuple):
+    """A serialized event stored in the outbox.
+
+    See :meth:`Event.to_payload` and :meth:`Event.from_payload`.
+    """
+
+    id: int
+    event_type: str
+    payload: dict
+    attempts: int = 0  # failed deliveries so far
+
+
+class OutboxRepo(abc.ABC):
+    """Repository for events waiting in the transactional outbox."""
+
+    @abc.abstractmethod
+    async def add_many(self, events: typing.Sequence[Event]) -> None:
+        """Store events in the current transaction.
+
+        :param events: Events to store; nothing is written when empty.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def claim(self, limit: int) -> list[OutboxMessage]:
+        """Lock and return up to `limit` pending messages, oldest first.
+
+        Rows locked by another transaction are skipped, so concurrent relays
+        never claim the same message, and so are messages waiting to be retried.
+
+        :param limit: Maximum number of messages to claim.
+        :return: The claimed messages.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def retry_later(
+        self, retries: typing.Mapping[int, datetime.datetime]
+    ) -> None:
+        """Count a failed delivery of messages and set when to deliver them again.
+
+        :param retries: Time of the next attempt by message id.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete_many(self, ids: typing.Sequence[int]) -> None:
+        """Delete the given messages in one statement."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def mark_dispatched(self, ids: typing.Sequence[int]) -> None:
+        """Mark the given messages as dispatched in one statement."""
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 import abc
+import typing
 
 from fastup.core.entities import User
 
@@ -22,3 +23,15 @@ class UserRepo(Repository[User], abc.ABC):
         :returns: The user if found according to the filter, otherwise None.
         """
         raise NotImplementedError
+
+    @abc.abstractmethod
+    async def list_by_phones(
+        self, phones: typing.Iterable[str], only_active: bool = True
+    ) -> list[User]:
+        """Retrieve the users registered with any of the given phone numbers.
+
+        :param phones: The phone numbers to search for.
+        :param only_active: If True (default), only return active users.
+        :returns: The matching users, in no particular order.
+        """
+        raise NotImplementedError
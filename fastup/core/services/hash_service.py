@@ -1,4 +1,5 @@
 import abc
+import typing
 
 
 class HashService(abc.ABC):
@@ -12,11 +13,7 @@ class HashService(abc.ABC):
         :raises TypeError: If the input `text` is not a string.
         :raises ValueError: If the input `text` is empty.
         """
-        if not isinstance(text, str):
-            raise TypeError("The input text must be a string.")
-        if not text:
-            raise ValueError("The input text cannot be empty.")
-
+        self._check_text(text)
         return self._hash_text(text)
 
     def verify(self, text: str, hashed: str) -> bool:
@@ -28,13 +25,85 @@ class HashService(abc.ABC):
         :raises TypeError: If either `text` or `hashed` is not a string.
         :raises ValueError: If either `text` or `hashed` is empty.
         """
-        if not isinstance(text, str) or not isinstance(hashed, str):
-            raise TypeError("Both text and hashed inputs must be strings.")
-        if not text or not hashed:
-            raise ValueError("Both text and hashed inputs cannot be empty.")
-
+        self._check_pair(text, hashed)
         return self._verify_hash(text, hashed)
 
+    def hash_many(self, texts: typing.Sequence[str]) -> list[str]:
+        """Validates and hashes several texts, in order.
+
+        Cheaper than calling :meth:`hash` for each text when the implementation
+        shares work between them.
+
+        :param texts: The plain-text strings to hash.
+        :return: The hash of each text.
+        :raises TypeError: If any text is not a string.
+        :raises ValueError: If any text is empty.
+        """
+        for text in texts:
+            self._check_text(text)
+        return self._hash_texts(texts)
+
+    def verify_many(self, pairs: typing.Sequence[tuple[str, str]]) -> list[bool]:
+        """Verifies several texts against their hashes, in order.
+
+        :param pairs: (text, hashed) pairs.
+        :return: For each pair, whether the text matches the hash.
+        :raises TypeError: If any text or hash is not a string.
+        :raises ValueError: If any text or hash is empty.
+        """
+        for text, hashed in pairs:
+            self._check_pair(text, hashed)
+        return self._verify_hashes(pairs)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """Tell whether `hashed` should be replaced by a new hash of its text.
+
+        True when it was made with weaker parameters than the current ones, in
+        which case the text is hashed again the next time it is known, e.g. when
+        a password verifies.
+
+        :param hashed: A hash previously returned by this service.
+        """
+        return False
+
+    async def ahash(self, text: str) -> str:
+        """Like :meth:`hash`, without blocking the event loop for slow hashes.
+
+        :raises TypeError: If the input `text` is not a string.
+        :raises ValueError: If the input `text` is empty.
+        """
+        self._check_text(text)
+        return await self._ahash_text(text)
+
+    async def averify(self, text: str, hashed: str) -> bool:
+        """Like :meth:`verify`, without blocking the event loop for slow hashes.
+
+        :raises TypeError: If either `text` or `hashed` is not a string.
+        :raises ValueError: If either `text` or `hashed` is empty.
+        """
+        self._check_pair(text, hashed)
+        return await self._averify_hash(text, hashed)
+
+    async def ahash_many(self, texts: typing.Sequence[str]) -> list[str]:
+        """Like :meth:`hash_many`, without blocking the event loop for slow hashes.
+
+        :raises TypeError: If any text is not a string.
+        :raises ValueError: If any text is empty.
+        """
+        for text in texts:
+            self._check_text(text)
+        return await self._ahash_texts(texts)
+
+    async def averify_many(self, pairs: typing.Sequence[tuple[str, str]]) -> list[bool]:
+        """Like :meth:`verify_many`, without blocking the event loop for slow hashes.
+
+        :raises TypeError: If any text or hash is not a string.
+        :raises ValueError: If any text or hash is empty.
+        """
+        for text, hashed in pairs:
+            self._check_pair(text, hashed)
+        return await self._averify_hashes(pairs)
+
     @abc.abstractmethod
     def _hash_text(self, text: str) -> str:
         """Performs the actual hashing logic."""
@@ -44,3 +113,43 @@ class HashService(abc.ABC):
     def _verify_hash(self, text: str, hashed: str) -> bool:
         """Performs the actual verification logic."""
         raise NotImplementedError
+
+    async def _ahash_text(self, text: str) -> str:
+        """Hashes on the event loop; slow hashers run it elsewhere."""
+        return self._hash_text(text)
+
+    async def _averify_hash(self, text: str, hashed: str) -> bool:
+        """Verifies on the event loop; slow hashers run it elsewhere."""
+        return self._verify_hash(text, hashed)
+
+    def _hash_texts(self, texts: typing.Sequence[str]) -> list[str]:
+        """Hashes one text after the other."""
+        return [self._hash_text(text) for text in texts]
+
+    def _verify_hashes(self, pairs: typing.Sequence[tuple[str, str]]) -> list[bool]:
+        """Verifies one pair after the other."""
+        return [self._verify_hash(text, hashed) for text, hashed in pairs]
+
+    async def _ahash_texts(self, texts: typing.Sequence[str]) -> list[str]:
+        """Hashes on the event loop; slow hashers run it elsewhere."""
+        return self._hash_texts(texts)
+
+    async def _averify_hashes(
+        self, pairs: typing.Sequence[tuple[str, str]]
+    ) -> list[bool]:
+        """Verifies on the event loop; slow hashers run it elsewhere."""
+        return self._verify_hashes(pairs)
+
+    @staticmethod
+    def _check_text(text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("The input text must be a string.")
+        if not text:
+            raise ValueError("The input text cannot be empty.")
+
+    @staticmethod
+    def _check_pair(text: str, hashed: str) -> None:
+        if not isinstance(text, str) or not isinstance(hashed, str):
+            raise TypeError("Both text and hashed inputs must be strings.")
+        if not text or not hashed:
+            raise ValueError("Both text and hashed inputs cannot be empty.")
@@ -1,6 +1,8 @@
 import abc
+import asyncio
 import logging
 
+from fastup.core.bus.deadline import time_left
 from fastup.core.enums import OtpIntent
 from fastup.core.exceptions import SmsSendFailed
 
@@ -8,10 +10,14 @@ from fastup.core.exceptions import SmsSendFailed
 class SMSService(abc.ABC):
     """Abstract base for SMS delivery implementations."""
 
-    def __init__(self) -> None:
-        """Initialize the SMS service with a logger factory."""
+    def __init__(self, timeout: float | None = None) -> None:
+        """Initialize the SMS service with a logger factory.
+
+        :param timeout: Seconds a `send_sms` call may take before it is cancelled,
+            further bounded by the current deadline; unbounded when None."""
 
         self.logger = logging.getLogger(__name__)
+        self.timeout = timeout
 
     async def send_otp(self, *, phone: str, otp_code: str, intent: OtpIntent) -> int:
         """Send a one-time password (OTP) to a phone number.
@@ -20,17 +26,26 @@ class SMSService(abc.ABC):
         :param otp_code: The one-time password code to deliver.
         :param intent: The intent/purpose of the OTP (used for message text).
         :return: Provider-specific integer result (e.g. message id).
-        :raises SmsSendFailed: If the underlying send_sms call fails."""
+        :raises SmsSendFailed: If the underlying send_sms call fails or times out."""
 
         text = f"Your OTP code for {intent} is {otp_code}"
         try:
-            result = await self.send_sms(phone, text)
+            async with asyncio.timeout(self._time_budget()):
+                result = await self.send_sms(phone, text)
         except Exception as exc:
             self.logger.error("Failed to send SMS to %s for intent=%s", phone, intent)
             raise SmsSendFailed("Failed to send SMS message.") from exc
 
         return result
 
+    def _time_budget(self) -> float | None:
+        """Seconds allowed for one `send_sms` call, None when unbounded."""
+        left = time_left()
+        if left is None:
+            return self.timeout
+        left = max(left, 0)
+        return left if self.timeout is None else min(left, self.timeout)
+
     @abc.abstractmethod
     async def send_sms(self, phone: str, text: str) -> int:
         """Perform the actual SMS delivery.
@@ -12,6 +12,8 @@ class UnitOfWork(abc.ABC):
 
     users: repositories.UserRepo
     otps: repositories.OtpRepo
+    outbox: repositories.OutboxRepo
+    dead_letters: repositories.DeadLetterRepo
 
     async def __aenter__(self) -> typing.Self:
         """Enter the async context and return the UoW instance."""
@@ -26,13 +28,19 @@ class UnitOfWork(abc.ABC):
 
         :raises UnitOfWorkContextExc: If the UoW is not ready.
         :raises ConflictExc: If a conflict occurs during commit.
+        :raises DeadlineExceeded: If the commit outlived the current deadline.
+        :raises ServiceUnavailableExc: If the database could not be reached in time.
         :raises InternalExc: If any unexpected error occurs during commit.
         """
         if not self.is_ready:
             raise exceptions.UnitOfWorkContextExc
         try:
             await self._commit()
-        except exceptions.ConflictExc:
+        except (
+            exceptions.ConflictExc,
+            exceptions.DeadlineExceeded,
+            exceptions.ServiceUnavailableExc,
+        ):
             raise
         except Exception as exc:
             await self.rollback()
@@ -63,3 +71,9 @@ class UnitOfWork(abc.ABC):
     @abc.abstractmethod
     async def _rollback(self) -> None:
         raise NotImplementedError
+
+
+class UnitOfWorkFactory(typing.Protocol):
+    """Builds a fresh unit of work, for work outliving the command's own."""
+
+    def __call__(self) -> UnitOfWork: ...
@@ -0,0 +1,69 @@
+"""Inspect and replay dead-lettered events.
+
+Usage:
+    python -m fastup.dead_letters list [--limit N]
+    python -m fastup.dead_letters replay [--limit N] [--id ID ...]
+
+Listing only needs the database: the bus and its handlers are imported and
+built by `replay` alone, so the CLI starts quickly.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from fastup.core.bus import DeadLetterStore
+from fastup.infra.pydantic_config import get_config
+from fastup.infra.sql_unit_of_work import SQLUnitOfwWork
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s: %(message)s [%(module)s]",
+    datefmt="%H:%M:%S",
+)
+
+
+async def list_letters(limit: int) -> None:
+    """Print the oldest dead letters."""
+    store = DeadLetterStore(SQLUnitOfwWork)
+    for letter in await store.list(limit):
+        print(
+            f"{letter.id}\t{letter.event_type}\t{letter.handler}\t"
+            f"attempts={letter.attempts}\t{letter.error}"
+        )
+
+
+async def replay_letters(limit: int, ids: list[int] | None) -> None:
+    """Redeliver dead letters to their failing handler."""
+    from fastup.bootstrap import bootstrap
+
+    bus = bootstrap(get_config())
+    store = DeadLetterStore(SQLUnitOfwWork)
+    try:
+        replayed, failed = await store.replay(bus.redeliver, limit=limit, ids=ids)
+    finally:
+        await bus.stop()
+    print(f"replayed={replayed} failed={failed}")
+
+
+def main():
+    """Entry point of the dead-letter CLI."""
+    parser = argparse.ArgumentParser(
+        description="Inspect and replay dead-lettered events."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    list_cmd = commands.add_parser("list", help="show dead letters, oldest first")
+    list_cmd.add_argument("--limit", type=int, default=100)
+    replay_cmd = commands.add_parser("replay", help="redeliver dead letters")
+    replay_cmd.add_argument("--limit", type=int, default=100)
+    replay_cmd.add_argument("--id", type=int, action="append", dest="ids")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        asyncio.run(list_letters(args.limit))
+    else:
+        asyncio.run(replay_letters(args.limit, args.ids))
+
+
+if __name__ == "__main__":
+    main()
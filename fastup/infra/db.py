@@ -1,28 +1,52 @@
+"""Database engine, session factory and mapper registry.
+
+The engine and the session factory are created on first use, so importing
+this module neither reads the configuration nor loads the asyncpg driver.
+"""
+
+import functools
+
 from sqlalchemy import URL
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import registry
 
 from .pydantic_config import get_config
 
-config = get_config()
+mapper_registry = registry()
+
 
-DB_URL = URL.create(
-    "postgresql+asyncpg",
-    username=config.db_user,
-    password=config.db_password,
-    host=config.db_host,
-    port=config.db_port,
-    database=config.db_name,
-)
+def database_url() -> URL:
+    """Return the URL of the configured Postgres database."""
+    config = get_config()
+    return URL.create(
+        "postgresql+asyncpg",
+        username=config.db_user,
+        password=config.db_password,
+        host=config.db_host,
+        port=config.db_port,
+        database=config.db_name,
+    )
 
-engine = create_async_engine(
-    DB_URL,
-    pool_size=config.db_pool_size,
-    pool_timeout=config.db_pool_timeout,
-    max_overflow=config.db_pool_max_overflow,
-    echo=config.db_echo_sql,
-)
 
-sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+@functools.cache
+def get_engine() -> AsyncEngine:
+    """Return the application's engine, created on first use."""
+    config = get_config()
+    return create_async_engine(
+        database_url(),
+        pool_size=config.db_pool_size,
+        pool_timeout=config.db_pool_timeout,
+        max_overflow=config.db_pool_max_overflow,
+        echo=config.db_echo_sql,
+    )
 
-mapper_registry = registry()
+
+@functools.cache
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory bound to :func:`get_engine`, created on first use."""
+    return async_sessionmaker(bind=get_engine(), expire_on_commit=False)
@@ -1,16 +1,19 @@
+import asyncio
+import contextlib
 import hashlib
 import hmac
 import secrets
+import typing
 
 import pwdlib
 import pwdlib.exceptions
+from pwdlib.hashers.argon2 import Argon2Hasher
 
+from fastup.core.bus import AdmissionController, OffloadExecutor, bound_executor
 from fastup.core.services import HashService
 
 from .pydantic_config import get_config
 
-config = get_config()
-
 
 class HMACHasher(HashService):
     """
@@ -20,12 +23,17 @@ class HMACHasher(HashService):
     (MACs) for tokens or other authenticated messages.
     """
 
-    def __init__(self, key: bytes = config.hmac_secret_key) -> None:
-        self._key: bytes = key
+    def __init__(self, key: bytes | None = None) -> None:
+        """:param key: Secret key; defaults to the configured `hmac_secret_key`."""
+        self._key: bytes = key if key is not None else get_config().hmac_secret_key
+        # keyed once: copying it skips deriving the inner and outer pads again
+        self._keyed = hmac.new(self._key, digestmod=hashlib.sha256)
 
     def _hash_text(self, text: str) -> str:
         """Computes the HMAC-SHA256 signature for the given text."""
-        return hmac.new(self._key, text.encode("utf-8"), hashlib.sha256).hexdigest()
+        mac = self._keyed.copy()
+        mac.update(text.encode("utf-8"))
+        return mac.hexdigest()
 
     def _verify_hash(self, text: str, hashed: str) -> bool:
         """Verifies an HMAC signature using a secure, constant-time comparison."""
@@ -39,22 +47,163 @@ class Argon2PasswordHasher(HashService):
 
     This class uses the `pwdlib` library to securely hash and verify passwords,
     automatically handling salt generation and algorithm parameter management.
+
+    One hash takes tens of milliseconds of CPU, so `ahash` and `averify` run it
+    on the given executor, else on the one bound by the execution policy of the
+    calling handler (see :func:`offload`), and on a thread otherwise.
+    An admission controller sheds those calls when too many are waiting.
     """
 
-    def __init__(self):
-        """Initializes the password hasher with recommended Argon2 settings."""
-        self.hasher = pwdlib.PasswordHash.recommended()
+    def __init__(
+        self,
+        executor: OffloadExecutor | None = None,
+        admission: AdmissionController | None = None,
+        time_cost: int | None = None,
+        memory_cost: int | None = None,
+        parallelism: int | None = None,
+    ):
+        """Initializes the password hasher with the configured Argon2 settings.
+
+        :param executor: Runs the hashes of `ahash` and `averify`; defaults to
+            the executor of the calling handler's policy.
+        :param admission: Admits the hashes of `ahash` and `averify`, which then
+            raise :class:`TooManyRequestsExc` or :class:`OverloadedExc` when
+            rejected; unbounded when None.
+        :param time_cost: Iterations; defaults to `argon2_time_cost`.
+        :param memory_cost: KiB of memory; defaults to `argon2_memory_cost_kib`.
+        :param parallelism: Lanes; defaults to `argon2_parallelism`.
+        """
+        if time_cost is None or memory_cost is None or parallelism is None:
+            config = get_config()
+            if time_cost is None:
+                time_cost = config.argon2_time_cost
+            if memory_cost is None:
+                memory_cost = config.argon2_memory_cost_kib
+            if parallelism is None:
+                parallelism = config.argon2_parallelism
+        self.hasher = pwdlib.PasswordHash(
+            (
+                Argon2Hasher(
+                    time_cost=time_cost,
+                    memory_cost=memory_cost,
+                    parallelism=parallelism,
+                ),
+            )
+        )
+        self.executor = executor
+        self.admission = admission
 
     def _hash_text(self, text: str) -> str:
         """Hashes a password using Argon2 with an automatically generated salt."""
-        return self.hasher.hash(text)
+        return argon2_hash(self.hasher, text)
 
     def _verify_hash(self, text: str, hashed: str) -> bool:
         """Verifies a password against a stored Argon2 hash.
 
         Gracefully handles unrecognized hash formats by returning False.
         """
+        return argon2_verify(self.hasher, text, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """Tell whether `hashed` was made with other parameters than the current ones.
+
+        Unrecognized hashes never need one, as they never verify either.
+        """
         try:
-            return self.hasher.verify(text, hashed)
-        except pwdlib.exceptions.UnknownHashError:
+            return self.hasher.current_hasher.check_needs_rehash(hashed)
+        except (ValueError, pwdlib.exceptions.UnknownHashError):
             return False
+
+    async def _ahash_text(self, text: str) -> str:
+        return await self._offload(argon2_hash, self.hasher, text)
+
+    async def _averify_hash(self, text: str, hashed: str) -> bool:
+        return await self._offload(argon2_verify, self.hasher, text, hashed)
+
+    async def _ahash_texts(self, texts: typing.Sequence[str]) -> list[str]:
+        async with self._admit(len(texts)):
+            chunks = await asyncio.gather(
+                *(
+                    self._run(argon2_hash_many, self.hasher, chunk)
+                    for chunk in self._chunks(texts)
+                )
+            )
+        return [hashed for chunk in chunks for hashed in chunk]
+
+    async def _averify_hashes(
+        self, pairs: typing.Sequence[tuple[str, str]]
+    ) -> list[bool]:
+        async with self._admit(len(pairs)):
+            chunks = await asyncio.gather(
+                *(
+                    self._run(argon2_verify_many, self.hasher, chunk)
+                    for chunk in self._chunks(pairs)
+                )
+            )
+        return [valid for chunk in chunks for valid in chunk]
+
+    def _chunks[T](self, items: typing.Sequence[T]) -> list[typing.Sequence[T]]:
+        """Split `items` into one contiguous chunk per executor worker.
+
+        Each chunk is a single call, which pickles the hasher once and keeps
+        every worker busy without flooding the executor's queue.
+        """
+        executor = self._executor()
+        workers = executor.workers if executor else 1
+        size = -(-len(items) // workers)  # ceiling division
+        return [items[i : i + size] for i in range(0, len(items), size or 1)]
+
+    async def _offload[T](self, fn: typing.Callable[..., T], *args: typing.Any) -> T:
+        """Run `fn(*args)` once admitted, on the executor or a thread."""
+        async with self._admit(1):
+            return await self._run(fn, *args)
+
+    def _admit(self, hashes: int) -> typing.AsyncContextManager[None]:
+        """Admit `hashes` hashes at once, each taking a slot of the controller.
+
+        A batch is admitted as a whole, so its chunks then run side by side.
+        """
+        if self.admission is None:
+            return contextlib.nullcontext()
+        return self.admission.admit(weight=hashes)
+
+    async def _run[T](self, fn: typing.Callable[..., T], *args: typing.Any) -> T:
+        """Run `fn(*args)` on the executor or a thread."""
+        executor = self._executor()
+        if executor is None:
+            return await asyncio.to_thread(fn, *args)
+        return await executor.run(fn, *args)
+
+    def _executor(self) -> OffloadExecutor | None:
+        """Return the hasher's executor, else the calling handler's one."""
+        return self.executor or bound_executor()
+
+
+# module-level, so a process pool can pickle them along with the hasher
+
+
+def argon2_hash(hasher: pwdlib.PasswordHash, text: str) -> str:
+    """Hash `text` with `hasher`."""
+    return hasher.hash(text)
+
+
+def argon2_verify(hasher: pwdlib.PasswordHash, text: str, hashed: str) -> bool:
+    """Verify `text` against `hashed`; False for hashes `hasher` does not know."""
+    try:
+        return hasher.verify(text, hashed)
+    except pwdlib.exceptions.UnknownHashError:
+        return False
+
+
+def argon2_hash_many(
+    hasher: pwdlib.PasswordHash, texts: typing.Sequence[str]
+) -> list[str]:
+    """Hash each of `texts` with `hasher`."""
+    return [hasher.hash(text) for text in texts]
+
+
+def argon2_verify_many(
+    hasher: pwdlib.PasswordHash, pairs: typing.Sequence[tuple[str, str]]
+) -> list[bool]:
+    """Verify each (text, hashed) pair with `hasher`."""
+    return [argon2_verify(hasher, text, hashed) for text, hashed in pairs]
@@ -30,12 +30,95 @@ class PydanticConfig(BaseSettings):
     db_pool_max_overflow: int = 10
     db_echo_sql: bool = False
 
+    # --- Server Configuration (`python -m fastup.serve`) ---
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int = 1  # 0 starts one per CPU
+    server_reuse_port: bool = False  # an SO_REUSEPORT socket per worker
+    server_preload: bool = True  # import the app before forking the workers
+    server_loop: str = "auto"  # uvloop when installed
+    server_http: str = "auto"  # httptools when installed
+    server_backlog: int = 2048
+    server_keep_alive_sec: int = 5
+    server_graceful_shutdown_sec: int = 30
+    server_access_log: bool = False
+    # Keep the preloaded objects out of the workers' garbage collections
+    server_gc_freeze: bool = True
+    # Workers' gen 0, 1 and 2 collection thresholds; None keeps Python's
+    server_gc_thresholds: tuple[int, int, int] | None = (50_000, 20, 20)
+
+    # --- Startup Warm-up Configuration ---
+    # Connections opened before the app reports ready; 0 skips the step.
+    warmup_db_connections: int = 2
+    warmup_redis_connections: int = 2
+    warmup_hashers: bool = True
+    warmup_timeout_sec: float = 10.0
+
+    # --- Handler Loading Configuration ---
+    # Import handler modules on their first dispatch instead of at startup
+    lazy_handlers: bool = False
+
+    # --- Event Dispatch Configuration ---
+    event_workers: int = 0  # 0 dispatches events before the command returns
+    event_queue_maxsize: int = 1000
+    event_queue_high_watermark: int = 800
+    event_queue_low_watermark: int = 200
+    event_drain_timeout_sec: int = 10
+    # Share of the workers' turns per priority lane while several are busy
+    event_lane_weights: dict[str, int] = {"critical": 8, "normal": 3, "background": 1}
+    event_concurrent_fanout: bool = False
+    # Events sharing a partition key are handled in order by one worker
+    event_partitioned: bool = False
+    # Replay with `python -m fastup.dead_letters`
+    dead_letters_enabled: bool = True
+
+    # --- Command Configuration ---
+    # Identical coalesced commands share a result completed this recently
+    command_dedupe_window_sec: float = 1.0
+    # Deadline of command handlers without their own timeout; None disables it
+    command_timeout_sec: float | None = 10.0
+
+    # --- Executor Configuration ---
+    # Workers of the offload pools; 0 runs the work on the event loop
+    thread_executor_workers: int = 4
+    process_executor_workers: int = 2
+    # Calls handed to the process pool at once; None leaves it unbounded
+    process_executor_max_in_flight: int | None = 8
+    # Back the process policy with threads; None does so without the GIL
+    process_executor_use_threads: bool | None = None
+
+    # --- Argon2 Configuration ---
+    # Pick them with `python -m fastup.calibrate_argon2`
+    argon2_time_cost: int = 3
+    argon2_memory_cost_kib: int = 65536
+    argon2_parallelism: int = 4
+
+    # --- Password Hashing Admission Configuration ---
+    # Hashes running at once; 0 disables admission control
+    hash_concurrency_limit: int = 8
+    # Hashes waiting for a slot; beyond it requests fail with 429
+    hash_max_queue: int = 32
+    # Longest wait for a slot before failing with 503
+    hash_max_queue_wait_sec: float | None = 2.0
+
+    # --- Metrics Configuration ---
+    # Serve bus handler metrics on `GET /metrics`
+    metrics_enabled: bool = False
+
+    # --- Transactional Outbox Configuration ---
+    # Store events with the command's transaction for `python -m fastup.relay`
+    outbox_enabled: bool = False
+    outbox_batch_size: int = 100
+    outbox_poll_interval_sec: float = 1.0
+    outbox_delete_dispatched: bool = True
+
     # --- Snowflake ID Generator Configuration ---
     snowflake_epoch: int = 1609459200000  # 2021-01-01 00:00:00 UTC in milliseconds
     snowflake_node_id: int = 1
-    snowflake_worker_id: int = 1
+    snowflake_worker_id: int = 1  # server worker `i` uses `snowflake_worker_id + i`
 
     # --- Security Configuration ---
+    # Random per process unless set; required with the outbox or event stream
     hmac_secret_key: bytes = secrets.token_bytes(32)
 
     # --- OTP Configuration ---
@@ -55,6 +138,21 @@ class PydanticConfig(BaseSettings):
     redis_host: str = "localhost"
     redis_port: int = 6379
     redis_db: int = 0
+    redis_socket_timeout_sec: float = 5.0  # must exceed `event_stream_block_ms`
+    redis_socket_connect_timeout_sec: float = 2.0
+
+    # --- SMS Configuration ---
+    sms_timeout_sec: float = 10.0
+
+    # --- Redis Stream Event Transport ---
+    # Append events to a stream for `python -m fastup.stream_worker`
+    event_stream_enabled: bool = False
+    event_stream_name: str = "fastup:events"
+    event_stream_group: str = "fastup-workers"
+    event_stream_batch_size: int = 100
+    event_stream_block_ms: int = 1000
+    event_stream_claim_idle_ms: int = 30000
+    event_stream_maxlen: int = 100000
 
     # --- CORS Configuration ---
     cors_allow_origins: tuple = ("*",)
@@ -4,15 +4,16 @@ from redis.asyncio.client import Redis
 
 from .pydantic_config import get_config
 
-_config = get_config()
-
 
 @functools.cache
 def redis_client_provider() -> Redis:
     """Provides a Redis client instance based on the application configuration."""
+    config = get_config()
     return Redis(
-        host=_config.redis_host,
-        port=_config.redis_port,
-        db=_config.redis_db,
+        host=config.redis_host,
+        port=config.redis_port,
+        db=config.redis_db,
+        socket_timeout=config.redis_socket_timeout_sec,
+        socket_connect_timeout=config.redis_socket_connect_timeout_sec,
         decode_responses=True,
     )
@@ -1,9 +1,11 @@
+import asyncio
 import json
 import logging
 
 from redis.asyncio.client import Redis
 
 from fastup.core import enums
+from fastup.core.bus import time_left
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +16,16 @@ class RedisPublisher:
         self._redis = client
 
     async def publish(self, type: enums.EventType, payload: dict) -> None:
+        """Publish a payload on the channel of its type.
+
+        Bounded by the current deadline, if any, on top of the client's socket
+        timeouts.
+
+        :raises TimeoutError: If the deadline expires first.
+        """
         msg = json.dumps(payload)
-        subs = await self._redis.publish(type.value, msg)
+        async with asyncio.timeout(time_left()):
+            subs = await self._redis.publish(type.value, msg)
         if subs == 0:
             logger.warning(f"No subscribers for event {type=}")
 
@@ -0,0 +1,223 @@
+import asyncio
+import json
+import logging
+import typing
+
+from redis.asyncio.client import Redis
+from redis.exceptions import ResponseError
+
+from fastup.core.events import Event
+
+logger = logging.getLogger(__name__)
+
+type StreamEntry = tuple[str, dict[str, str] | None]
+
+
+class RedisStreamTransport:
+    """Event transport over a Redis Stream consumed through a consumer group.
+
+    On the producing side it plugs into :class:`MessageBus` as its dispatcher:
+    `submit()` appends each event to the stream instead of handling it in-process.
+    On the consuming side, `consume()` reads batches with `XREADGROUP COUNT n`,
+    delivers them concurrently and acknowledges the successful ones with one
+    `XACK`. Entries left pending by a crashed or failing consumer are taken over
+    with `XAUTOCLAIM` once they have been idle for `claim_idle_ms`, and delivered
+    again with their delivery count.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        stream: str = "fastup:events",
+        group: str = "fastup-workers",
+        consumer: str = "consumer-1",
+        batch_size: int = 100,
+        block_ms: int = 1000,
+        claim_idle_ms: int = 30_000,
+        maxlen: int | None = 100_000,
+    ) -> None:
+        """Initialize the transport.
+
+        :param client: Redis client.
+        :param stream: Stream key.
+        :param group: Consumer group shared by all workers.
+        :param consumer: Name of this consumer, unique within the group.
+        :param batch_size: Maximum entries read or claimed per call.
+        :param block_ms: How long `XREADGROUP` blocks waiting for new entries.
+        :param claim_idle_ms: Idle time after which pending entries are reclaimed.
+        :param maxlen: Approximate stream length cap applied on `XADD`.
+        """
+        self._redis = client
+        self.stream = stream
+        self.group = group
+        self.consumer = consumer
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._claim_idle_ms = claim_idle_ms
+        self._maxlen = maxlen
+        self._claim_cursor = "0-0"
+        self._running = False
+        self._stopped = asyncio.Event()
+
+    # --- producer side ---
+
+    @property
+    def is_running(self) -> bool:
+        """Whether `submit()` is accepting events."""
+        return self._running
+
+    def start(self) -> None:
+        """Start accepting events from the bus."""
+        self._running = True
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Stop accepting events from the bus and end `consume()`."""
+        self._running = False
+        self._stopped.set()
+
+    async def submit(self, event: Event) -> None:
+        """Append an event to the stream."""
+        await self._redis.xadd(self.stream, self._encode(event), maxlen=self._maxlen)
+
+    async def publish_many(self, events: typing.Sequence[Event]) -> None:
+        """Append several events to the stream in one round trip."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.xadd(self.stream, self._encode(event), maxlen=self._maxlen)
+            await pipe.execute()
+
+    # --- consumer side ---
+
+    async def ensure_group(self) -> None:
+        """Create the stream and consumer group if they do not exist yet."""
+        try:
+            await self._redis.xgroup_create(
+                self.stream, self.group, id="0", mkstream=True
+            )
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def run_once(
+        self, deliver: typing.Callable[[Event, int], typing.Awaitable[None]]
+    ) -> int:
+        """Reclaim stale pending entries, read new ones and deliver one batch.
+
+        :param deliver: Coroutine function handling one event and its delivery
+            count, raising if it must be delivered again (e.g. `MessageBus.deliver`);
+            such entries are left pending.
+        :return: The number of entries processed (acknowledged or not).
+        """
+        claimed = await self._claim_stale()
+        attempts = await self._delivery_counts([id for id, _ in claimed])
+        entries = claimed
+        if len(entries) < self._batch_size:
+            entries += await self._read_new(self._batch_size - len(entries))
+        if not entries:
+            return 0
+
+        acked: list[str] = []
+        pending: list[tuple[str, Event]] = []
+        for entry_id, fields in entries:
+            event = self._decode(entry_id, fields)
+            if event is None:
+                acked.append(entry_id)  # trimmed or undecodable, never retry
+            else:
+                pending.append((entry_id, event))
+
+        results = await asyncio.gather(
+            *(deliver(event, attempts.get(id, 1)) for id, event in pending),
+            return_exceptions=True,
+        )
+        for (entry_id, event), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Error handling stream entry {entry_id} {event.name=}: {result}"
+                )
+            else:
+                acked.append(entry_id)
+
+        if acked:
+            await self._redis.xack(self.stream, self.group, *acked)
+        return len(entries)
+
+    async def consume(
+        self, deliver: typing.Callable[[Event, int], typing.Awaitable[None]]
+    ) -> None:
+        """Process batches until `stop()` is called."""
+        await self.ensure_group()
+        logger.info(f"Consuming {self.stream} as {self.group}/{self.consumer}")
+        while not self._stopped.is_set():
+            try:
+                await self.run_once(deliver)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.exception(f"Stream consumer pass failed: {exc}")
+                await asyncio.sleep(1)
+
+    async def _claim_stale(self) -> list[StreamEntry]:
+        """Take over entries pending on other consumers for too long."""
+        next_cursor, entries, *_ = await self._redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            min_idle_time=self._claim_idle_ms,
+            start_id=self._claim_cursor,
+            count=self._batch_size,
+        )
+        self._claim_cursor = next_cursor
+        return list(entries)
+
+    async def _delivery_counts(self, entry_ids: list[str]) -> dict[str, int]:
+        """Return how many times each pending entry was delivered, in one round trip."""
+        if not entry_ids:
+            return {}
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for entry_id in entry_ids:
+                pipe.xpending_range(
+                    self.stream, self.group, min=entry_id, max=entry_id, count=1
+                )
+            replies = await pipe.execute()
+        # an entry acknowledged in the meantime has no reply; it was claimed, so
+        # it was delivered at least twice
+        return {
+            entry_id: reply[0]["times_delivered"] if reply else 2
+            for entry_id, reply in zip(entry_ids, replies)
+        }
+
+    async def _read_new(self, count: int) -> list[StreamEntry]:
+        """Read entries never delivered to any consumer of the group."""
+        response = await self._redis.xreadgroup(
+            self.group,
+            self.consumer,
+            streams={self.stream: ">"},
+            count=count,
+            block=self._block_ms,
+        )
+        if not response:
+            return []
+        _, entries = response[0]
+        return list(entries)
+
+    @staticmethod
+    def _encode(event: Event) -> dict[typing.Any, typing.Any]:
+        return {"type": event.type_key, "payload": json.dumps(event.to_payload())}
+
+    @staticmethod
+    def _decode(entry_id: str, fields: dict | None) -> Event | None:
+        """Rebuild the event of a stream entry, or None if it cannot be handled."""
+        if not fields:
+            logger.warning(f"Stream entry {entry_id} was trimmed before delivery")
+            return None
+        fields = {
+            (k.decode() if isinstance(k, bytes) else k): (
+                v.decode() if isinstance(v, bytes) else v
+            )
+            for k, v in fields.items()
+        }
+        try:
+            return Event.from_payload(fields["type"], json.loads(fields["payload"]))
+        except (KeyError, LookupError, TypeError, ValueError) as exc:
+            logger.error(f"Dropping undecodable stream entry {entry_id}: {exc}")
+            return None
@@ -1,14 +1,19 @@
-from snowflakekit import SnowflakeConfig, SnowflakeGenerator
+import threading
+import time
 
-from .pydantic_config import get_config
+from snowflakekit import SnowflakeConfig
 
-config = get_config()
+from .pydantic_config import get_config
 
 
 class SnowflakeIDGenerator:
     """A generator for creating 64-bit, time-sortable, unique IDs.
 
-    This follows the classic Twitter Snowflake design.
+    This follows the classic Twitter Snowflake design, with the bit layout of
+    `snowflakekit`. Unlike its generator, which guards the sequence with an
+    :class:`asyncio.Lock` bound to one event loop, an instance may be shared by
+    threads and event loops: each ID is made under a :class:`threading.Lock`,
+    without awaiting.
     """
 
     time_bits = 41  # 41 bits gives you ~69 years of timestamps from the epoch
@@ -19,35 +24,76 @@ class SnowflakeIDGenerator:
 
     def __init__(
         self,
-        epoch: int = config.snowflake_epoch,
-        node_id: int = config.snowflake_node_id,
-        worker_id: int = config.snowflake_worker_id,
+        epoch: int | None = None,
+        node_id: int | None = None,
+        worker_id: int | None = None,
         **kwargs,
     ) -> None:
         """Initialize the Snowflake ID generator with unique identifiers.
 
-        :param epoch: Custom epoch timestamp in milliseconds
-        :param node_id: The unique ID for the physical machine or data center (0-31)
-        :param worker_id: The unique ID for the running process on that node (0-31)
+        :param epoch: Custom epoch timestamp in milliseconds; defaults to
+            the configured `snowflake_epoch`
+        :param node_id: The unique ID for the physical machine or data center (0-31);
+            defaults to the configured `snowflake_node_id`
+        :param worker_id: The unique ID for the running process on that node (0-31);
+            defaults to the configured `snowflake_worker_id`
         :param kwargs: Optional configuration overrides (time_bits, node_bits, ...)
 
-        >> Each instance must have a unique `node_id` and `worker_id` combination to prevent ID collisions.
+        >> Each instance must have a unique `node_id` and `worker_id` combination
+        >> to prevent ID collisions.
         """
+        app_config = get_config()
         config = SnowflakeConfig(
-            epoch=epoch,
-            node_id=node_id,
-            worker_id=worker_id,
+            epoch=app_config.snowflake_epoch if epoch is None else epoch,
+            node_id=app_config.snowflake_node_id if node_id is None else node_id,
+            worker_id=(
+                app_config.snowflake_worker_id if worker_id is None else worker_id
+            ),
             time_bits=kwargs.get("time_bits", self.time_bits),
             node_bits=kwargs.get("node_bits", self.node_bits),
             worker_bits=kwargs.get("worker_bits", self.worker_bits),
             sequence_bits=kwargs.get("sequence_bits", self.sequence_bits),
             total_bits=kwargs.get("total_bits", self.total_bits),
         )
-        self.gen = SnowflakeGenerator(config=config)
+        self.config = config
+        self._lock = threading.Lock()
+        self._last_timestamp = -1
+        self._sequence = 0
+        self._sequence_mask = (1 << config.sequence_bits) - 1
+        self._time_mask = (1 << config.time_bits) - 1
+        self._time_shift = config.node_bits + config.worker_bits + config.sequence_bits
+        self._node_worker = (
+            config.node_id << (config.worker_bits + config.sequence_bits)
+        ) | (config.worker_id << config.sequence_bits)
 
     async def next_id(self) -> int:
         """Generate and return the next unique 64-bit ID.
 
         :returns: A unique 64-bit integer ID
+        :raises RuntimeError: If the clock moved backwards.
+        """
+        return self.generate()
+
+    def generate(self) -> int:
+        """Generate the next unique 64-bit ID; safe to call from any thread.
+
+        When the sequence of the current millisecond is exhausted, waits for the
+        next one, so the caller blocks for less than a millisecond.
+
+        :returns: A unique 64-bit integer ID
+        :raises RuntimeError: If the clock moved backwards.
         """
-        return await self.gen.generate()
+        with self._lock:
+            timestamp = time.time_ns() // 1_000_000
+            if timestamp < self._last_timestamp:
+                raise RuntimeError("Clock moved backwards! Refusing to generate IDs.")
+            if timestamp == self._last_timestamp:
+                self._sequence = (self._sequence + 1) & self._sequence_mask
+                if self._sequence == 0:
+                    while timestamp <= self._last_timestamp:
+                        timestamp = time.time_ns() // 1_000_000
+            else:
+                self._sequence = 0
+            self._last_timestamp = timestamp
+            elapsed = (timestamp - self.config.epoch) & self._time_mask
+            return (elapsed << self._time_shift) | self._node_worker | self._sequence
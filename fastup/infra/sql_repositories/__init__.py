@@ -1,9 +1,13 @@
 from .base_sql_repo import SQLRepository
+from .dead_letter_sql_repo import DeadLetterSQLRepo
 from .otp_sql_repo import OtpSQLRepo
+from .outbox_sql_repo import OutboxSQLRepo
 from .user_sql_repo import UserSQLRepo
 
 __all__ = [
     "SQLRepository",
     "UserSQLRepo",
     "OtpSQLRepo",
+    "OutboxSQLRepo",
+    "DeadLetterSQLRepo",
 ]
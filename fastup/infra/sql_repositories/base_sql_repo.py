@@ -29,6 +29,14 @@ class SQLRepository[T](Repository[T], abc.ABC):
         """Adds a new entity to the current session."""
         self.session.add(entity)
 
+    async def add_many(self, entities: typing.Sequence[T]) -> None:
+        """Adds new entities to the current session.
+
+        The session flushes same-type inserts as one executemany, which
+        SQLAlchemy renders as multi-row INSERT statements.
+        """
+        self.session.add_all(entities)
+
     async def delete(self, entity: T) -> None:
         """Deletes an entity from the current session."""
         await self.session.delete(entity)
@@ -0,0 +1,63 @@
+import typing
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from fastup.core.events import Event
+from fastup.core.repositories import DeadLetter, DeadLetterRepo
+from fastup.infra.tables import dead_letters
+
+
+class DeadLetterSQLRepo(DeadLetterRepo):
+    """SQLAlchemy Core repository for the `dead_letters` table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add(self, event: Event, handler: str, error: str, attempts: int) -> None:
+        """Insert one dead letter."""
+        await self.session.execute(
+            sqlalchemy.insert(dead_letters).values(
+                event_type=event.type_key,
+                payload=event.to_payload(),
+                handler=handler,
+                error=error,
+                attempts=attempts,
+            )
+        )
+
+    async def fetch(
+        self, limit: int, ids: typing.Sequence[int] | None = None
+    ) -> list[DeadLetter]:
+        """Select dead letters by id order."""
+        c = dead_letters.c
+        stmt = (
+            sqlalchemy.select(
+                c.id, c.event_type, c.payload, c.handler, c.error, c.attempts
+            )
+            .order_by(c.id)
+            .limit(limit)
+        )
+        if ids is not None:
+            stmt = stmt.where(c.id.in_(ids))
+        result = await self.session.execute(stmt)
+        return [DeadLetter(*row) for row in result]
+
+    async def record_failure(self, id: int, error: str) -> None:
+        """Increment `attempts` and overwrite `error` in a single statement."""
+        await self.session.execute(
+            sqlalchemy.update(dead_letters)
+            .where(dead_letters.c.id == id)
+            .values(
+                error=error,
+                attempts=dead_letters.c.attempts + 1,
+                updated_at=sqlalchemy.func.now(),
+            )
+        )
+
+    async def delete_many(self, ids: typing.Sequence[int]) -> None:
+        """Delete the given rows in a single statement."""
+        if ids:
+            await self.session.execute(
+                sqlalchemy.delete(dead_letters).where(dead_letters.c.id.in_(ids))
+            )
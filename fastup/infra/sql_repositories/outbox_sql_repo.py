@@ -0,0 +1,78 @@
+import datetime
+import typing
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from fastup.core.events import Event
+from fastup.core.repositories import OutboxMessage, OutboxRepo
+from fastup.infra.tables import outbox
+
+
+class OutboxSQLRepo(OutboxRepo):
+    """SQLAlchemy Core repository for the `outbox` table.
+
+    Rows are written and acknowledged with multi-row statements rather than
+    through the ORM, since messages are never loaded as entities.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add_many(self, events: typing.Sequence[Event]) -> None:
+        """Insert all events with a single multi-row INSERT."""
+        if not events:
+            return
+        rows = [{"event_type": e.type_key, "payload": e.to_payload()} for e in events]
+        await self.session.execute(sqlalchemy.insert(outbox), rows)
+
+    async def claim(self, limit: int) -> list[OutboxMessage]:
+        """Lock pending rows with `FOR UPDATE SKIP LOCKED`, oldest first."""
+        now = datetime.datetime.now(datetime.UTC)
+        stmt = (
+            sqlalchemy.select(
+                outbox.c.id, outbox.c.event_type, outbox.c.payload, outbox.c.attempts
+            )
+            .where(
+                outbox.c.dispatched_at.is_(None),
+                sqlalchemy.or_(
+                    outbox.c.next_attempt_at.is_(None), outbox.c.next_attempt_at <= now
+                ),
+            )
+            .order_by(outbox.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        return [OutboxMessage(*row) for row in result]
+
+    async def retry_later(
+        self, retries: typing.Mapping[int, datetime.datetime]
+    ) -> None:
+        """Update the given rows with one executemany statement."""
+        if retries:
+            await self.session.execute(
+                sqlalchemy.update(outbox)
+                .where(outbox.c.id == sqlalchemy.bindparam("row_id"))
+                .values(
+                    attempts=outbox.c.attempts + 1,
+                    next_attempt_at=sqlalchemy.bindparam("next_attempt_at"),
+                ),
+                [{"row_id": id, "next_attempt_at": at} for id, at in retries.items()],
+            )
+
+    async def delete_many(self, ids: typing.Sequence[int]) -> None:
+        """Delete the given rows in a single statement."""
+        if ids:
+            await self.session.execute(
+                sqlalchemy.delete(outbox).where(outbox.c.id.in_(ids))
+            )
+
+    async def mark_dispatched(self, ids: typing.Sequence[int]) -> None:
+        """Stamp `dispatched_at` on the given rows in a single statement."""
+        if ids:
+            await self.session.execute(
+                sqlalchemy.update(outbox)
+                .where(outbox.c.id.in_(ids))
+                .values(dispatched_at=sqlalchemy.func.now())
+            )
@@ -22,3 +22,15 @@ class UserSQLRepo(SQLRepository[User], UserRepo):
             stmt = stmt.where(self.entity_cls.deleted_at.is_(None))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def list_by_phones(
+        self, phones: typing.Iterable[str], only_active: bool = True
+    ) -> list[User]:
+        """Retrieve the users registered with any of the given phone numbers."""
+        stmt = sqlalchemy.select(self.entity_cls).where(
+            self.entity_cls.phone.in_(list(phones))
+        )
+        if only_active:
+            stmt = stmt.where(self.entity_cls.deleted_at.is_(None))
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
@@ -1,40 +1,71 @@
 import typing
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Connection, event, text
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, SessionTransaction
 
 from fastup.core import exceptions
+from fastup.core.bus import drain_collected_events, time_left
 from fastup.core.unit_of_work import UnitOfWork
 from fastup.infra import db, sql_repositories
 
+# Postgres SQLSTATEs raised when `statement_timeout` / `lock_timeout` expire
+QUERY_CANCELED = "57014"
+LOCK_NOT_AVAILABLE = "55P03"
+
+SET_TIMEOUTS = text(
+    "SELECT set_config('statement_timeout', :ms, true), "
+    "set_config('lock_timeout', :ms, true)"
+)
+
 
 class SQLUnitOfwWork(UnitOfWork):
     """SQLAlchemy implementation of UnitOfWork for managing database transactions."""
 
     def __init__(
-        self, session_factory: async_sessionmaker[AsyncSession] = db.sessionmaker
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        use_outbox: bool = False,
     ) -> None:
         """Initialize the UoW with a session factory.
 
-        :param session_factory: Factory to create AsyncSession instances.
+        :param session_factory: Factory to create AsyncSession instances; defaults
+            to the application's session factory.
+        :param use_outbox: If True, events collected for the current invocation are
+            moved to the outbox table on commit, in the same transaction, instead of
+            being dispatched in-process.
         """
-        self._session_factory = session_factory
+        self._session_factory = session_factory or db.get_sessionmaker()
         self._session: AsyncSession | None = None
+        self._use_outbox = use_outbox
 
     async def __aenter__(self) -> typing.Self:
         """Enter the async context: create a new session and initialize repositories."""
         session = self._session_factory()
         self._session = session
+        if time_left() is not None:
+            event.listen(session.sync_session, "after_begin", apply_deadline)
         self.users = sql_repositories.UserSQLRepo(session)
         self.otps = sql_repositories.OtpSQLRepo(session)
+        self.outbox = sql_repositories.OutboxSQLRepo(session)
+        self.dead_letters = sql_repositories.DeadLetterSQLRepo(session)
         await super().__aenter__()
         return self
 
     async def __aexit__(self, *args) -> None:
-        """Exit the async context: rollback on error and close the session."""
+        """Exit the async context: rollback on error and close the session.
+
+        :raises DeadlineExceeded: If a statement outlived the current deadline.
+        :raises ServiceUnavailableExc: If no pooled connection was available.
+        """
         if self._session:
             await self._session.close()
         await super().__aexit__(*args)
+        exc = args[1] if len(args) > 1 else None
+        if isinstance(exc, Exception) and (translated := translate_error(exc)):
+            raise translated from exc
 
     @property
     def is_ready(self) -> bool:
@@ -49,15 +80,51 @@ class SQLUnitOfwWork(UnitOfWork):
         return self._session
 
     async def _commit(self) -> None:
-        """Commit the current transaction."""
+        """Commit the current transaction, writing collected events to the outbox."""
         try:
+            if self._use_outbox:
+                await self.outbox.add_many(drain_collected_events())
             await self.session.commit()
         except IntegrityError as exc:
             await self.session.rollback()
             raise exceptions.ConflictExc from exc
+        except (DBAPIError, PoolTimeoutError) as exc:
+            if (translated := translate_error(exc)) is None:
+                raise
+            await self.session.rollback()
+            raise translated from exc
 
     async def _rollback(self) -> None:
         """Rollback the current transaction."""
         if self._session:
             await self._session.rollback()
             self._session = None
+
+
+def apply_deadline(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Bound the statements and lock waits of a new transaction by the deadline.
+
+    Registered as an `after_begin` listener, so every transaction of the session
+    gets the time left when it begins. Only Postgres is supported; other
+    dialects rely on the bus cancelling the command.
+    """
+    left = time_left()
+    if left is None or connection.dialect.name != "postgresql":
+        return
+    connection.execute(SET_TIMEOUTS, {"ms": str(max(1, int(left * 1000)))})
+
+
+def translate_error(exc: Exception) -> exceptions.BaseExc | None:
+    """Map database timeouts to domain exceptions, None for any other error."""
+    if isinstance(exc, PoolTimeoutError):
+        return exceptions.ServiceUnavailableExc(
+            "No database connection became available in time."
+        )
+    if isinstance(exc, DBAPIError) and getattr(exc.orig, "sqlstate", None) in (
+        QUERY_CANCELED,
+        LOCK_NOT_AVAILABLE,
+    ):
+        return exceptions.DeadlineExceeded()
+    return None
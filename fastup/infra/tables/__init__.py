@@ -1,7 +1,11 @@
+from .dead_letters_table import dead_letters
 from .otps_table import otps
+from .outbox_table import outbox
 from .users_table import users
 
 __all__ = [
     "users",
     "otps",
+    "outbox",
+    "dead_letters",
 ]
@@ -0,0 +1,30 @@
+import sqlalchemy as sa
+
+from fastup.infra.db import mapper_registry
+
+outbox = sa.Table(
+    "outbox",
+    mapper_registry.metadata,
+    sa.Column(
+        "id",
+        sa.BigInteger().with_variant(sa.Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    sa.Column("event_type", sa.String, nullable=False),
+    sa.Column("payload", sa.JSON, nullable=False),
+    sa.Column(
+        "created_at",
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        nullable=False,
+    ),
+    sa.Column("dispatched_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Column("attempts", sa.Integer, server_default="0", nullable=False),
+    sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Index(
+        "ix_outbox_pending",
+        "id",
+        postgresql_where=sa.column("dispatched_at").is_(None),
+    ),
+)
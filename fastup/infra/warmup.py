@@ -0,0 +1,86 @@
+"""Warm-up of the process' connections and hashers before it serves traffic.
+
+Pools connect lazily and libraries initialize on first use, which otherwise
+lands on the first requests after a deploy.
+"""
+
+import asyncio
+import typing
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from fastup.core.bus import OffloadExecutor, bind_executor
+from fastup.core.enums import OtpStatus
+from fastup.core.exceptions import NotFoundExc
+from fastup.core.services import HashService
+
+from .hash_services import Argon2PasswordHasher
+from .sql_repositories import OtpSQLRepo, UserSQLRepo
+
+if typing.TYPE_CHECKING:
+    from redis.asyncio.client import Redis
+
+
+async def warm_database(
+    sessionmaker: async_sessionmaker[AsyncSession], connections: int
+) -> None:
+    """Open pooled connections and prepare the hot statements on each.
+
+    Every session checks out its own connection, which rolls back and stays in
+    the pool once the session closes. The lookups run by the handlers on each
+    request are executed with parameters matching no row, so SQLAlchemy caches
+    their compiled form and asyncpg prepares them on every connection.
+
+    :param sessionmaker: Session factory of the units of work.
+    :param connections: Number of connections to open; at most the pool size
+        is kept.
+    """
+
+    async def prepare() -> None:
+        async with sessionmaker() as session:
+            await UserSQLRepo(session).get_by_phone("")
+            await UserSQLRepo(session).list_by_phones([""])
+            try:
+                await OtpSQLRepo(session).get_for_update(
+                    id=0, status=OtpStatus.CONSUMED, ipaddr=""
+                )
+            except NotFoundExc:
+                pass
+
+    await asyncio.gather(*(prepare() for _ in range(connections)))
+
+
+async def warm_redis(redis: "Redis", connections: int) -> None:
+    """Open pooled Redis connections, connecting them concurrently.
+
+    :param redis: Client whose pool is filled.
+    :param connections: Number of connections to open, in use or idle.
+    """
+    pool = redis.connection_pool
+    held = [pool.get_available_connection() for _ in range(connections)]
+    try:
+        await asyncio.gather(*(pool.ensure_connection(conn) for conn in held))
+    finally:
+        for conn in held:
+            await pool.release(conn)
+
+
+async def warm_hashers(
+    hmac_hasher: HashService,
+    argon2_hasher: Argon2PasswordHasher,
+    executor: OffloadExecutor | None = None,
+) -> None:
+    """Hash once with each hasher, loading their native backends.
+
+    Argon2 hashes one password per worker of `executor`, all at once, so a
+    process pool starts every worker now rather than on the first signups.
+
+    :param hmac_hasher: HMAC hasher bound in the bus's container.
+    :param argon2_hasher: Argon2 hasher bound in the bus's container.
+    :param executor: Executor the password handlers' policy runs Argon2 on.
+    """
+    hmac_hasher.verify("warm-up", hmac_hasher.hash("warm-up"))
+    executor = argon2_hasher.executor or executor
+    workers = executor.workers if executor is not None else 1
+    with bind_executor(executor):
+        await argon2_hasher.ahash_many(["warm-up"] * workers)
@@ -10,7 +10,7 @@ logging.basicConfig(
 
 
 def main():
-    """Main entry point for the application."""
+    """Development server with auto-reload; see `fastup.serve` for production."""
     logger = logging.getLogger(__name__)
     logger.info("Starting Server...")
 
@@ -0,0 +1,93 @@
+"""Report the shared and private resident memory of the server workers.
+
+Usage:
+    python -m fastup.memory_report <master pid> [--json]
+
+Reads `/proc/<pid>/smaps_rollup` (Linux) for the master started by
+`python -m fastup.serve` and each of its workers. Shared memory is what the
+workers still share with the master copy-on-write; private memory is what
+each worker owns, so the memory of N workers is roughly one shared RSS plus N
+private ones. PSS splits the shared pages evenly between their processes.
+"""
+
+import argparse
+import dataclasses
+import json
+import pathlib
+
+PROC = pathlib.Path("/proc")
+
+
+@dataclasses.dataclass(frozen=True)
+class MemoryUsage:
+    """Resident memory of one process, in KiB."""
+
+    pid: int
+    rss: int
+    pss: int
+    shared: int
+    private: int
+
+
+def read_memory(pid: int) -> MemoryUsage:
+    """Read the resident memory of a process from its smaps rollup.
+
+    :raises FileNotFoundError: If the process does not exist.
+    """
+    fields = {}
+    for line in (PROC / str(pid) / "smaps_rollup").read_text().splitlines()[1:]:
+        name, value, *_ = line.split()
+        fields[name.rstrip(":")] = int(value)
+    return MemoryUsage(
+        pid=pid,
+        rss=fields["Rss"],
+        pss=fields["Pss"],
+        shared=fields["Shared_Clean"] + fields["Shared_Dirty"],
+        private=fields["Private_Clean"] + fields["Private_Dirty"],
+    )
+
+
+def children(pid: int) -> list[int]:
+    """Return the pids of the direct children of a process."""
+    pids = []
+    for task in (PROC / str(pid) / "task").iterdir():
+        pids += [int(child) for child in (task / "children").read_text().split()]
+    return sorted(pids)
+
+
+def report(master: int) -> list[MemoryUsage]:
+    """Return the memory of the master, first, and of each of its workers."""
+    return [read_memory(pid) for pid in (master, *children(master))]
+
+
+def main():
+    """Entry point of the memory report."""
+    parser = argparse.ArgumentParser(
+        description="Report the shared and private memory of the server workers."
+    )
+    parser.add_argument("pid", type=int, help="pid of the fastup.serve master")
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    args = parser.parse_args()
+
+    usages = report(args.pid)
+    if args.json:
+        for usage in usages:
+            print(json.dumps(dataclasses.asdict(usage)))
+        return
+
+    print(f"{'':>7}{'pid':>8}{'rss':>11}{'pss':>11}{'shared':>11}{'private':>11}")
+    for index, usage in enumerate(usages):
+        role = "master" if index == 0 else f"worker{index}"
+        print(
+            f"{role:>7}{usage.pid:>8}{usage.rss:>8} KiB{usage.pss:>8} KiB"
+            f"{usage.shared:>8} KiB{usage.private:>8} KiB"
+        )
+    workers = usages[1:]
+    if workers:
+        private = sum(usage.private for usage in workers) / len(workers)
+        total = sum(usage.pss for usage in usages)
+        print(f"mean private per worker: {private:.0f} KiB; total PSS: {total} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import asyncio
+import logging
+import signal
+
+from fastup.bootstrap import bootstrap
+from fastup.core.bus import OutboxRelay
+from fastup.infra.pydantic_config import get_config
+from fastup.infra.sql_unit_of_work import SQLUnitOfwWork
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s: %(message)s [%(module)s]",
+    datefmt="%H:%M:%S",
+)
+
+
+async def run_relay() -> None:
+    """Relay outbox events through the registered event handlers until signalled."""
+    config = get_config()
+    bus = bootstrap(config)
+    relay = OutboxRelay(
+        uow_factory=SQLUnitOfwWork,
+        deliver=bus.deliver,
+        batch_size=config.outbox_batch_size,
+        poll_interval=config.outbox_poll_interval_sec,
+        delete_dispatched=config.outbox_delete_dispatched,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, relay.stop)
+
+    try:
+        await relay.run()
+    finally:
+        await bus.stop(config.event_drain_timeout_sec)
+
+
+def main():
+    """Entry point for the outbox relay process; run one per node or more."""
+    asyncio.run(run_relay())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Production HTTP server: a pre-fork master supervising uvicorn workers.
+
+Usage:
+    python -m fastup.serve [--workers N] [--host HOST] [--port PORT]
+                           [--reuse-port] [--no-preload]
+
+The master imports the app once (unless `--no-preload`), then forks the
+workers, which share its pages copy-on-write and its listening socket, or bind
+their own with SO_REUSEPORT for the kernel to balance connections between
+them. Worker `i` generates Snowflake IDs with worker ID
+`snowflake_worker_id + i`, so workers never collide; a worker that dies is
+replaced by one with the same ID. SIGINT or SIGTERM stops the workers
+gracefully, then the master.
+
+With `server_gc_freeze`, the garbage collector is paused while the app is
+preloaded and the imported objects are then frozen, i.e. moved out of the
+collected generations: collections in the workers no longer write to them,
+so their pages stay shared with the master instead of being copied into every
+worker. Check the effect with `python -m fastup.memory_report <master pid>`.
+
+uvloop and httptools are used when installed (`server_loop` and `server_http`
+set to "auto"), e.g. with `uv add uvloop httptools`.
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+
+import uvicorn
+
+from fastup.infra.pydantic_config import PydanticConfig, get_config
+from fastup.infra.snowflake_idgen import SnowflakeIDGenerator
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s: %(message)s [%(module)s]",
+    datefmt="%H:%M:%S",
+)
+
+logger = logging.getLogger(__name__)
+
+APP = "fastup.api.app:app"
+
+
+def server_config(config: PydanticConfig, host: str, port: int) -> uvicorn.Config:
+    """Build the uvicorn configuration of a worker from the app configuration."""
+    return uvicorn.Config(
+        APP,
+        host=host,
+        port=port,
+        loop=config.server_loop,
+        http=config.server_http,
+        backlog=config.server_backlog,
+        timeout_keep_alive=config.server_keep_alive_sec,
+        timeout_graceful_shutdown=config.server_graceful_shutdown_sec,
+        access_log=config.server_access_log,
+        log_config=None,
+        lifespan="on",
+    )
+
+
+def bind_socket(host: str, port: int, reuse_port: bool) -> socket.socket:
+    """Create a TCP socket bound to `host:port`; uvicorn starts listening on it.
+
+    :param reuse_port: Set SO_REUSEPORT, letting every worker bind the port.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload(uv_config: uvicorn.Config, config: PydanticConfig) -> None:
+    """Import the app in this process, before workers are forked from it.
+
+    Following the :func:`gc.freeze` documentation, collections are disabled
+    during the import, so no freed holes are left in its pages, and the
+    objects are frozen afterwards; workers re-enable collections.
+    """
+    if config.server_gc_freeze:
+        gc.disable()
+    uv_config.load()
+    if config.server_gc_freeze:
+        gc.freeze()
+        logger.info(f"Froze {gc.get_freeze_count()} preloaded objects")
+
+
+def run_worker(
+    uv_config: uvicorn.Config,
+    config: PydanticConfig,
+    worker_id: int,
+    sock: socket.socket | None,
+) -> None:
+    """Serve the app in this process until signalled.
+
+    :param worker_id: Snowflake worker ID of this process.
+    :param sock: Socket shared with the other workers, or None to bind one
+        with SO_REUSEPORT.
+    """
+    gc.enable()
+    if config.server_gc_thresholds:
+        gc.set_threshold(*config.server_gc_thresholds)
+    if not uv_config.loaded:
+        uv_config.load()
+    from fastup.api.app import app
+
+    # read by the lifespan instead of the process-wide configuration
+    app.state.config = config.model_copy(update={"snowflake_worker_id": worker_id})
+    if sock is None:
+        sock = bind_socket(uv_config.host, uv_config.port, reuse_port=True)
+    logger.info(f"Worker {os.getpid()} serving with Snowflake worker ID {worker_id}")
+    uvicorn.Server(uv_config).run(sockets=[sock])
+
+
+class Master:
+    """Forks the workers and replaces those that die until it is signalled."""
+
+    def __init__(
+        self,
+        uv_config: uvicorn.Config,
+        config: PydanticConfig,
+        workers: int,
+        reuse_port: bool,
+    ) -> None:
+        self.uv_config = uv_config
+        self.config = config
+        self.workers = workers
+        self.sock = (
+            None
+            if reuse_port
+            else bind_socket(uv_config.host, uv_config.port, reuse_port=False)
+        )
+        self.children: dict[int, int] = {}  # pid -> worker index
+        self.stopping = False
+
+    def run(self) -> None:
+        """Run the workers until SIGINT or SIGTERM, then wait for them to exit."""
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        for index in range(self.workers):
+            self.spawn(index)
+
+        while self.children:
+            pid, status = os.wait()
+            index = self.children.pop(pid, None)
+            if index is None or self.stopping:
+                continue
+            logger.warning(
+                f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}"
+                "; replacing it"
+            )
+            time.sleep(1)  # don't spin on a worker failing at startup
+            self.spawn(index)
+        logger.info("All workers stopped")
+
+    def spawn(self, index: int) -> None:
+        """Fork worker `index`; the child never returns."""
+        pid = os.fork()
+        if pid:
+            self.children[pid] = index
+            return
+
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        code = 0
+        try:
+            worker_id = self.config.snowflake_worker_id + index
+            run_worker(self.uv_config, self.config, worker_id, self.sock)
+        except BaseException:
+            logger.exception(f"Worker {os.getpid()} crashed")
+            code = 1
+        finally:
+            logging.shutdown()
+            os._exit(code)
+
+    def stop(self, signum: int, frame: object) -> None:
+        """Ask every worker to shut down gracefully."""
+        if self.stopping:
+            return
+        self.stopping = True
+        logger.info(f"Stopping {len(self.children)} workers")
+        for pid in self.children:
+            os.kill(pid, signal.SIGTERM)
+
+
+def main():
+    """Entry point of the production server."""
+    config = get_config()
+    parser = argparse.ArgumentParser(
+        description="Serve the API with a pre-fork master and uvicorn workers."
+    )
+    parser.add_argument("--host", default=config.server_host)
+    parser.add_argument("--port", type=int, default=config.server_port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=config.server_workers,
+        help="number of worker processes; 0 uses one per CPU",
+    )
+    parser.add_argument(
+        "--reuse-port",
+        action=argparse.BooleanOptionalAction,
+        default=config.server_reuse_port,
+        help="bind one SO_REUSEPORT socket per worker instead of sharing one",
+    )
+    parser.add_argument(
+        "--preload",
+        action=argparse.BooleanOptionalAction,
+        default=config.server_preload,
+        help="import the app in the master, before forking the workers",
+    )
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+    max_workers = 2**SnowflakeIDGenerator.worker_bits
+    if config.snowflake_worker_id + workers > max_workers:
+        parser.error(
+            f"{workers} workers from Snowflake worker ID "
+            f"{config.snowflake_worker_id} exceed the {max_workers} worker IDs"
+        )
+
+    uv_config = server_config(config, args.host, args.port)
+    if args.preload:
+        preload(uv_config, config)
+
+    if workers == 1:
+        sock = bind_socket(args.host, args.port, reuse_port=False)
+        run_worker(uv_config, config, config.snowflake_worker_id, sock)
+        return
+
+    logger.info(
+        f"Starting {workers} workers on {args.host}:{args.port}"
+        f" ({'SO_REUSEPORT' if args.reuse_port else 'shared socket'}"
+        f", {'preloaded' if args.preload else 'not preloaded'})"
+    )
+    Master(uv_config, config, workers, args.reuse_port).run()
+
+
+if __name__ == "__main__":
+    main()
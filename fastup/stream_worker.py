@@ -0,0 +1,49 @@
+import asyncio
+import logging
+import os
+import signal
+import socket
+
+from fastup.bootstrap import bootstrap
+from fastup.infra.pydantic_config import get_config
+from fastup.infra.redis_client import redis_client_provider
+from fastup.infra.redis_stream_transport import RedisStreamTransport
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s: %(message)s [%(module)s]",
+    datefmt="%H:%M:%S",
+)
+
+
+async def run_worker() -> None:
+    """Consume the event stream with the registered event handlers until signalled."""
+    config = get_config()
+    bus = bootstrap(config)
+    transport = RedisStreamTransport(
+        redis_client_provider(),
+        stream=config.event_stream_name,
+        group=config.event_stream_group,
+        consumer=f"{socket.gethostname()}-{os.getpid()}",
+        batch_size=config.event_stream_batch_size,
+        block_ms=config.event_stream_block_ms,
+        claim_idle_ms=config.event_stream_claim_idle_ms,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: asyncio.ensure_future(transport.stop()))
+
+    try:
+        await transport.consume(bus.deliver)
+    finally:
+        await bus.stop(config.event_drain_timeout_sec)
+
+
+def main():
+    """Entry point for a stream worker; scale by running more of them."""
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,15 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import clear_mappers
 
 from fastup.api import app, deps
-from fastup.core import bus, entities, enums, repositories, services, unit_of_work
+from fastup.core import (
+    bus,
+    entities,
+    enums,
+    handlers,
+    repositories,
+    services,
+    unit_of_work,
+)
 from fastup.core.config import Config
 from fastup.infra import (
     db,
@@ -97,6 +105,14 @@ def uow(sessionmaker: async_sessionmaker[AsyncSession]) -> unit_of_work.UnitOfWo
     return sql_unit_of_work.SQLUnitOfwWork(session_factory=sessionmaker)
 
 
+@pytest.fixture
+def uow_factory(
+    sessionmaker: async_sessionmaker[AsyncSession],
+) -> unit_of_work.UnitOfWorkFactory:
+    """Builds fresh SQL-based Units of Work, as bound for detached work."""
+    return lambda: sql_unit_of_work.SQLUnitOfwWork(session_factory=sessionmaker)
+
+
 @pytest.fixture(scope="session")
 def idgen() -> services.IDGenerator:
     """Provide a Snowflake ID generator instance for testing."""
@@ -136,6 +152,7 @@ def sms_service() -> services.SMSService:
 def bus_provider(
     config: Config,
     uow: unit_of_work.UnitOfWork,
+    uow_factory: unit_of_work.UnitOfWorkFactory,
     idgen: services.IDGenerator,
     hmac_hasher: services.HashService,
     argon2_hasher: services.HashService,
@@ -143,25 +160,28 @@ def bus_provider(
     publisher: services.Publisher,
 ) -> Callable[[], bus.MessageBus]:
     """Provides a bus factory for overriding the default bus in tests."""
+    handlers.load_all()
     queue = asyncio.Queue()
-    deps = {
-        "config": config,
-        "uow": uow,
-        "idgen": idgen,
-        "hmac_hasher": hmac_hasher,
-        "argon2_hasher": argon2_hasher,
-        "sms_service": sms_service,
-        "event_queue": queue,
-        "publisher": publisher,
-    }
+    container = bus.Container()
+    container.bind(Config, config)
+    container.bind(unit_of_work.UnitOfWork, uow)
+    container.bind(unit_of_work.UnitOfWorkFactory, uow_factory)
+    container.bind(services.IDGenerator, idgen)
+    container.bind(services.HashService, hmac_hasher, qualifier="hmac")
+    container.bind(services.HashService, argon2_hasher, qualifier="argon2")
+    container.bind(services.SMSService, sms_service)
+    container.bind(asyncio.Queue, bus.Provider(bus.current_event_queue))
+    container.bind(services.Publisher, publisher)
     msgbus = bus.MessageBus(
         event_handlers={
-            ev: [bus.inject_dependencies(h, deps) for h in handlers]
+            ev: [container.inject(h) for h in handlers]
             for ev, handlers in bus.EVENT_HANDLERS.items()
         },
         command_handlers={
-            cmd: bus.inject_dependencies(h, deps)
-            for cmd, h in bus.COMMAND_HANDLERS.items()
+            cmd: container.inject(h) for cmd, h in bus.COMMAND_HANDLERS.items()
+        },
+        batch_command_handlers={
+            cmd: container.inject(h) for cmd, h in bus.BATCH_COMMAND_HANDLERS.items()
         },
         queue=queue,
     )
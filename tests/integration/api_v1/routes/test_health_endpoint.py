@@ -1,5 +1,7 @@
 from httpx import AsyncClient
 
+from fastup.api.app import app
+
 
 async def test_health_endpoint_returns_200_ok_with_correct_body(
     async_client: AsyncClient,
@@ -22,3 +24,20 @@ async def test_health_endpoint_returns_application_json_content_type_header(
     """
     response = await async_client.get("/api/v1/fastup/health")
     assert response.headers["content-type"] == "application/json"
+
+
+async def test_ready_endpoint_returns_503_until_startup_is_done(
+    async_client: AsyncClient,
+):
+    """/ready fails until the lifespan marks the app ready after warm-up."""
+    app.state.ready = False
+    response = await async_client.get("/api/v1/fastup/ready")
+    assert response.status_code == 503
+
+    app.state.ready = True
+    try:
+        response = await async_client.get("/api/v1/fastup/ready")
+    finally:
+        del app.state.ready
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
@@ -0,0 +1,62 @@
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastup.core import entities, enums
+from fastup.core.enums import OtpIntent, OtpStatus
+
+
+async def test_issue_otp_batch_returns_one_result_per_item(
+    async_client: httpx.AsyncClient, db_session: AsyncSession
+):
+    """Each item gets its own status; a registered phone does not fail the batch."""
+    db_session.add(
+        entities.User(
+            id=1,
+            phone="+989121111111",
+            pwdhash="x",
+            sex=enums.UserSex.MALE,
+            status=enums.UserStatus.ACTIVE,
+        )
+    )
+    await db_session.commit()
+
+    response = await async_client.post(
+        "/api/v1/fastup/otps:batch",
+        json={
+            "items": [
+                {"phone": "+989120000001", "intent": OtpIntent.SIGN_UP},
+                {"phone": "+989121111111", "intent": OtpIntent.SIGN_UP},
+                {"phone": "+989120000002", "intent": OtpIntent.SIGN_UP},
+            ]
+        },
+    )
+
+    assert response.status_code == 207
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [202, 409, 202]
+    assert results[0]["otp"]["status"] == OtpStatus.ISSUED
+    assert results[1]["otp"] is None
+    assert results[1]["errors"] == ["A user with this phone number already exists."]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param({"items": []}, id="empty_batch"),
+        pytest.param(
+            {"items": [{"phone": "+989120000001", "intent": "sign_up"}] * 1001},
+            id="batch_too_large",
+        ),
+        pytest.param(
+            {"items": [{"phone": "invalid", "intent": "sign_up"}]}, id="bad_item"
+        ),
+    ],
+)
+async def test_issue_otp_batch_returns_400_for_invalid_input(
+    async_client: httpx.AsyncClient, payload: dict
+):
+    """Malformed batches are rejected as a whole."""
+    response = await async_client.post("/api/v1/fastup/otps:batch", json=payload)
+
+    assert response.status_code == 400
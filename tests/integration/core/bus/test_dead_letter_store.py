@@ -0,0 +1,67 @@
+from typing import Callable
+
+from fastup.core.bus import DeadLetterStore
+from fastup.core.events import Event, OtpIssuedEvent
+from fastup.core.unit_of_work import UnitOfWork
+
+
+def uow_factory(uow: UnitOfWork) -> Callable[[], UnitOfWork]:
+    return lambda: uow
+
+
+async def test_add_persists_failed_delivery(uow: UnitOfWork):
+    """The error is stored as its type and message."""
+    store = DeadLetterStore(uow_factory(uow))
+
+    await store.add(OtpIssuedEvent(otp_id=1), "mod.h", ConnectionError("down"), 5)
+
+    [letter] = await store.list()
+    assert letter.payload == {"otp_id": 1}
+    assert (letter.handler, letter.error, letter.attempts) == (
+        "mod.h",
+        "ConnectionError: down",
+        5,
+    )
+
+
+async def test_replay_deletes_redelivered_letters_and_keeps_failures(
+    uow: UnitOfWork,
+):
+    """Letters failing again stay in the store with one more attempt recorded."""
+    store = DeadLetterStore(uow_factory(uow))
+    for i in range(3):
+        await store.add(OtpIssuedEvent(otp_id=i), "mod.h", RuntimeError(), 1)
+    redelivered: list[tuple[Event, str]] = []
+
+    async def redeliver(event: OtpIssuedEvent, handler: str) -> None:  # type: ignore[override]
+        redelivered.append((event, handler))
+        if event.otp_id == 1:
+            raise ConnectionError("still down")
+
+    replayed, failed = await store.replay(redeliver)  # type: ignore[arg-type]
+
+    assert (replayed, failed) == (2, 1)
+    assert [(e.otp_id, h) for e, h in redelivered] == [
+        (0, "mod.h"),
+        (1, "mod.h"),
+        (2, "mod.h"),
+    ]  # type: ignore[attr-defined]
+    [letter] = await store.list()
+    assert letter.payload["otp_id"] == 1
+    assert (letter.attempts, letter.error) == (2, "ConnectionError: still down")
+
+
+async def test_replay_only_selected_ids(uow: UnitOfWork):
+    """Operators can replay individual letters."""
+    store = DeadLetterStore(uow_factory(uow))
+    for i in range(3):
+        await store.add(OtpIssuedEvent(otp_id=i), "mod.h", RuntimeError(), 1)
+    letters = await store.list()
+    redelivered: list[Event] = []
+
+    async def redeliver(event: Event, handler: str) -> None:
+        redelivered.append(event)
+
+    assert await store.replay(redeliver, ids=[letters[1].id]) == (1, 0)
+    assert redelivered == [OtpIssuedEvent(otp_id=1)]
+    assert [letter.payload["otp_id"] for letter in await store.list()] == [0, 2]
@@ -0,0 +1,150 @@
+import asyncio
+from typing import Callable
+
+import sqlalchemy as sa
+
+from unittest.mock import AsyncMock
+
+from fastup.core.bus import (
+    EventHandlerOptions,
+    MessageBus,
+    OutboxRelay,
+    RetryPolicy,
+)
+from fastup.core.events import Event, OtpIssuedEvent
+from fastup.core.unit_of_work import UnitOfWork
+from fastup.infra.sql_unit_of_work import SQLUnitOfwWork
+from fastup.infra.tables import outbox
+
+
+def uow_factory(uow: UnitOfWork) -> Callable[[], UnitOfWork]:
+    return lambda: uow
+
+
+async def seed(uow: UnitOfWork, events: list[Event]) -> None:
+    async with uow:
+        await uow.outbox.add_many(events)
+        await uow.commit()
+
+
+async def test_run_once_dispatches_and_deletes_a_batch(uow: UnitOfWork):
+    """One pass relays up to batch_size events and removes them from the outbox."""
+    events = [OtpIssuedEvent(otp_id=i) for i in range(5)]
+    await seed(uow, events)
+    dispatched: list[Event] = []
+
+    async def dispatch(event: Event, attempt: int) -> None:
+        dispatched.append(event)
+
+    relay = OutboxRelay(uow_factory(uow), dispatch, batch_size=3)
+
+    assert await relay.run_once() == 3
+    assert await relay.run_once() == 2
+    assert await relay.run_once() == 0
+    assert dispatched == events
+
+
+async def test_run_once_keeps_failed_messages_pending(uow: UnitOfWork):
+    """Messages whose dispatch raised are retried by a later pass."""
+    await seed(uow, [OtpIssuedEvent(otp_id=i) for i in range(2)])
+    attempts: list[int] = []
+
+    async def dispatch(event: OtpIssuedEvent, attempt: int) -> None:  # type: ignore[override]
+        attempts.append((event.otp_id, attempt))
+        if event.otp_id == 0 and attempt == 1:
+            raise RuntimeError("transient")
+
+    relay = OutboxRelay(uow_factory(uow), dispatch, backoff=lambda attempt: 0.0)  # type: ignore[arg-type]
+
+    assert await relay.run_once() == 2
+    assert await relay.run_once() == 1
+    assert await relay.run_once() == 0
+    assert attempts == [(0, 1), (1, 1), (0, 2)]
+
+
+async def test_run_once_waits_out_the_backoff_of_failed_messages(uow: UnitOfWork):
+    """A failed message is not claimed again before its next attempt is due."""
+    await seed(uow, [OtpIssuedEvent(otp_id=1)])
+
+    async def dispatch(event: Event, attempt: int) -> None:
+        raise RuntimeError("transient")
+
+    relay = OutboxRelay(uow_factory(uow), dispatch, backoff=lambda attempt: 60.0)
+
+    assert await relay.run_once() == 1
+    assert await relay.run_once() == 0
+
+
+async def test_messages_survive_a_relay_restart_until_handled_or_dead_lettered(
+    uow: UnitOfWork,
+):
+    """Retries live in the outbox table, so a new relay resumes them."""
+    await seed(uow, [OtpIssuedEvent(otp_id=1)])
+    calls: list[int] = []
+    dead_letters = AsyncMock()
+
+    async def failing(event: OtpIssuedEvent) -> None:
+        calls.append(event.otp_id)
+        raise ConnectionError("SMS gateway down")
+
+    failing.__event_options__ = EventHandlerOptions(retry=RetryPolicy(max_attempts=2))  # type: ignore[attr-defined]
+
+    message_bus = MessageBus({}, {OtpIssuedEvent: [failing]}, dead_letters=dead_letters)
+    for _ in range(2):  # each pass as a freshly started relay
+        relay = OutboxRelay(
+            uow_factory(uow), message_bus.deliver, backoff=lambda attempt: 0.0
+        )
+        assert await relay.run_once() == 1
+
+    assert calls == [1, 1]
+    assert not message_bus._scheduled_retries
+    dead_letters.add.assert_awaited_once()
+    assert await relay.run_once() == 0
+
+
+async def test_run_once_marks_instead_of_deleting_when_configured(uow: UnitOfWork):
+    """With delete_dispatched=False rows stay in the table but are no longer pending."""
+    await seed(uow, [OtpIssuedEvent(otp_id=1)])
+
+    async def dispatch(event: Event, attempt: int) -> None: ...
+
+    relay = OutboxRelay(uow_factory(uow), dispatch, delete_dispatched=False)
+
+    assert await relay.run_once() == 1
+    assert await relay.run_once() == 0
+
+
+async def test_run_once_sets_aside_undecodable_messages(uow: SQLUnitOfwWork):
+    """Rows whose event type no longer exists are marked instead of blocking."""
+    async with uow:
+        await uow.session.execute(
+            sa.insert(outbox).values(event_type="gone.Event", payload={})
+        )
+        await uow.commit()
+    dispatched: list[Event] = []
+
+    async def dispatch(event: Event, attempt: int) -> None:
+        dispatched.append(event)
+
+    relay = OutboxRelay(uow_factory(uow), dispatch)
+
+    assert await relay.run_once() == 1
+    assert await relay.run_once() == 0
+    assert dispatched == []
+
+
+async def test_run_relays_until_stopped(uow: UnitOfWork):
+    """The polling loop picks up new messages and exits promptly on stop()."""
+    dispatched: list[Event] = []
+
+    async def dispatch(event: Event, attempt: int) -> None:
+        dispatched.append(event)
+
+    relay = OutboxRelay(uow_factory(uow), dispatch, poll_interval=0.01)
+    task = asyncio.create_task(relay.run())
+    await seed(uow, [OtpIssuedEvent(otp_id=1)])
+    await asyncio.sleep(0.05)
+    relay.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert dispatched == [OtpIssuedEvent(otp_id=1)]
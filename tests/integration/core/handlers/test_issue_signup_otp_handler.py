@@ -3,12 +3,17 @@ import datetime
 
 import pytest
 
-from fastup.core.commands import IssueSignupOtpCommand
+from fastup.core.commands import CommandBatch, IssueSignupOtpCommand
 from fastup.core.config import Config
 from fastup.core.entities import Otp, User
 from fastup.core.enums import OtpIntent, UserSex
+from fastup.core.events import OtpIssuedEvent
 from fastup.core.exceptions import ConflictExc
-from fastup.core.handlers import handle_issue_signup_otp
+from fastup.core.handlers import (
+    handle_issue_signup_otp,
+    handle_issue_signup_otp_batch,
+)
+from fastup.core.otp_codes import otp_code
 from fastup.core.services import HashService, IDGenerator
 from fastup.core.unit_of_work import UnitOfWork
 
@@ -119,6 +124,30 @@ async def test_handle_issue_signup_otp_hashes_code_securely(
     assert len(otp.otp_hash) > config.otp_length
 
 
+async def test_handle_issue_signup_otp_raises_an_event_without_the_code(
+    cmd: IssueSignupOtpCommand,
+    config: Config,
+    uow: UnitOfWork,
+    idgen: IDGenerator,
+    hmac_hasher: HashService,
+    event_queue: asyncio.Queue,
+):
+    """The event may be persisted; the code is derived again from the OTP id."""
+    otp = await handle_issue_signup_otp(
+        cmd=cmd,
+        config=config,
+        uow=uow,
+        idgen=idgen,
+        hmac_hasher=hmac_hasher,
+        event_queue=event_queue,
+    )
+
+    event = event_queue.get_nowait()
+    assert event == OtpIssuedEvent(otp_id=otp.id)
+    code = otp_code(hmac_hasher, otp.id, config.otp_length)
+    assert hmac_hasher.verify(code, otp.otp_hash)
+
+
 async def test_handle_issue_signup_otp_raises_conflict_when_user_exists(
     cmd: IssueSignupOtpCommand,
     config: Config,
@@ -181,3 +210,45 @@ async def test_handle_issue_signup_otp_allows_multiple_otps_for_same_phone(
     # Assert: Both OTPs should be distinct
     assert otp1.id != otp2.id
     assert otp1.otp_hash != otp2.otp_hash
+
+
+async def test_handle_issue_signup_otp_batch_returns_results_in_order(
+    config: Config,
+    uow: UnitOfWork,
+    idgen: IDGenerator,
+    hmac_hasher: HashService,
+    event_queue: asyncio.Queue,
+):
+    """Verifies that the batch handler persists one OTP per new phone, reports
+    registered phones as conflicts and raises one event per OTP."""
+    async with uow:
+        taken = User(
+            id=await idgen.next_id(),
+            phone="+989110000002",
+            pwdhash="h",
+            sex=UserSex.MALE,
+        )
+        await uow.users.add(taken)
+        await uow.commit()
+    phones = ["+989110000001", "+989110000002", "+989110000003"]
+    batch = CommandBatch(
+        tuple(IssueSignupOtpCommand(phone=p, ipaddr="127.0.0.1") for p in phones)
+    )
+
+    results = await handle_issue_signup_otp_batch(
+        batch=batch,
+        config=config,
+        uow=uow,
+        idgen=idgen,
+        hmac_hasher=hmac_hasher,
+        event_queue=event_queue,
+    )
+
+    first, conflict, third = results
+    assert isinstance(first, Otp) and first.phone == phones[0]
+    assert isinstance(conflict, ConflictExc)
+    assert isinstance(third, Otp) and third.phone == phones[2]
+    assert event_queue.qsize() == 2
+    async with uow:
+        assert await uow.otps.get(id=first.id) is not None
+        assert await uow.otps.get(id=third.id) is not None
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastup.core.commands import LoginCommand
+from fastup.core.entities import User
+from fastup.core.enums import UserSex
+from fastup.core.exceptions import AuthFailedExc
+from fastup.core.handlers import handle_authentication
+from fastup.core.services import HashService
+from fastup.core.unit_of_work import UnitOfWork, UnitOfWorkFactory
+from fastup.infra.hash_services import Argon2PasswordHasher
+from fastup.infra.sql_repositories import UserSQLRepo
+
+PASSWORD = "a-secret-password"
+
+
+@pytest.fixture
+def weak_hasher() -> HashService:
+    """An Argon2 hasher with cheaper parameters than the configured ones."""
+    return Argon2PasswordHasher(time_cost=1, memory_cost=1024, parallelism=1)
+
+
+async def add_user(db_session: AsyncSession, pwdhash: str) -> User:
+    user = User(id=10, phone="09120000010", pwdhash=pwdhash, sex=UserSex.FEMALE)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+def login() -> LoginCommand:
+    return LoginCommand(phone="09120000010", password=PASSWORD, ipaddr="localhost")
+
+
+async def test_login_upgrades_outdated_hashes_in_the_background(
+    db_session: AsyncSession,
+    uow: UnitOfWork,
+    uow_factory: UnitOfWorkFactory,
+    argon2_hasher: HashService,
+    weak_hasher: HashService,
+):
+    await add_user(db_session, weak_hasher.hash(PASSWORD))
+
+    with patch("fastup.core.handlers.login_handler.run_detached") as run_detached:
+        user = await handle_authentication(login(), uow, argon2_hasher, uow_factory)
+    [[upgrade], _] = run_detached.call_args
+    await upgrade
+
+    db_session.expire_all()
+    stored = await UserSQLRepo(db_session).get(user.id)
+    assert stored is not None and stored.pwdhash != user.pwdhash
+    assert not argon2_hasher.needs_rehash(stored.pwdhash)
+    assert argon2_hasher.verify(PASSWORD, stored.pwdhash)
+
+
+async def test_login_leaves_current_hashes_alone(
+    db_session: AsyncSession,
+    uow: UnitOfWork,
+    uow_factory: UnitOfWorkFactory,
+    argon2_hasher: HashService,
+):
+    await add_user(db_session, argon2_hasher.hash(PASSWORD))
+
+    with patch("fastup.core.handlers.login_handler.run_detached") as run_detached:
+        await handle_authentication(login(), uow, argon2_hasher, uow_factory)
+
+    run_detached.assert_not_called()
+
+
+async def test_login_rejects_wrong_passwords_without_upgrading(
+    db_session: AsyncSession,
+    uow: UnitOfWork,
+    uow_factory: UnitOfWorkFactory,
+    argon2_hasher: HashService,
+    weak_hasher: HashService,
+):
+    await add_user(db_session, weak_hasher.hash("another-password"))
+
+    with patch("fastup.core.handlers.login_handler.run_detached") as run_detached:
+        with pytest.raises(AuthFailedExc):
+            await handle_authentication(login(), uow, argon2_hasher, uow_factory)
+
+    run_detached.assert_not_called()
@@ -7,10 +7,12 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastup.core import enums
+from fastup.core.config import Config
 from fastup.core.entities import Otp
 from fastup.core.events import OtpIssuedEvent
 from fastup.core.exceptions import SmsSendFailed
 from fastup.core.handlers import handle_otp_issued_event
+from fastup.core.otp_codes import otp_code
 from fastup.core.services import HashService, SMSService
 from fastup.core.unit_of_work import UnitOfWork
 from fastup.infra.redis_publisher import RedisPublisher
@@ -20,21 +22,23 @@ class MockSMS(SMSService):
     """A mock SMS service for testing purposes."""
 
     deliveries: list[tuple[int, str]] = []  # msgid, phone
+    texts: list[str] = []
 
     async def send_sms(self, phone: str, text: str) -> int:
         message_id = random.randint(100, 999)
         self.deliveries.append((message_id, phone))
+        self.texts.append(text)
         return message_id
 
 
 @pytest.fixture
 async def event(
-    db_session: AsyncSession, hmac_hasher: HashService
+    db_session: AsyncSession, config: Config, hmac_hasher: HashService
 ) -> AsyncGenerator[OtpIssuedEvent]:
     """Creates and yields an OtpIssuedEvent for testing;
     it also creates an otp record in the database for the event."""
 
-    code = "1010"
+    code = otp_code(hmac_hasher, 100, config.otp_length)
     now = datetime.datetime.now(datetime.UTC)
     otp = Otp(
         id=100,
@@ -46,14 +50,17 @@ async def event(
     )
     db_session.add(otp)
     await db_session.commit()
-    yield OtpIssuedEvent(otp_id=otp.id, code=code)
+    yield OtpIssuedEvent(otp_id=otp.id)
 
     await db_session.delete(otp)
     await db_session.commit()
 
 
 async def test_handle_otp_issued_event_sends_sms_and_updates_status(
-    event: OtpIssuedEvent, uow: UnitOfWork
+    event: OtpIssuedEvent,
+    config: Config,
+    uow: UnitOfWork,
+    hmac_hasher: HashService,
 ):
     """Verifies that the handler sends an SMS and updates the OTP status."""
 
@@ -61,10 +68,18 @@ async def test_handle_otp_issued_event_sends_sms_and_updates_status(
     mock_publisher = MagicMock(spec=RedisPublisher)
 
     await handle_otp_issued_event(
-        event=event, uow=uow, sms_service=mock_sms, publisher=mock_publisher
+        event=event,
+        config=config,
+        uow=uow,
+        hmac_hasher=hmac_hasher,
+        sms_service=mock_sms,
+        publisher=mock_publisher,
     )
 
     msgid, _ = mock_sms.deliveries.pop()
+    assert mock_sms.texts.pop().endswith(
+        otp_code(hmac_hasher, event.otp_id, config.otp_length)
+    )
 
     async with uow:
         updated_otp = await uow.otps.get(event.otp_id)
@@ -74,23 +89,33 @@ async def test_handle_otp_issued_event_sends_sms_and_updates_status(
         assert updated_otp.metadata["message_id"] == msgid
 
 
-async def test_handle_otp_issued_event_logs_warning_when_otp_not_found(uow: UnitOfWork):
+async def test_handle_otp_issued_event_logs_warning_when_otp_not_found(
+    config: Config, uow: UnitOfWork, hmac_hasher: HashService
+):
     """Verifies that the handler logs a warning and does not send SMS
     when the OTP record is not found."""
 
     mock_sms = MockSMS()
-    event = OtpIssuedEvent(otp_id=999, code="123456")  # Non-existent OTP ID
+    event = OtpIssuedEvent(otp_id=999)  # Non-existent OTP ID
     mock_publisher = MagicMock(spec=RedisPublisher)
 
     await handle_otp_issued_event(
-        event=event, uow=uow, sms_service=mock_sms, publisher=mock_publisher
+        event=event,
+        config=config,
+        uow=uow,
+        hmac_hasher=hmac_hasher,
+        sms_service=mock_sms,
+        publisher=mock_publisher,
     )
 
     assert len(mock_sms.deliveries) == 0
 
 
 async def test_handle_otp_issued_event_raises_exception_when_sms_send_fails(
-    event: OtpIssuedEvent, uow: UnitOfWork
+    event: OtpIssuedEvent,
+    config: Config,
+    uow: UnitOfWork,
+    hmac_hasher: HashService,
 ):
     """Verifies that the handler raises SmsSendFailed when SMS sending fails."""
 
@@ -102,12 +127,20 @@ async def test_handle_otp_issued_event_raises_exception_when_sms_send_fails(
 
     with pytest.raises(SmsSendFailed):
         await handle_otp_issued_event(
-            event=event, uow=uow, sms_service=failing_sms, publisher=mock_publisher
+            event=event,
+            config=config,
+            uow=uow,
+            hmac_hasher=hmac_hasher,
+            sms_service=failing_sms,
+            publisher=mock_publisher,
         )
 
 
 async def test_handle_otp_issued_event_publishes_sse(
-    event: OtpIssuedEvent, uow: UnitOfWork
+    event: OtpIssuedEvent,
+    config: Config,
+    uow: UnitOfWork,
+    hmac_hasher: HashService,
 ):
     """Verify that OTP handler sends SMS and publishes SSE message."""
 
@@ -115,10 +148,47 @@ async def test_handle_otp_issued_event_publishes_sse(
     mock_publisher = AsyncMock(spec=RedisPublisher)
 
     await handle_otp_issued_event(
-        event=event, uow=uow, sms_service=mock_sms, publisher=mock_publisher
+        event=event,
+        config=config,
+        uow=uow,
+        hmac_hasher=hmac_hasher,
+        sms_service=mock_sms,
+        publisher=mock_publisher,
     )
 
     assert mock_publisher.publish.await_count == 1
     call_args = mock_publisher.publish.call_args[1]  # kwargs
     assert call_args["type"] == enums.EventType.NOTIFICATION
     assert call_args["payload"]["event"] == "otp_sent"
+
+
+async def test_handle_otp_issued_event_retried_after_a_failed_publish_texts_once(
+    event: OtpIssuedEvent,
+    config: Config,
+    uow: UnitOfWork,
+    hmac_hasher: HashService,
+):
+    """The OTP is marked as sent before publishing, so a retry skips the SMS."""
+
+    sms = MagicMock(spec=SMSService)
+    sms.send_otp = AsyncMock(return_value=123)
+    publisher = AsyncMock(spec=RedisPublisher)
+    publisher.publish.side_effect = ConnectionError("redis down")
+
+    for _ in range(2):  # the failed attempt, then its retry
+        try:
+            await handle_otp_issued_event(
+                event=event,
+                config=config,
+                uow=uow,
+                hmac_hasher=hmac_hasher,
+                sms_service=sms,
+                publisher=publisher,
+            )
+        except ConnectionError:
+            pass
+
+    sms.send_otp.assert_awaited_once()
+    async with uow:
+        otp = await uow.otps.get(event.otp_id)
+        assert otp is not None and otp.metadata["message_id"] == 123
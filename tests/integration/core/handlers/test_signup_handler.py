@@ -1,4 +1,5 @@
 import datetime
+from unittest.mock import AsyncMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,7 +8,7 @@ from fastup.core.commands import SignupCommand
 from fastup.core.config import Config
 from fastup.core.entities import Otp, User
 from fastup.core.enums import OtpIntent, OtpStatus, UserSex
-from fastup.core.exceptions import ConflictExc
+from fastup.core.exceptions import ConflictExc, NotFoundExc
 from fastup.core.handlers import handle_signup
 from fastup.core.services import HashService, IDGenerator
 from fastup.core.unit_of_work import UnitOfWork
@@ -128,3 +129,24 @@ async def test_handle_signup_conflict_existing_user_raises_conflict_and_marks_ot
     #     )
     #     rows = fetched_users_same_phone.scalars().all()
     #     assert len(rows) == 1
+
+
+async def test_handle_signup_rejects_unknown_otp_before_hashing(
+    prepared_consumed_otp: Otp, uow: UnitOfWork, idgen: IDGenerator
+):
+    """No Argon2 hash is spent on an OTP that cannot be used."""
+    argon2_hasher = AsyncMock(spec=HashService)
+    cmd = SignupCommand(
+        otp_id=prepared_consumed_otp.id,
+        otp_code="000000",
+        ipaddr="198.51.100.7",
+        password="Str0ng-P@ss!",
+        sex=UserSex.MALE,
+        first_name=None,
+        last_name=None,
+    )
+
+    with pytest.raises(NotFoundExc):
+        await handle_signup(cmd, uow, argon2_hasher, idgen)
+
+    argon2_hasher.ahash.assert_not_called()
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastup.core.events import OtpIssuedEvent
+from fastup.infra.sql_repositories import DeadLetterSQLRepo
+
+
+@pytest.fixture
+def dead_letter_repo(db_session: AsyncSession) -> DeadLetterSQLRepo:
+    """Provide a repository instance bound to the shared test session."""
+    return DeadLetterSQLRepo(db_session)
+
+
+async def test_fetch_returns_added_letters_oldest_first(
+    dead_letter_repo: DeadLetterSQLRepo,
+):
+    """Letters come back in insertion order with their handler and error."""
+    for i in range(3):
+        event = OtpIssuedEvent(otp_id=i)
+        await dead_letter_repo.add(event, "mod.handler", "SmsSendFailed: down", 5)
+
+    letters = await dead_letter_repo.fetch(limit=2)
+
+    assert [letter.payload["otp_id"] for letter in letters] == [0, 1]
+    assert letters[0].event_type == OtpIssuedEvent(otp_id=0).type_key
+    assert (letters[0].handler, letters[0].error, letters[0].attempts) == (
+        "mod.handler",
+        "SmsSendFailed: down",
+        5,
+    )
+
+
+async def test_fetch_filters_by_ids(dead_letter_repo: DeadLetterSQLRepo):
+    """Only the requested letters are returned when ids are given."""
+    for i in range(3):
+        await dead_letter_repo.add(OtpIssuedEvent(otp_id=i), "h", "e", 1)
+    all_letters = await dead_letter_repo.fetch(limit=10)
+
+    letters = await dead_letter_repo.fetch(limit=10, ids=[all_letters[2].id])
+
+    assert [letter.payload["otp_id"] for letter in letters] == [2]
+
+
+async def test_record_failure_increments_attempts_and_keeps_last_error(
+    dead_letter_repo: DeadLetterSQLRepo,
+):
+    """A failed replay is counted against the letter."""
+    await dead_letter_repo.add(OtpIssuedEvent(otp_id=1), "h", "first", 3)
+    [letter] = await dead_letter_repo.fetch(limit=1)
+
+    await dead_letter_repo.record_failure(letter.id, "second")
+
+    [letter] = await dead_letter_repo.fetch(limit=1)
+    assert (letter.attempts, letter.error) == (4, "second")
+
+
+async def test_delete_many_removes_only_given_letters(
+    dead_letter_repo: DeadLetterSQLRepo,
+):
+    """Deleted letters are gone, the others are kept."""
+    for i in range(3):
+        await dead_letter_repo.add(OtpIssuedEvent(otp_id=i), "h", "e", 1)
+    letters = await dead_letter_repo.fetch(limit=10)
+
+    await dead_letter_repo.delete_many([letters[0].id, letters[2].id])
+
+    remaining = await dead_letter_repo.fetch(limit=10)
+    assert [letter.payload["otp_id"] for letter in remaining] == [1]
@@ -0,0 +1,79 @@
+import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastup.core.events import OtpIssuedEvent
+from fastup.infra.sql_repositories import OutboxSQLRepo
+
+
+@pytest.fixture
+def outbox_repo(db_session: AsyncSession) -> OutboxSQLRepo:
+    """Provide a repository instance bound to the shared test session."""
+    return OutboxSQLRepo(db_session)
+
+
+@pytest.fixture
+def events() -> list[OtpIssuedEvent]:
+    return [OtpIssuedEvent(otp_id=i) for i in range(5)]
+
+
+async def test_claim_returns_added_messages_oldest_first(
+    outbox_repo: OutboxSQLRepo, events: list[OtpIssuedEvent]
+):
+    """Messages come back in insertion order with their serialized payload."""
+    await outbox_repo.add_many(events)
+
+    claimed = await outbox_repo.claim(limit=3)
+
+    assert [m.payload["otp_id"] for m in claimed] == [0, 1, 2]
+    assert {m.event_type for m in claimed} == {events[0].type_key}
+
+
+async def test_delete_many_removes_only_given_messages(
+    outbox_repo: OutboxSQLRepo, events: list[OtpIssuedEvent]
+):
+    """Deleted messages are never claimed again."""
+    await outbox_repo.add_many(events)
+    claimed = await outbox_repo.claim(limit=2)
+
+    await outbox_repo.delete_many([m.id for m in claimed])
+
+    remaining = await outbox_repo.claim(limit=10)
+    assert [m.payload["otp_id"] for m in remaining] == [2, 3, 4]
+
+
+async def test_mark_dispatched_excludes_messages_from_claim(
+    outbox_repo: OutboxSQLRepo, events: list[OtpIssuedEvent]
+):
+    """Messages stamped as dispatched are kept but no longer pending."""
+    await outbox_repo.add_many(events)
+    claimed = await outbox_repo.claim(limit=4)
+
+    await outbox_repo.mark_dispatched([m.id for m in claimed])
+
+    remaining = await outbox_repo.claim(limit=10)
+    assert [m.payload["otp_id"] for m in remaining] == [4]
+
+
+async def test_retry_later_counts_attempts_and_defers_messages(
+    outbox_repo: OutboxSQLRepo, events: list[OtpIssuedEvent]
+):
+    """Messages are claimed again, with their attempts, once they are due."""
+    await outbox_repo.add_many(events[:2])
+    first, second = await outbox_repo.claim(limit=2)
+    now = datetime.datetime.now(datetime.UTC)
+
+    await outbox_repo.retry_later(
+        {first.id: now, second.id: now + datetime.timedelta(minutes=1)}
+    )
+
+    [due] = await outbox_repo.claim(limit=10)
+    assert (due.id, due.attempts) == (first.id, 1)
+
+
+async def test_add_many_with_no_events_is_a_noop(outbox_repo: OutboxSQLRepo):
+    """An empty batch does not issue an INSERT."""
+    await outbox_repo.add_many([])
+
+    assert await outbox_repo.claim(limit=10) == []
@@ -13,7 +13,7 @@ async def test_database_engine_can_establish_a_connection_and_execute_a_query():
     Skips the test if the database is not available.
     """
     try:
-        async with db.engine.begin() as conn:
+        async with db.get_engine().begin() as conn:
             query = sqlalchemy.text("SELECT 1")
             result = await conn.execute(query)
             assert result.scalar() == 1
@@ -30,7 +30,7 @@ async def test_database_sessionmaker_can_create_a_session_and_execute_a_query():
     Skips the test if the database is not available.
     """
     try:
-        async with db.sessionmaker() as session:
+        async with db.get_sessionmaker()() as session:
             query = sqlalchemy.text("SELECT 1")
             result = await session.execute(query)
             assert result.scalar() == 1
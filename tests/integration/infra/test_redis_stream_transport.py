@@ -0,0 +1,182 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock
+from typing import AsyncGenerator, Callable
+
+import pytest
+from redis.asyncio.client import Redis
+
+from fastup.core.bus import EventHandlerOptions, MessageBus, RetryPolicy
+from fastup.core.events import Event, OtpIssuedEvent
+from fastup.infra.redis_stream_transport import RedisStreamTransport
+
+
+@pytest.fixture
+async def stream(redis: Redis) -> AsyncGenerator[str, None]:
+    """Provide a unique stream key and delete it after the test."""
+    key = f"test:events:{uuid.uuid4().hex}"
+    yield key
+    await redis.delete(key)
+
+
+@pytest.fixture
+def make_transport(redis: Redis, stream: str) -> Callable[..., RedisStreamTransport]:
+    """Build transports on the test stream, one per consumer name."""
+
+    def factory(consumer: str = "c1", **kwargs) -> RedisStreamTransport:
+        kwargs.setdefault("block_ms", 10)
+        return RedisStreamTransport(redis, stream=stream, consumer=consumer, **kwargs)
+
+    return factory
+
+
+def events(n: int) -> list[OtpIssuedEvent]:
+    return [OtpIssuedEvent(otp_id=i) for i in range(n)]
+
+
+async def test_consumer_reads_batches_and_acks_dispatched_entries(
+    redis: Redis, stream: str, make_transport: Callable[..., RedisStreamTransport]
+):
+    """Published events are delivered once, in batches of `batch_size`."""
+    transport = make_transport(batch_size=3)
+    await transport.ensure_group()
+    await transport.publish_many(events(5))
+    received: list[Event] = []
+
+    async def dispatch(event: Event, attempt: int) -> None:
+        received.append(event)
+
+    assert await transport.run_once(dispatch) == 3
+    assert await transport.run_once(dispatch) == 2
+    assert await transport.run_once(dispatch) == 0
+    assert received == events(5)
+    assert (await redis.xpending(stream, transport.group))["pending"] == 0
+
+
+async def test_consumers_in_one_group_split_the_stream(
+    make_transport: Callable[..., RedisStreamTransport],
+):
+    """Each entry goes to exactly one consumer of the group."""
+    first, second = make_transport("c1", batch_size=2), make_transport("c2")
+    await first.ensure_group()
+    await first.publish_many(events(4))
+    seen: dict[str, list[int]] = {"c1": [], "c2": []}
+
+    def recorder(name: str):
+        async def dispatch(event: OtpIssuedEvent, attempt: int) -> None:
+            seen[name].append(event.otp_id)
+
+        return dispatch
+
+    await first.run_once(recorder("c1"))  # type: ignore[arg-type]
+    await second.run_once(recorder("c2"))  # type: ignore[arg-type]
+
+    assert seen == {"c1": [0, 1], "c2": [2, 3]}
+
+
+async def test_failed_entries_are_reclaimed_by_another_consumer(
+    redis: Redis, stream: str, make_transport: Callable[..., RedisStreamTransport]
+):
+    """Entries left pending by a failing consumer are taken over once idle."""
+    crashed = make_transport("crashed", claim_idle_ms=10)
+    survivor = make_transport("survivor", claim_idle_ms=10)
+    await crashed.ensure_group()
+    await crashed.publish_many(events(2))
+
+    async def boom(event: Event, attempt: int) -> None:
+        raise RuntimeError("crash")
+
+    received: list[Event] = []
+
+    async def dispatch(event: Event, attempt: int) -> None:
+        received.append(event)
+
+    assert await crashed.run_once(boom) == 2
+    assert (await redis.xpending(stream, crashed.group))["pending"] == 2
+
+    await asyncio.sleep(0.05)
+    assert await survivor.run_once(dispatch) == 2
+    assert received == events(2)
+    assert (await redis.xpending(stream, crashed.group))["pending"] == 0
+
+
+async def test_entries_whose_handler_fails_stay_pending(
+    redis: Redis, stream: str, make_transport: Callable[..., RedisStreamTransport]
+):
+    """A failing handler leaves its entry for XAUTOCLAIM instead of acking it."""
+    transport = make_transport(claim_idle_ms=10)
+    await transport.ensure_group()
+    await transport.publish_many(events(1))
+    attempts: list[int] = []
+    dead_letters = AsyncMock()
+
+    async def send_sms(event: OtpIssuedEvent) -> None:
+        raise ConnectionError("SMS gateway down")
+
+    send_sms.__event_options__ = EventHandlerOptions(  # type: ignore[attr-defined]
+        retry=RetryPolicy(max_attempts=2)
+    )
+    message_bus = MessageBus(
+        {}, {OtpIssuedEvent: [send_sms]}, dead_letters=dead_letters
+    )
+
+    async def deliver(event: Event, attempt: int) -> None:
+        attempts.append(attempt)
+        await message_bus.deliver(event, attempt)
+
+    assert await transport.run_once(deliver) == 1
+    assert (await redis.xpending(stream, transport.group))["pending"] == 1
+    dead_letters.add.assert_not_awaited()
+
+    await asyncio.sleep(0.05)
+    assert await transport.run_once(deliver) == 1
+
+    assert attempts == [1, 2]
+    dead_letters.add.assert_awaited_once()
+    assert (await redis.xpending(stream, transport.group))["pending"] == 0
+
+
+async def test_submit_appends_events_while_started(
+    redis: Redis, stream: str, make_transport: Callable[..., RedisStreamTransport]
+):
+    """As a bus event sink, the transport appends each submitted event."""
+    transport = make_transport()
+    transport.start()
+    assert transport.is_running
+
+    await transport.submit(OtpIssuedEvent(otp_id=1))
+    await transport.stop()
+
+    assert await redis.xlen(stream) == 1
+    assert not transport.is_running
+
+
+async def test_undecodable_entries_are_acked_and_skipped(
+    redis: Redis, stream: str, make_transport: Callable[..., RedisStreamTransport]
+):
+    """Entries of unknown event types are dropped instead of retried forever."""
+    transport = make_transport()
+    await transport.ensure_group()
+    await redis.xadd(stream, {"type": "gone.Event", "payload": "{}"})
+    received: list[Event] = []
+
+    async def dispatch(event: Event, attempt: int) -> None:
+        received.append(event)
+
+    assert await transport.run_once(dispatch) == 1
+    assert received == []
+    assert (await redis.xpending(stream, transport.group))["pending"] == 0
+
+
+async def test_consume_stops_on_stop(
+    make_transport: Callable[..., RedisStreamTransport],
+):
+    """The consume loop exits after stop() is called."""
+    transport = make_transport()
+
+    async def dispatch(event: Event, attempt: int) -> None: ...
+
+    task = asyncio.create_task(transport.consume(dispatch))
+    await asyncio.sleep(0.05)
+    await transport.stop()
+    await asyncio.wait_for(task, timeout=1)
@@ -1,11 +1,22 @@
+from types import SimpleNamespace
+
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from fastup.core import exceptions
+from fastup.core.bus import collect_events, deadline_scope
 from fastup.core.entities import User
 from fastup.core.enums import UserSex
+from fastup.core.events import OtpIssuedEvent
 from fastup.core.unit_of_work import UnitOfWork
-from fastup.infra.sql_unit_of_work import SQLUnitOfwWork
+from fastup.infra.sql_unit_of_work import (
+    QUERY_CANCELED,
+    SET_TIMEOUTS,
+    SQLUnitOfwWork,
+    apply_deadline,
+)
 
 
 @pytest.fixture
@@ -109,3 +120,91 @@ async def test_uow_commit_raises_conflictexc_on_integrity_error(
         await uow.users.add(new_user)  # duplicate insert
         with pytest.raises(exceptions.ConflictExc):
             await uow.commit()
+
+
+async def test_uow_with_outbox_persists_collected_events_on_commit(
+    sessionmaker: async_sessionmaker[AsyncSession],
+):
+    """Events collected for the invocation are written in the commit's transaction
+    and removed from the in-process queue."""
+    uow = SQLUnitOfwWork(session_factory=sessionmaker, use_outbox=True)
+    event = OtpIssuedEvent(otp_id=1)
+
+    with collect_events() as queue:
+        async with uow:
+            queue.put_nowait(event)
+            await uow.commit()
+
+    assert queue.empty()
+    async with uow:
+        claimed = await uow.outbox.claim(limit=10)
+    assert [m.payload for m in claimed] == [event.to_payload()]
+
+
+async def test_uow_with_outbox_writes_nothing_when_rolled_back(
+    sessionmaker: async_sessionmaker[AsyncSession],
+):
+    """Events raised in a transaction that is not committed never reach the outbox."""
+    uow = SQLUnitOfwWork(session_factory=sessionmaker, use_outbox=True)
+
+    with collect_events() as queue:
+        async with uow:
+            queue.put_nowait(OtpIssuedEvent(otp_id=1))
+
+    async with uow:
+        assert await uow.outbox.claim(limit=10) == []
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (PoolTimeoutError("pool exhausted"), exceptions.ServiceUnavailableExc),
+        (
+            DBAPIError("SELECT", None, SimpleNamespace(sqlstate=QUERY_CANCELED)),  # type: ignore[arg-type]
+            exceptions.DeadlineExceeded,
+        ),
+    ],
+)
+async def test_uow_maps_database_timeouts_to_domain_exceptions(
+    uow: SQLUnitOfwWork, error: Exception, expected: type[Exception]
+):
+    """Pool and statement timeouts surface as 503/504 domain errors."""
+    with pytest.raises(expected):
+        async with uow:
+            raise error
+
+
+async def test_uow_leaves_other_database_errors_alone(uow: SQLUnitOfwWork):
+    error = DBAPIError("SELECT", None, SimpleNamespace(sqlstate="42P01"))  # type: ignore[arg-type]
+    with pytest.raises(DBAPIError):
+        async with uow:
+            raise error
+
+
+async def test_uow_works_under_a_deadline_on_other_dialects(
+    uow: SQLUnitOfwWork, sample_user: User, db_session: AsyncSession
+):
+    """Statement timeouts are only set on Postgres; SQLite ignores the deadline."""
+    with deadline_scope(10):
+        async with uow:
+            await uow.users.add(sample_user)
+            await uow.commit()
+
+    assert await db_session.get(User, sample_user.id) is not None
+
+
+def test_apply_deadline_sets_postgres_timeouts_to_the_time_left():
+    executed: list[tuple] = []
+    connection = SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql"),
+        execute=lambda *args: executed.append(args),
+    )
+
+    apply_deadline(None, None, connection)  # type: ignore[arg-type]
+    with deadline_scope(2):
+        apply_deadline(None, None, connection)  # type: ignore[arg-type]
+
+    assert len(executed) == 1
+    statement, params = executed[0]
+    assert statement is SET_TIMEOUTS
+    assert 1900 <= int(params["ms"]) <= 2000
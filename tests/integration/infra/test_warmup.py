@@ -0,0 +1,39 @@
+import concurrent.futures
+
+from redis.asyncio.client import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from fastup.core.bus import OffloadExecutor
+from fastup.infra import warmup
+from fastup.infra.hash_services import Argon2PasswordHasher, HMACHasher
+
+
+async def test_warm_database_runs_the_hot_statements_without_writing(
+    sessionmaker: async_sessionmaker[AsyncSession], user_repo
+):
+    """The hot lookups run on each session and leave no trace."""
+    await warmup.warm_database(sessionmaker, connections=2)
+
+    assert await user_repo.get_by_phone("") is None
+
+
+async def test_warm_redis_opens_the_requested_connections(redis: Redis):
+    """Concurrent pings leave that many idle connections in the pool."""
+    pool = redis.connection_pool
+    await pool.disconnect()
+    idle_before = len(pool._available_connections)  # type: ignore
+
+    await warmup.warm_redis(redis, connections=3)
+
+    assert len(pool._available_connections) >= max(idle_before, 3)  # type: ignore
+
+
+async def test_warm_hashers_starts_every_worker_of_the_argon2_pool():
+    """Argon2 hashes on each worker of its pool, so all of them are started."""
+    pool = concurrent.futures.ThreadPoolExecutor(2)
+    executor = OffloadExecutor("process", pool, 2)
+
+    await warmup.warm_hashers(HMACHasher(), Argon2PasswordHasher(), executor)
+
+    assert len(pool._threads) == 2  # type: ignore
+    pool.shutdown()
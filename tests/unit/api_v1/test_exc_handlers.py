@@ -1,4 +1,5 @@
 import json
+import logging
 from types import SimpleNamespace
 
 import pytest
@@ -72,3 +73,16 @@ async def test_domain_exception_handler_unmapped_error_returns_500(fake_request)
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     payload = json.loads(response.body)  # type: ignore
     assert payload["errors"][0] == "Unexpected error!"
+
+
+def test_log_unmapped_logs_one_error_for_many_unmapped_exceptions(caplog):
+    """A batch of failures must not flood the logs with one record per item."""
+    excs = [RuntimeError("boom"), exceptions.ConflictExc(), KeyError("x")] * 50
+
+    with caplog.at_level(logging.ERROR, logger=exc_handlers.__name__):
+        exc_handlers.log_unmapped(excs)
+
+    [record] = caplog.records
+    assert record.levelno == logging.ERROR
+    assert record.exc_info is not None and record.exc_info[1] is excs[0]
+    assert "100 unmapped exceptions caught: KeyError, RuntimeError" in record.message
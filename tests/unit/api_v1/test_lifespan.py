@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import fastapi
+
+from fastup.api.app import lifespan
+from fastup.infra.pydantic_config import get_config
+
+
+async def test_lifespan_stops_the_bus_with_the_drain_timeout_of_its_config():
+    app = fastapi.FastAPI()
+    app.state.config = get_config().model_copy(update={"event_drain_timeout_sec": 7})
+    bus = Mock(start=AsyncMock(), stop=AsyncMock())
+
+    with (
+        patch("fastup.api.app.abootstrap", AsyncMock(return_value=bus)) as boot,
+        patch("fastup.api.app.clear_mappers"),
+    ):
+        async with lifespan(app):
+            assert app.state.ready
+
+    boot.assert_awaited_once_with(app.state.config)
+    bus.stop.assert_awaited_once_with(timeout=7)
+    assert not app.state.ready
+
+
+async def test_lifespan_defaults_to_the_process_wide_config():
+    app = fastapi.FastAPI()
+    bus = Mock(start=AsyncMock(), stop=AsyncMock())
+
+    with (
+        patch("fastup.api.app.abootstrap", AsyncMock(return_value=bus)),
+        patch("fastup.api.app.clear_mappers"),
+    ):
+        async with lifespan(app):
+            pass
+
+    assert app.state.config is get_config()
+    bus.stop.assert_awaited_once_with(timeout=get_config().event_drain_timeout_sec)
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from fastup.core.bus import AdmissionController
+from fastup.core.exceptions import OverloadedExc, TooManyRequestsExc
+
+
+async def hold(controller: AdmissionController, release: asyncio.Event) -> None:
+    async with controller.admit():
+        await release.wait()
+
+
+async def test_callers_beyond_the_limit_wait_for_a_slot_in_arrival_order():
+    controller = AdmissionController("test", limit=1, max_queue=2)
+    release = asyncio.Event()
+    order: list[int] = []
+
+    async def admitted(index: int) -> None:
+        async with controller.admit():
+            order.append(index)
+
+    holder = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+    waiting = [asyncio.ensure_future(admitted(index)) for index in range(2)]
+    await asyncio.sleep(0)
+    stats = controller.stats()
+    assert (stats.running, stats.queued) == (1, 2)
+
+    release.set()
+    await asyncio.gather(holder, *waiting)
+
+    assert order == [0, 1]
+    stats = controller.stats()
+    assert (stats.running, stats.queued, stats.admitted) == (0, 0, 3)
+
+
+async def test_callers_finding_the_queue_full_are_rejected_right_away():
+    controller = AdmissionController("test", limit=1, max_queue=0)
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(TooManyRequestsExc):
+        async with controller.admit():
+            pass
+    release.set()
+    await holder
+
+    assert controller.stats().rejected == 1
+
+
+async def test_callers_waiting_longer_than_max_wait_give_up():
+    controller = AdmissionController("test", limit=1, max_queue=1, max_wait=0.01)
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(OverloadedExc):
+        async with controller.admit():
+            pass
+    assert controller.stats().queued == 0
+    release.set()
+    await holder
+
+    stats = controller.stats()
+    assert (stats.running, stats.timed_out) == (0, 1)
+
+
+async def test_cancelled_waiters_leave_the_queue_without_taking_a_slot():
+    controller = AdmissionController("test", limit=1, max_queue=1)
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(hold(controller, asyncio.Event()))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    release.set()
+    await holder
+
+    stats = controller.stats()
+    assert (stats.running, stats.queued, stats.admitted) == (0, 0, 1)
+
+
+async def test_a_waiter_cancelled_after_being_handed_a_slot_frees_it():
+    controller = AdmissionController("test", limit=1, max_queue=1)
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(hold(controller, asyncio.Event()))
+    await asyncio.sleep(0)
+
+    release.set()
+    await holder  # hands the slot to the waiter, which has not resumed yet
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    assert controller.stats().running == 0
+
+
+async def test_weighted_callers_hold_and_wait_for_as_many_slots():
+    """A batch counts like as many callers, capped at the limit."""
+    controller = AdmissionController("test", limit=3, max_queue=3)
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(controller, release))
+    await asyncio.sleep(0)
+
+    async def batch(weight: int) -> None:
+        async with controller.admit(weight=weight):
+            await asyncio.sleep(0)
+
+    waiting = asyncio.ensure_future(batch(3))
+    await asyncio.sleep(0)
+    stats = controller.stats()
+    assert (stats.running, stats.queued) == (1, 3)
+    with pytest.raises(TooManyRequestsExc):
+        await batch(1)
+
+    release.set()
+    await asyncio.gather(holder, waiting)
+    await batch(10)  # more than the limit still gets in alone
+
+    stats = controller.stats()
+    assert (stats.running, stats.queued, stats.admitted) == (0, 0, 3)
+
+
+def test_controller_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        AdmissionController("test", limit=0, max_queue=1)
+    with pytest.raises(ValueError):
+        AdmissionController("test", limit=1, max_queue=-1)
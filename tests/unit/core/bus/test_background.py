@@ -0,0 +1,47 @@
+import asyncio
+import logging
+
+import pytest
+
+from fastup.core.bus import deadline_scope, drain_detached, run_detached, time_left
+
+
+async def test_detached_tasks_outlive_the_deadline_of_their_caller():
+    seen: list[float | None] = []
+
+    async def work() -> None:
+        await asyncio.sleep(0)
+        seen.append(time_left())
+
+    with deadline_scope(5.0):
+        task = run_detached(work())
+    await task
+
+    assert seen == [None]
+
+
+async def test_detached_task_failures_are_logged(caplog: pytest.LogCaptureFixture):
+    async def fail() -> None:
+        raise RuntimeError("boom")
+
+    with caplog.at_level(logging.ERROR):
+        task = run_detached(fail())
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+
+    assert "boom" in caplog.text
+
+
+async def test_drain_waits_for_detached_tasks_and_cancels_stragglers():
+    done = asyncio.Event()
+
+    async def quick() -> None:
+        await asyncio.sleep(0.01)
+        done.set()
+
+    quick_task = run_detached(quick())
+    slow_task = run_detached(asyncio.sleep(10))
+    await drain_detached(timeout=0.1)
+
+    assert done.is_set() and quick_task.done()
+    assert slow_task.cancelled()
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from fastup.core.bus import collect_events, current_event_queue
+from fastup.core.events import Event
+
+
+def test_current_event_queue_raises_outside_collect_events():
+    """Resolving the event queue without a bound collector must fail loudly."""
+    with pytest.raises(RuntimeError):
+        current_event_queue()
+
+
+def test_collect_events_binds_fresh_queue_and_restores_previous():
+    """Nested collectors bind their own queue and restore the outer one on exit."""
+    with collect_events() as outer:
+        with collect_events() as inner:
+            assert current_event_queue() is inner
+        assert current_event_queue() is outer
+        assert inner is not outer
+
+
+async def test_collect_events_isolates_concurrent_tasks():
+    """Each task sees only the queue bound in its own context."""
+
+    async def raise_event() -> asyncio.Queue:
+        with collect_events() as queue:
+            await asyncio.sleep(0)
+            current_event_queue().put_nowait(Event())
+            await asyncio.sleep(0)
+            return queue
+
+    queues = await asyncio.gather(*(raise_event() for _ in range(10)))
+
+    assert all(q.qsize() == 1 for q in queues)
@@ -0,0 +1,38 @@
+import time
+
+from fastup.core.bus import current_deadline, deadline_scope, time_left
+
+
+def test_no_deadline_outside_of_a_scope():
+    assert current_deadline() is None
+    assert time_left() is None
+
+
+def test_scope_binds_a_deadline_for_its_block_only():
+    """The deadline is `timeout` seconds from entering the block."""
+    before = time.monotonic()
+    with deadline_scope(2.0) as deadline:
+        assert deadline is not None
+        assert before + 2.0 <= deadline <= time.monotonic() + 2.0
+        assert current_deadline() == deadline
+        left = time_left()
+        assert left is not None and 0 < left <= 2.0
+    assert current_deadline() is None
+
+
+def test_nested_scope_never_extends_the_enclosing_deadline():
+    with deadline_scope(1.0) as outer:
+        with deadline_scope(60.0) as inner:
+            assert inner == outer
+        with deadline_scope(0.5) as shorter:
+            assert shorter is not None and outer is not None
+            assert shorter < outer
+        with deadline_scope(None) as unset:
+            assert unset == outer
+
+
+def test_time_left_is_negative_once_the_deadline_has_passed():
+    with deadline_scope(0.0):
+        time.sleep(0.001)
+        left = time_left()
+        assert left is not None and left < 0
@@ -0,0 +1,170 @@
+import asyncio
+import dataclasses
+
+import pytest
+
+from fastup.core.bus import (
+    BackgroundDispatcher,
+    MessageBus,
+    Priority,
+    Provider,
+    current_event_queue,
+    inject_dependencies,
+)
+from fastup.core.commands import Command
+from fastup.core.entities import Entity
+from fastup.core.events import Event
+
+
+@dataclasses.dataclass(frozen=True)
+class Cmd(Command): ...
+
+
+@dataclasses.dataclass(frozen=True)
+class Ev(Event):
+    n: int
+
+
+async def test_handle_returns_before_background_event_handlers_finish():
+    """With a running dispatcher, command handling must not wait for event handlers."""
+    gate = asyncio.Event()
+    handled: list[int] = []
+
+    async def handler(cmd: Cmd, event_queue: asyncio.Queue) -> Entity:
+        event_queue.put_nowait(Ev(n=1))
+        return Entity()
+
+    async def slow_event_handler(ev: Ev) -> None:
+        await gate.wait()
+        handled.append(ev.n)
+
+    deps = {"event_queue": Provider(current_event_queue)}
+    bus = MessageBus(
+        command_handlers={Cmd: inject_dependencies(handler, deps)},
+        event_handlers={Ev: [slow_event_handler]},
+    )
+    bus.dispatcher = BackgroundDispatcher(bus.dispatch, workers=2, maxsize=10)
+    await bus.start()
+
+    await asyncio.wait_for(bus.handle(Cmd()), timeout=1)
+    assert handled == []
+
+    gate.set()
+    await bus.stop(timeout=1)
+    assert handled == [1]
+
+
+async def test_submit_waits_above_high_watermark_until_low_watermark():
+    """Producers are throttled at the high watermark and resume at the low one."""
+    gate = asyncio.Event()
+
+    async def dispatch(event: Event) -> None:
+        await gate.wait()
+
+    dispatcher = BackgroundDispatcher(
+        dispatch, workers=1, maxsize=10, high_watermark=3, low_watermark=1
+    )
+    dispatcher.start()
+
+    for n in range(4):  # one is taken by the blocked worker, three stay queued
+        await dispatcher.submit(Ev(n=n))
+        await asyncio.sleep(0)
+    assert dispatcher.stats().throttled is True
+
+    blocked = asyncio.create_task(dispatcher.submit(Ev(n=99)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    gate.set()
+    await asyncio.wait_for(blocked, timeout=1)
+    await dispatcher.stop(timeout=1)
+
+    stats = dispatcher.stats()
+    assert stats.processed == 5
+    assert stats.throttle_waits == 1
+    assert stats.max_depth == 3
+    assert stats.depth == 0
+
+
+async def test_stop_drains_queued_events():
+    """Stopping the dispatcher processes everything still queued."""
+    handled: list[int] = []
+
+    async def dispatch(event: Ev) -> None:  # type: ignore[override]
+        await asyncio.sleep(0)
+        handled.append(event.n)
+
+    dispatcher = BackgroundDispatcher(dispatch, workers=3, maxsize=100)  # type: ignore
+    dispatcher.start()
+    for n in range(50):
+        await dispatcher.submit(Ev(n=n))
+    await dispatcher.stop(timeout=1)
+
+    assert sorted(handled) == list(range(50))
+    assert dispatcher.is_running is False
+
+
+async def test_worker_counts_failures_and_keeps_running():
+    """A failing dispatch is counted and does not kill the worker."""
+
+    async def dispatch(event: Ev) -> None:  # type: ignore[override]
+        if event.n == 0:
+            raise RuntimeError("boom")
+
+    dispatcher = BackgroundDispatcher(dispatch, workers=1, maxsize=10)  # type: ignore
+    dispatcher.start()
+    await dispatcher.submit(Ev(n=0))
+    await dispatcher.submit(Ev(n=1))
+    await dispatcher.stop(timeout=1)
+
+    assert dispatcher.stats().failed == 1
+    assert dispatcher.stats().processed == 1
+
+
+async def test_submit_raises_when_not_running():
+    """Submitting to a stopped dispatcher is a programming error."""
+
+    async def dispatch(event: Event) -> None: ...
+
+    with pytest.raises(RuntimeError):
+        await BackgroundDispatcher(dispatch).submit(Ev(n=1))
+
+
+@pytest.mark.parametrize(
+    "maxsize, high, low",
+    [(10, 5, 5), (10, 11, 1), (10, 5, -1)],
+)
+def test_dispatcher_rejects_inconsistent_watermarks(maxsize: int, high: int, low: int):
+    """Watermarks must satisfy 0 <= low < high <= maxsize."""
+
+    async def dispatch(event: Event) -> None: ...
+
+    with pytest.raises(ValueError):
+        BackgroundDispatcher(
+            dispatch, maxsize=maxsize, high_watermark=high, low_watermark=low
+        )
+
+
+async def test_workers_take_critical_events_ahead_of_a_background_backlog():
+    """Events are dispatched from priority lanes, not in submission order."""
+    handled: list[int] = []
+
+    async def dispatch(event: Event) -> None:
+        assert isinstance(event, Ev)
+        handled.append(event.n)
+
+    dispatcher = BackgroundDispatcher(
+        dispatch,
+        workers=1,
+        maxsize=100,
+        priority=lambda ev: Priority.CRITICAL if ev.n < 0 else Priority.BACKGROUND,
+    )
+    dispatcher.start()
+    for n in range(20):
+        await dispatcher.submit(Ev(n=n))
+    await dispatcher.submit(Ev(n=-1))
+    assert dispatcher.stats().lanes == {"background": 20, "normal": 0, "critical": 1}
+
+    await dispatcher.stop(timeout=1)
+
+    assert handled.index(-1) <= 1
@@ -0,0 +1,128 @@
+import asyncio
+import concurrent.futures
+import dataclasses
+import math
+import threading
+
+import pytest
+
+from fastup.core.bus import (
+    CommandHandlerOptions,
+    ExecutionPolicy,
+    MessageBus,
+    OffloadExecutor,
+    offload,
+)
+from fastup.core.commands import Command
+from fastup.core.entities import Entity
+
+
+@dataclasses.dataclass(frozen=True)
+class Cmd(Command): ...
+
+
+@dataclasses.dataclass(kw_only=True)
+class Ntt(Entity):
+    thread: int
+
+
+def thread_pool(workers: int = 1) -> OffloadExecutor:
+    return OffloadExecutor(
+        "thread", concurrent.futures.ThreadPoolExecutor(workers), workers
+    )
+
+
+async def test_offload_runs_inline_without_a_bound_executor():
+    assert await offload(threading.get_ident) == threading.get_ident()
+
+
+async def test_executor_runs_calls_on_its_workers_and_reports_queue_wait():
+    """A call queued behind a busy worker reports the time it waited."""
+    waits: list[tuple[str, float]] = []
+    executor = thread_pool()
+    executor.on_wait = lambda name, waited: waits.append((name, waited))
+    gate = threading.Event()
+
+    blocked = asyncio.ensure_future(executor.run(gate.wait))
+    queued = asyncio.ensure_future(executor.run(threading.get_ident))
+    await asyncio.sleep(0.02)
+    assert executor.stats().pending == 2
+    assert executor.stats().saturation == 2
+
+    gate.set()
+    await blocked
+    assert await queued != threading.get_ident()
+    executor.shutdown()
+
+    stats = executor.stats()
+    assert (stats.pending, stats.completed, stats.failed) == (0, 2, 0)
+    assert waits[-1][0] == "thread" and waits[-1][1] >= 0.02
+
+
+async def test_executor_counts_failed_calls():
+    executor = thread_pool()
+
+    with pytest.raises(ValueError):
+        await executor.run(int, "not a number")
+    executor.shutdown()
+
+    assert executor.stats().failed == 1
+
+
+async def test_process_executor_runs_picklable_calls():
+    executor = OffloadExecutor(
+        "process", concurrent.futures.ProcessPoolExecutor(1), workers=1
+    )
+    try:
+        assert await executor.run(math.factorial, 10) == 3628800
+    finally:
+        executor.shutdown()
+
+
+async def test_bus_binds_the_executor_of_the_handler_policy():
+    """Offloaded work follows the policy; LOOP handlers keep it inline."""
+
+    async def handler(cmd: Cmd) -> Ntt:
+        return Ntt(thread=await offload(threading.get_ident))
+
+    async def threaded(cmd: Cmd) -> Ntt:
+        return await handler(cmd)
+
+    threaded.__command_options__ = CommandHandlerOptions(  # type: ignore[attr-defined]
+        execution=ExecutionPolicy.THREAD
+    )
+    executors = {ExecutionPolicy.THREAD: thread_pool()}
+
+    inline = await MessageBus({Cmd: handler}, {}, executors=executors).handle(Cmd())
+    bus = MessageBus({Cmd: threaded}, {}, executors=executors)
+    offloaded = await bus.handle(Cmd())
+    await bus.stop()
+
+    assert inline.thread == threading.get_ident()  # type: ignore[attr-defined]
+    assert offloaded.thread != threading.get_ident()  # type: ignore[attr-defined]
+    assert executors[ExecutionPolicy.THREAD].stats().completed == 1
+
+
+async def test_executor_bounds_the_calls_in_flight():
+    """Calls beyond `max_in_flight` wait on the loop, which counts as queue wait."""
+    waits: list[float] = []
+    executor = OffloadExecutor(
+        "thread",
+        concurrent.futures.ThreadPoolExecutor(2),
+        workers=2,
+        on_wait=lambda name, waited: waits.append(waited),
+        max_in_flight=1,
+    )
+    gate = threading.Event()
+
+    blocked = asyncio.ensure_future(executor.run(gate.wait))
+    queued = asyncio.ensure_future(executor.run(threading.active_count))
+    await asyncio.sleep(0.02)
+    assert not queued.done()  # a second worker is idle, but not allowed
+    assert executor.stats().pending == 2
+
+    gate.set()
+    await asyncio.gather(blocked, queued)
+    executor.shutdown()
+
+    assert max(waits) >= 0.02
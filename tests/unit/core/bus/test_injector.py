@@ -1,8 +1,15 @@
 from asyncio import iscoroutinefunction
+from typing import Annotated, AsyncIterator, Protocol
 
 import pytest
 
-from fastup.core.bus import inject_dependencies
+from fastup.core.bus import (
+    Container,
+    Provider,
+    Scope,
+    inject_dependencies,
+    request_scope,
+)
 from fastup.core.commands import Command
 from fastup.core.events import Event
 
@@ -59,3 +66,212 @@ def test_inject_dependencies_ignores_event_param():
 
     wrapped = inject_dependencies(handler, deps={})
     assert iscoroutinefunction(wrapped)
+
+
+class Resource:
+    """A dependency that records whether it has been closed."""
+
+    closed: bool = False
+
+
+async def test_inject_dependencies_builds_command_scoped_provider_per_call():
+    """COMMAND-scoped providers must build a new instance on every invocation."""
+    seen: list[Resource] = []
+
+    async def handler(cmd: Command, res: Resource) -> None:
+        seen.append(res)
+
+    wrapped = inject_dependencies(handler, {"res": Provider(Resource)})
+    await wrapped(command)
+    await wrapped(command)
+
+    assert len(seen) == 2
+    assert seen[0] is not seen[1]
+
+
+async def test_inject_dependencies_shares_singleton_provider_between_handlers():
+    """SINGLETON providers are built once and shared by every handler."""
+    seen: list[Resource] = []
+
+    async def handler(cmd: Command, res: Resource) -> None:
+        seen.append(res)
+
+    deps = {"res": Provider(Resource, scope=Scope.SINGLETON)}
+    await inject_dependencies(handler, deps)(command)
+    await inject_dependencies(handler, deps)(command)
+
+    assert seen[0] is seen[1]
+
+
+async def test_inject_dependencies_closes_resource_after_invocation():
+    """Async generator providers are entered per invocation and closed afterwards."""
+    built: list[Resource] = []
+
+    async def resource_factory() -> AsyncIterator[Resource]:
+        res = Resource()
+        built.append(res)
+        yield res
+        res.closed = True
+
+    async def handler(cmd: Command, res: Resource) -> bool:
+        return res.closed
+
+    wrapped = inject_dependencies(handler, {"res": Provider(resource_factory)})
+
+    assert await wrapped(command) is False
+    assert built[0].closed is True
+
+
+async def test_inject_dependencies_shares_request_scoped_provider_within_scope():
+    """REQUEST-scoped providers are shared inside a request scope only."""
+    seen: list[Resource] = []
+
+    async def handler(cmd: Command, res: Resource) -> None:
+        seen.append(res)
+
+    deps = {"res": Provider(Resource, scope=Scope.REQUEST)}
+    wrapped = inject_dependencies(handler, deps)
+
+    async with request_scope():
+        await wrapped(command)
+        await wrapped(command)
+    await wrapped(command)
+
+    assert seen[0] is seen[1]
+    assert seen[2] is not seen[0]
+
+
+def test_provider_rejects_singleton_resources():
+    """Singleton resources would never be closed, so they are rejected."""
+
+    async def resource_factory() -> AsyncIterator[Resource]:
+        yield Resource()
+
+    with pytest.raises(ValueError):
+        Provider(resource_factory, scope=Scope.SINGLETON)
+
+
+async def test_inject_dependencies_passes_keyword_only_params_by_keyword():
+    """Dependencies after an optional parameter are passed by keyword."""
+
+    async def handler(cmd: Command, opt: str = "x", *, dep: int) -> tuple:
+        return opt, dep
+
+    assert await inject_dependencies(handler, {"dep": 1})(command) == ("x", 1)
+
+
+class Greeter(Protocol):
+    def greet(self) -> str: ...
+
+
+class Hello:
+    def greet(self) -> str:
+        return "hello"
+
+
+class Hi:
+    def greet(self) -> str:
+        return "hi"
+
+
+async def test_container_resolves_dependencies_by_type_whatever_their_name():
+    """Parameters are matched to bindings by their annotation, not their name."""
+
+    async def handler(cmd: Command, whatever: Greeter, res: Resource) -> tuple:
+        return whatever.greet(), res
+
+    container = Container()
+    container.bind(Greeter, Hello())
+    container.bind(Resource, Provider(Resource))
+    invoker = container.inject(handler)
+
+    greeting, first = await invoker(command)
+    _, second = await invoker(command)
+    assert greeting == "hello"
+    assert first is not second
+    assert iscoroutinefunction(invoker)
+    assert invoker.__name__ == "handler"
+
+
+async def test_container_picks_implementations_by_qualifier():
+    """Annotated qualifiers select one of several bindings of a type."""
+
+    async def handler(
+        cmd: Command, a: Annotated[Greeter, "hello"], b: Annotated[Greeter, "hi"]
+    ) -> tuple:
+        return a.greet(), b.greet()
+
+    container = Container()
+    container.bind(Greeter, Hello(), qualifier="hello")
+    container.bind(Greeter, Hi(), qualifier="hi")
+
+    assert await container.inject(handler)(command) == ("hello", "hi")
+
+
+def test_container_resolves_unqualified_type_with_single_binding():
+    """A type bound once resolves without a qualifier, whatever its qualifier."""
+    container = Container()
+    hello = Hello()
+    container.bind(Greeter, hello, qualifier="hello")
+
+    assert container.resolve(Greeter) is hello
+
+
+def test_container_rejects_ambiguous_and_missing_dependencies():
+    """Unresolvable parameters fail when the handler is injected, not when called."""
+
+    async def ambiguous(cmd: Command, greeter: Greeter) -> None: ...
+
+    async def missing(cmd: Command, res: Resource) -> None: ...
+
+    container = Container()
+    container.bind(Greeter, Hello(), qualifier="hello")
+    container.bind(Greeter, Hi(), qualifier="hi")
+
+    with pytest.raises(RuntimeError, match="ambiguous"):
+        container.inject(ambiguous)
+    with pytest.raises(RuntimeError, match="No dependency bound to Resource"):
+        container.inject(missing)
+
+
+def test_container_rejects_duplicate_bindings():
+    """Binding the same type and qualifier twice is an error."""
+    container = Container()
+    container.bind(Greeter, Hello())
+
+    with pytest.raises(RuntimeError):
+        container.bind(Greeter, Hi())
+
+
+def test_container_caches_invokers():
+    """Each handler is compiled once; binding again invalidates the cache."""
+
+    async def handler(cmd: Command, greeter: Greeter) -> None: ...
+
+    container = Container()
+    container.bind(Greeter, Hello())
+    invoker = container.inject(handler)
+    assert container.inject(handler) is invoker
+
+    container.bind(Resource, Resource())
+    assert container.inject(handler) is not invoker
+
+
+async def test_container_closes_resources_after_invocation():
+    """Resource providers bound in a container are closed after each call."""
+    built: list[Resource] = []
+
+    async def resource_factory() -> AsyncIterator[Resource]:
+        res = Resource()
+        built.append(res)
+        yield res
+        res.closed = True
+
+    async def handler(cmd: Command, res: Resource) -> bool:
+        return res.closed
+
+    container = Container()
+    container.bind(Resource, Provider(resource_factory))
+
+    assert await container.inject(handler)(command) is False
+    assert built[0].closed is True
@@ -0,0 +1,124 @@
+import asyncio
+import dataclasses
+
+import pytest
+
+from fastup.core.bus import LaneQueue, Priority
+from fastup.core.events import Event
+
+
+@dataclasses.dataclass(frozen=True)
+class Ev(Event):
+    lane: Priority
+    n: int = 0
+
+
+def lane_of(event: Event) -> Priority:
+    assert isinstance(event, Ev)
+    return event.lane
+
+
+def drain(queue: LaneQueue, n: int) -> list[Priority]:
+    return [lane_of(queue.get_nowait()) for _ in range(n)]
+
+
+async def test_each_lane_is_fifo():
+    queue = LaneQueue(lane_of)
+    for n in range(3):
+        queue.put_nowait(Ev(Priority.NORMAL, n))
+
+    assert [queue.get_nowait().n for _ in range(3)] == [0, 1, 2]  # type: ignore[attr-defined]
+
+
+async def test_busy_lanes_share_turns_by_weight():
+    """With all lanes busy, each gets its weight's share, evenly interleaved."""
+    weights = {Priority.CRITICAL: 3, Priority.NORMAL: 2, Priority.BACKGROUND: 1}
+    queue = LaneQueue(lane_of, weights=weights)
+    for lane in Priority:
+        for _ in range(60):
+            queue.put_nowait(Ev(lane))
+
+    taken = drain(queue, 60)
+
+    assert taken.count(Priority.CRITICAL) == 30
+    assert taken.count(Priority.NORMAL) == 20
+    assert taken.count(Priority.BACKGROUND) == 10
+    assert taken[:6].count(Priority.CRITICAL) == 3  # spread, not in runs
+
+
+async def test_background_burst_does_not_starve_critical_events():
+    """A critical event queued behind many background ones is served right away."""
+    queue = LaneQueue(lane_of)
+    for _ in range(1000):
+        queue.put_nowait(Ev(Priority.BACKGROUND))
+    queue.put_nowait(Ev(Priority.CRITICAL))
+
+    assert Priority.CRITICAL in drain(queue, 2)
+
+
+async def test_idle_lanes_do_not_bank_credit():
+    """A lane that was empty gets its normal share once events arrive."""
+    queue = LaneQueue(lane_of)
+    for _ in range(10):
+        queue.put_nowait(Ev(Priority.BACKGROUND))
+    drain(queue, 10)
+
+    for lane in (Priority.BACKGROUND, Priority.CRITICAL):
+        for _ in range(9):
+            queue.put_nowait(Ev(lane))
+
+    assert drain(queue, 9).count(Priority.CRITICAL) == 8
+
+
+async def test_queue_reports_depths_sizes_and_wait_times():
+    waits: list[tuple[Priority, float]] = []
+    queue = LaneQueue(lane_of, maxsize=2, on_wait=lambda *w: waits.append(w))
+    queue.put_nowait(Ev(Priority.CRITICAL))
+    queue.put_nowait(Ev(Priority.BACKGROUND))
+
+    assert queue.qsize() == 2 and queue.full()
+    assert queue.depths() == {
+        Priority.BACKGROUND: 1,
+        Priority.NORMAL: 0,
+        Priority.CRITICAL: 1,
+    }
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(Ev(Priority.NORMAL))
+
+    await asyncio.sleep(0.01)
+    await queue.get()
+
+    [(lane, waited)] = waits
+    assert lane is Priority.CRITICAL and waited >= 0.01
+
+
+async def test_get_and_put_wait_for_room_and_join_waits_for_task_done():
+    queue = LaneQueue(lane_of, maxsize=1)
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not getter.done()
+
+    queue.put_nowait(Ev(Priority.NORMAL, 1))
+    assert (await getter).n == 1  # type: ignore[attr-defined]
+
+    queue.put_nowait(Ev(Priority.NORMAL, 2))
+    putter = asyncio.create_task(queue.put(Ev(Priority.NORMAL, 3)))
+    joiner = asyncio.create_task(queue.join())
+    await asyncio.sleep(0)
+    assert not putter.done() and not joiner.done()
+
+    queue.get_nowait()
+    await putter
+    queue.get_nowait()
+    for _ in range(3):
+        queue.task_done()
+    await asyncio.wait_for(joiner, 1)
+    with pytest.raises(ValueError):
+        queue.task_done()
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+def test_every_lane_needs_a_positive_weight():
+    with pytest.raises(ValueError):
+        LaneQueue(lane_of, weights={Priority.CRITICAL: 1, Priority.NORMAL: 1})
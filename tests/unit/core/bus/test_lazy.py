@@ -0,0 +1,98 @@
+import dataclasses
+import sys
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+from fastup.core.bus import HandlerLoader, MessageBus
+from fastup.core.commands import Command
+from fastup.core.events import Event
+
+
+@dataclasses.dataclass(frozen=True)
+class LazyCmd(Command): ...
+
+
+@dataclasses.dataclass(frozen=True)
+class LazyEv(Event):
+    key: int
+
+
+HANDLERS_MODULE = """
+from fastup.core.bus import register_command, register_event, register_partition_key
+from fastup.core.entities import Entity
+from tests_lazy_messages import LazyCmd, LazyEv
+
+handled = []
+
+@register_command(LazyCmd)
+async def handle_cmd(cmd):
+    return Entity()
+
+@register_event(LazyEv)
+async def handle_ev(ev):
+    handled.append(ev.key)
+
+register_partition_key(LazyEv, lambda ev: ev.key)
+"""
+
+
+@pytest.fixture
+def handlers_module(tmp_path, monkeypatch) -> str:
+    """A handler module registering handlers of LazyCmd/LazyEv when imported."""
+    messages = type(sys)("tests_lazy_messages")
+    messages.LazyCmd = LazyCmd  # type: ignore[attr-defined]
+    messages.LazyEv = LazyEv  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "tests_lazy_messages", messages)
+    (tmp_path / "lazy_handlers_mod.py").write_text(textwrap.dedent(HANDLERS_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_handlers_mod"
+    sys.modules.pop("lazy_handlers_mod", None)
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    with (
+        patch("fastup.core.bus.registry.COMMAND_HANDLERS", {}),
+        patch("fastup.core.bus.registry.BATCH_COMMAND_HANDLERS", {}),
+        patch("fastup.core.bus.registry.EVENT_HANDLERS", {}),
+        patch("fastup.core.bus.registry.EVENT_PARTITION_KEYS", {}),
+    ):
+        yield
+
+
+async def test_handlers_are_imported_on_first_dispatch_only(handlers_module: str):
+    wrapped = []
+
+    def wrap(handler):
+        wrapped.append(handler.__name__)
+        return handler
+
+    manifest = {LazyCmd: [handlers_module], LazyEv: [handlers_module]}
+    bus = MessageBus({}, {}, loader=HandlerLoader(manifest, wrap))
+    assert handlers_module not in sys.modules
+
+    await bus.handle(LazyCmd())
+    await bus.handle(LazyCmd())
+
+    assert handlers_module in sys.modules
+    assert wrapped == ["handle_cmd"]
+
+
+async def test_event_handlers_and_partition_keys_are_loaded_lazily(
+    handlers_module: str,
+):
+    bus = MessageBus({}, {}, loader=HandlerLoader({LazyEv: [handlers_module]}))
+
+    assert bus.partition_key(LazyEv(key=3)) == 3
+    await bus.dispatch(LazyEv(key=4))
+
+    assert sys.modules[handlers_module].handled == [4]
+
+
+async def test_message_types_missing_from_the_manifest_stay_unhandled():
+    bus = MessageBus({}, {}, loader=HandlerLoader({}))
+
+    with pytest.raises(RuntimeError):
+        await bus.handle(LazyCmd())
@@ -1,13 +1,28 @@
 import asyncio
 import dataclasses
+import random
+import typing
 from unittest.mock import AsyncMock
 
 import pytest
 
-from fastup.core.bus import MessageBus
-from fastup.core.commands import Command
+from fastup.core.bus import (
+    CommandHandlerOptions,
+    EventHandlerOptions,
+    MessageBus,
+    Priority,
+    Provider,
+    RetryPolicy,
+    current_event_queue,
+    handler_name,
+    inject_dependencies,
+    run_detached,
+    time_left,
+)
+from fastup.core.commands import Command, CommandBatch
 from fastup.core.entities import Entity
 from fastup.core.events import Event
+from fastup.core.exceptions import DeadlineExceeded
 
 
 @dataclasses.dataclass(frozen=True)
@@ -122,3 +137,666 @@ async def test_dispatch_events_skips_non_event_items():
 
     # should not raise, just skip it
     await bus._dispatch_events()
+
+
+class SessionUoW:
+    """Mimics SQLUnitOfwWork: a session is opened on enter and dropped on exit."""
+
+    def __init__(self) -> None:
+        self._session: object | None = None
+
+    async def __aenter__(self) -> typing.Self:
+        self._session = object()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self._session = None
+
+
+async def test_concurrent_handle_calls_never_share_a_command_scoped_uow():
+    """Hammer the bus from many tasks; each command must keep its own session."""
+    queue = asyncio.Queue()
+
+    async def handler(cmd: Cmd, uow: SessionUoW) -> Aggregate:
+        async with uow:
+            session = uow._session
+            for _ in range(random.randint(1, 5)):
+                await asyncio.sleep(0)
+                assert uow._session is session, "session overwritten concurrently"
+        return Aggregate(id=id(session), name=cmd.aggr_name)
+
+    deps = {"uow": Provider(SessionUoW)}
+    bus = MessageBus(
+        command_handlers={Cmd: inject_dependencies(handler, deps)},
+        event_handlers={},
+        queue=queue,
+    )
+
+    results = await asyncio.gather(
+        *(bus.handle(Cmd(aggr_name=str(i))) for i in range(500))
+    )
+
+    assert [r.name for r in results] == [str(i) for i in range(500)]  # type: ignore
+
+
+async def test_handle_dispatches_only_events_raised_by_its_own_command():
+    """A command must never drain events raised by another in-flight command."""
+    handled: list[str] = []
+    gate = asyncio.Event()
+
+    async def handler(cmd: Cmd, event_queue: asyncio.Queue) -> Aggregate:
+        event_queue.put_nowait(Ev(aggr_id=int(cmd.aggr_name)))
+        if cmd.aggr_name == "1":
+            await gate.wait()
+        return Aggregate(id=int(cmd.aggr_name), name=cmd.aggr_name)
+
+    async def record(ev: Ev) -> None:
+        handled.append(str(ev.aggr_id))
+
+    deps = {"event_queue": Provider(current_event_queue)}
+    bus = MessageBus(
+        command_handlers={Cmd: inject_dependencies(handler, deps)},
+        event_handlers={Ev: [record]},
+    )
+
+    slow = asyncio.create_task(bus.handle(Cmd(aggr_name="1")))
+    await asyncio.sleep(0)
+    await bus.handle(Cmd(aggr_name="2"))
+    assert handled == ["2"]
+
+    gate.set()
+    await slow
+    assert handled == ["2", "1"]
+
+
+async def test_handle_routes_events_to_shared_queue_when_not_isolated():
+    """With isolation disabled, events wait on the shared queue for a background consumer."""
+    handled: list[int] = []
+
+    async def handler(cmd: Cmd, event_queue: asyncio.Queue) -> Aggregate:
+        event_queue.put_nowait(Ev(aggr_id=1))
+        return Aggregate(id=1, name=cmd.aggr_name)
+
+    async def record(ev: Ev) -> None:
+        handled.append(ev.aggr_id)
+
+    deps = {"event_queue": Provider(current_event_queue)}
+    bus = MessageBus(
+        command_handlers={Cmd: inject_dependencies(handler, deps)},
+        event_handlers={Ev: [record]},
+        isolate_events=False,
+    )
+
+    await bus.handle(Cmd(aggr_name="x"))
+    assert handled == []
+    assert bus.queue.qsize() == 1
+
+    await bus.dispatch_pending()
+    assert handled == [1]
+
+
+async def test_dispatch_handles_events_raised_by_event_handlers():
+    """Events raised while handling an event are dispatched in the same pass."""
+    handled: list[int] = []
+
+    async def cascade(ev: Ev, event_queue: asyncio.Queue) -> None:
+        handled.append(ev.aggr_id)
+        if ev.aggr_id < 3:
+            event_queue.put_nowait(Ev(aggr_id=ev.aggr_id + 1))
+
+    deps = {"event_queue": Provider(current_event_queue)}
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [inject_dependencies(cascade, deps)]},
+    )
+
+    await bus.queue.put(Ev(aggr_id=1))
+    await bus._dispatch_events()
+
+    assert handled == [1, 2, 3]
+
+
+def with_options(handler, **options):
+    """Attach registration options to a handler without touching the registry."""
+    handler.__event_options__ = EventHandlerOptions(**options)
+    return handler
+
+
+async def test_concurrent_fanout_runs_independent_handlers_together():
+    """Event latency is the slowest handler, not the sum of all handlers."""
+    running: set[str] = set()
+    overlap: list[bool] = []
+
+    def make(name: str):
+        async def handler(ev: Ev) -> None:
+            running.add(name)
+            await asyncio.sleep(0.01)
+            overlap.append(len(running) > 1)
+            running.discard(name)
+
+        return handler
+
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [make("sms"), make("audit"), make("analytics")]},
+        concurrent_fanout=True,
+    )
+
+    await bus.dispatch(Ev(aggr_id=1))
+
+    assert any(overlap)
+
+
+async def test_concurrent_fanout_keeps_sequential_handlers_in_order():
+    """Handlers registered as sequential never overlap and keep their order."""
+    order: list[str] = []
+
+    def make(name: str):
+        async def handler(ev: Ev) -> None:
+            order.append(f"{name}:start")
+            await asyncio.sleep(0)
+            order.append(f"{name}:end")
+
+        return with_options(handler, sequential=True)
+
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [make("a"), make("b")]},
+        concurrent_fanout=True,
+    )
+
+    await bus.dispatch(Ev(aggr_id=1))
+
+    assert order == ["a:start", "a:end", "b:start", "b:end"]
+
+
+async def test_concurrent_fanout_isolates_handler_errors():
+    """A failing handler must not cancel its siblings."""
+    handled: list[int] = []
+
+    async def failing(ev: Ev) -> None:
+        raise RuntimeError("fail")
+
+    async def slow(ev: Ev) -> None:
+        await asyncio.sleep(0.01)
+        handled.append(ev.aggr_id)
+
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [failing, slow]},
+        concurrent_fanout=True,
+    )
+
+    await bus.dispatch(Ev(aggr_id=7))
+
+    assert handled == [7]
+
+
+async def test_handler_max_concurrency_caps_parallel_invocations():
+    """A handler's max_concurrency bounds invocations across concurrent events."""
+    active = 0
+    peak = 0
+
+    async def capped(ev: Ev) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [with_options(capped, max_concurrency=2)]},
+    )
+
+    await asyncio.gather(*(bus.dispatch(Ev(aggr_id=i)) for i in range(20)))
+
+    assert peak == 2
+
+
+class MemoryDeadLetters:
+    """Collects dead letters in memory."""
+
+    def __init__(self) -> None:
+        self.letters: list[tuple[Event, str, BaseException, int]] = []
+
+    async def add(
+        self, event: Event, handler: str, error: BaseException, attempts: int
+    ) -> None:
+        self.letters.append((event, handler, error, attempts))
+
+
+def fast_retry(**kwargs) -> RetryPolicy:
+    return RetryPolicy(base_delay=0.001, max_delay=0.001, **kwargs)
+
+
+async def wait_for_retries(bus: MessageBus) -> None:
+    while bus._scheduled_retries or bus._retries:
+        await asyncio.sleep(0.001)
+
+
+async def test_failing_handler_is_retried_until_it_succeeds():
+    """A transient failure is retried and the handler eventually succeeds."""
+    calls: list[int] = []
+
+    async def flaky(ev: Ev) -> None:
+        calls.append(ev.aggr_id)
+        if len(calls) < 3:
+            raise ConnectionError("sms gateway down")
+
+    dead_letters = MemoryDeadLetters()
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [with_options(flaky, retry=fast_retry(max_attempts=3))]},
+        dead_letters=dead_letters,
+    )
+
+    await bus.dispatch(Ev(aggr_id=1))
+    await wait_for_retries(bus)
+
+    assert calls == [1, 1, 1]
+    assert dead_letters.letters == []
+
+
+async def test_retry_backoff_does_not_block_other_events():
+    """Dispatch returns while a retry waits, so later events are not delayed."""
+    handled: list[int] = []
+
+    async def handler(ev: Ev) -> None:
+        if ev.aggr_id == 1 and -1 not in handled:
+            handled.append(-1)
+            raise ConnectionError("transient")
+        handled.append(ev.aggr_id)
+
+    policy = RetryPolicy(base_delay=0.05, max_delay=0.05, jitter=False)
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [with_options(handler, retry=policy)]},
+    )
+
+    await bus.dispatch(Ev(aggr_id=1))
+    await bus.dispatch(Ev(aggr_id=2))
+    assert handled == [-1, 2]
+
+    await wait_for_retries(bus)
+    assert handled == [-1, 2, 1]
+
+
+async def test_exhausted_retries_are_dead_lettered():
+    """Once the policy gives up, the event goes to the dead-letter store."""
+    failing = AsyncMock(side_effect=ConnectionError("down"))
+    dead_letters = MemoryDeadLetters()
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [with_options(failing, retry=fast_retry(max_attempts=3))]},
+        dead_letters=dead_letters,
+    )
+
+    await bus.dispatch(Ev(aggr_id=5))
+    await wait_for_retries(bus)
+
+    assert failing.await_count == 3
+    [(event, _, error, attempts)] = dead_letters.letters
+    assert event == Ev(aggr_id=5)
+    assert isinstance(error, ConnectionError)
+    assert attempts == 3
+
+
+async def test_non_retryable_errors_are_dead_lettered_at_once():
+    """Exceptions outside `retry_on` skip the retries entirely."""
+    failing = AsyncMock(side_effect=ValueError("bad payload"))
+    dead_letters = MemoryDeadLetters()
+    policy = fast_retry(max_attempts=5, retry_on=(ConnectionError,))
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [with_options(failing, retry=policy)]},
+        dead_letters=dead_letters,
+    )
+
+    await bus.dispatch(Ev(aggr_id=5))
+
+    assert not bus._scheduled_retries
+    assert failing.await_count == 1
+    assert [attempts for *_, attempts in dead_letters.letters] == [1]
+
+
+async def test_stop_dead_letters_events_waiting_for_a_retry():
+    """Pending retries are not lost on shutdown."""
+    failing = AsyncMock(side_effect=ConnectionError("down"))
+    dead_letters = MemoryDeadLetters()
+    policy = RetryPolicy(base_delay=60, max_delay=60)
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [with_options(failing, retry=policy)]},
+        dead_letters=dead_letters,
+    )
+
+    await bus.dispatch(Ev(aggr_id=5))
+    await bus.stop()
+
+    assert failing.await_count == 1
+    assert [attempts for *_, attempts in dead_letters.letters] == [1]
+
+
+async def test_stop_waits_for_detached_tasks():
+    """Work a handler left running in the background finishes before shutdown."""
+    finished = asyncio.Event()
+
+    async def upgrade() -> None:
+        await asyncio.sleep(0.01)
+        finished.set()
+
+    async def handler(cmd: Cmd) -> Aggregate:
+        run_detached(upgrade())
+        return Aggregate(id=1, name=cmd.aggr_name)
+
+    bus = MessageBus(command_handlers={Cmd: handler}, event_handlers={})
+
+    await bus.handle(Cmd(aggr_name="a"))
+    await bus.stop()
+
+    assert finished.is_set()
+
+
+async def test_deliver_raises_instead_of_retrying_in_memory():
+    """Durable deliveries are retried by their source, not by timers."""
+    failing = AsyncMock(side_effect=ConnectionError("down"))
+    dead_letters = MemoryDeadLetters()
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [with_options(failing, retry=fast_retry(max_attempts=2))]},
+        dead_letters=dead_letters,
+    )
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await bus.deliver(Ev(aggr_id=5), attempt=1)
+
+    assert exc_info.group_contains(ConnectionError)
+    assert not bus._scheduled_retries
+    assert dead_letters.letters == []
+
+
+async def test_deliver_dead_letters_once_the_policy_gives_up():
+    """The last delivery succeeds for the caller once its failure is stored."""
+    failing = AsyncMock(side_effect=ConnectionError("down"))
+    dead_letters = MemoryDeadLetters()
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [with_options(failing, retry=fast_retry(max_attempts=2))]},
+        dead_letters=dead_letters,
+    )
+
+    await bus.deliver(Ev(aggr_id=5), attempt=2)
+
+    assert [attempts for *_, attempts in dead_letters.letters] == [2]
+
+
+async def test_deliver_raises_when_dead_lettering_fails():
+    failing = AsyncMock(side_effect=ValueError("bad payload"))
+    dead_letters = AsyncMock()
+    dead_letters.add.side_effect = ConnectionError("database down")
+    bus = MessageBus(
+        command_handlers={},
+        event_handlers={Ev: [failing]},
+        dead_letters=dead_letters,
+    )
+
+    with pytest.raises(ExceptionGroup):
+        await bus.deliver(Ev(aggr_id=5))
+
+
+async def test_redeliver_runs_only_the_named_handler():
+    """Replaying a dead letter must not re-run handlers that already succeeded."""
+    invoked: list[str] = []
+
+    async def sms(ev: Ev) -> None:
+        invoked.append("sms")
+
+    async def audit(ev: Ev) -> None:
+        invoked.append("audit")
+
+    bus = MessageBus(command_handlers={}, event_handlers={Ev: [sms, audit]})
+
+    await bus.redeliver(Ev(aggr_id=1), handler_name(audit))
+    assert invoked == ["audit"]
+
+    with pytest.raises(LookupError):
+        await bus.redeliver(Ev(aggr_id=1), "unknown.handler")
+
+
+@dataclasses.dataclass(frozen=True)
+class OtherCmd(Command):
+    name_: str
+
+
+async def test_handle_many_batches_same_type_commands_and_keeps_order():
+    """Batched commands share one handler call; others fall back to `handle`."""
+    batches: list[int] = []
+    handled: list[int] = []
+
+    async def batch_handler(batch: CommandBatch) -> list:
+        batches.append(len(batch.commands))
+        return [
+            Aggregate(id=i, name=c.aggr_name) if c.aggr_name else ValueError("empty")
+            for i, c in enumerate(batch.commands)
+        ]
+
+    async def other_handler(cmd: OtherCmd) -> Aggregate:
+        if cmd.name_ == "bad":
+            raise RuntimeError("bad")
+        return Aggregate(id=99, name=cmd.name_)
+
+    async def record(ev: Ev) -> None:
+        handled.append(ev.aggr_id)
+
+    async def raising_batch_handler(batch: CommandBatch, event_queue: asyncio.Queue):
+        for c in batch.commands:
+            event_queue.put_nowait(Ev(aggr_id=int(c.aggr_name)))
+        return await batch_handler(batch)
+
+    deps = {"event_queue": Provider(current_event_queue)}
+    bus = MessageBus(
+        command_handlers={OtherCmd: other_handler},
+        batch_command_handlers={Cmd: inject_dependencies(raising_batch_handler, deps)},
+        event_handlers={Ev: [record]},
+    )
+
+    results = await bus.handle_many(
+        [Cmd("1"), OtherCmd("ok"), Cmd("2"), OtherCmd("bad"), Cmd("3")]
+    )
+
+    assert batches == [3]
+    assert [r.name if isinstance(r, Aggregate) else type(r) for r in results] == [
+        "1",
+        "ok",
+        "2",
+        RuntimeError,
+        "3",
+    ]
+    assert handled == [1, 2, 3]
+
+
+async def test_handle_many_fails_every_item_when_the_batch_handler_raises():
+    """A failing batch handler fails its whole batch without raising."""
+
+    async def batch_handler(batch: CommandBatch) -> list:
+        raise ConnectionError("db down")
+
+    bus = MessageBus(
+        command_handlers={},
+        batch_command_handlers={Cmd: batch_handler},
+        event_handlers={},
+    )
+
+    results = await bus.handle_many([Cmd("1"), Cmd("2")])
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+async def test_handle_many_fails_every_item_once_the_batch_deadline_expires():
+    """A batch handler outliving the command timeout is cancelled."""
+    cancelled = asyncio.Event()
+    seen: list[float | None] = []
+
+    async def batch_handler(batch: CommandBatch) -> list:
+        seen.append(time_left())
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    bus = MessageBus(
+        command_handlers={},
+        batch_command_handlers={Cmd: batch_handler},
+        event_handlers={},
+        command_timeout=0.01,
+    )
+
+    results = await bus.handle_many([Cmd("1"), Cmd("2")])
+
+    assert all(isinstance(r, DeadlineExceeded) for r in results)
+    assert cancelled.is_set()
+    assert seen[0] is not None and 0 < seen[0] <= 0.01
+
+
+async def test_coalesced_commands_share_one_handler_execution_and_its_events():
+    """Identical in-flight commands run the handler and dispatch events once."""
+    runs = 0
+    handled: list[int] = []
+
+    async def handler(cmd: Cmd, event_queue: asyncio.Queue) -> Aggregate:
+        nonlocal runs
+        runs += 1
+        run = runs
+        await asyncio.sleep(0.01)
+        event_queue.put_nowait(Ev(aggr_id=run))
+        return Aggregate(id=run, name=cmd.aggr_name)
+
+    async def record(ev: Ev) -> None:
+        handled.append(ev.aggr_id)
+
+    handler.__command_options__ = CommandHandlerOptions(  # type: ignore[attr-defined]
+        coalesce_key=lambda cmd: cmd.aggr_name
+    )
+    deps = {"event_queue": Provider(current_event_queue)}
+    bus = MessageBus(
+        command_handlers={Cmd: inject_dependencies(handler, deps)},
+        event_handlers={Ev: [record]},
+    )
+
+    results = await asyncio.gather(
+        *(bus.handle(Cmd(aggr_name="same")) for _ in range(5)),
+        bus.handle(Cmd(aggr_name="other")),
+    )
+
+    assert runs == 2
+    assert len({id(r) for r in results[:5]}) == 1
+    assert results[5].name == "other"  # type: ignore[attr-defined]
+    assert sorted(handled) == [1, 2]
+
+
+async def test_commands_without_coalesce_key_always_run():
+    """Coalescing is opt-in per command handler."""
+    runs = 0
+
+    async def handler(cmd: Cmd) -> Aggregate:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0)
+        return Aggregate(id=runs, name=cmd.aggr_name)
+
+    bus = MessageBus(
+        command_handlers={Cmd: handler}, event_handlers={}, dedupe_window=10
+    )
+
+    await asyncio.gather(*(bus.handle(Cmd(aggr_name="same")) for _ in range(3)))
+
+    assert runs == 3
+
+
+async def test_handle_cancels_handler_once_the_command_timeout_expires():
+    """A handler outliving the command's deadline fails with DeadlineExceeded."""
+    cancelled = asyncio.Event()
+
+    async def slow(cmd: Cmd) -> Aggregate:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return Aggregate(id=1, name=cmd.aggr_name)
+
+    bus = MessageBus(command_handlers={Cmd: slow}, event_handlers={})
+
+    with pytest.raises(DeadlineExceeded):
+        await bus.handle(Cmd(aggr_name="a", timeout=0.01))
+    assert cancelled.is_set()
+
+
+async def test_command_timeout_takes_precedence_over_handler_and_bus_defaults():
+    """The handler sees the command's deadline, then its own, then the bus's."""
+    seen: list[float | None] = []
+
+    async def handler(cmd: Cmd) -> Aggregate:
+        seen.append(time_left())
+        return Aggregate(id=1, name=cmd.aggr_name)
+
+    async def registered(cmd: Cmd) -> Aggregate:
+        return await handler(cmd)
+
+    registered.__command_options__ = CommandHandlerOptions(timeout=20)  # type: ignore[attr-defined]
+
+    await MessageBus({Cmd: handler}, {}).handle(Cmd(aggr_name="a"))
+    await MessageBus({Cmd: handler}, {}, command_timeout=30).handle(Cmd(aggr_name="a"))
+    bus = MessageBus({Cmd: registered}, {}, command_timeout=30)
+    await bus.handle(Cmd(aggr_name="a"))
+    await bus.handle(Cmd(aggr_name="a", timeout=10))
+
+    assert seen[0] is None
+    assert [round(typing.cast(float, left)) for left in seen[1:]] == [30, 20, 10]
+
+
+async def test_timeout_raised_by_the_handler_itself_is_not_a_deadline_error():
+    """Only the bus's own deadline is reported as DeadlineExceeded."""
+
+    async def handler(cmd: Cmd) -> Aggregate:
+        raise TimeoutError("upstream")
+
+    bus = MessageBus(command_handlers={Cmd: handler}, event_handlers={})
+
+    with pytest.raises(TimeoutError, match="upstream"):
+        await bus.handle(Cmd(aggr_name="a", timeout=10))
+
+
+async def test_event_handlers_are_not_bound_by_the_command_deadline():
+    """Events are dispatched after the command's deadline scope has ended."""
+    seen: list[float | None] = []
+
+    async def handler(cmd: Cmd) -> Aggregate:
+        current_event_queue().put_nowait(Ev(aggr_id=1))
+        return Aggregate(id=1, name=cmd.aggr_name)
+
+    async def on_event(ev: Ev) -> None:
+        seen.append(time_left())
+
+    bus = MessageBus(command_handlers={Cmd: handler}, event_handlers={Ev: [on_event]})
+
+    await bus.handle(Cmd(aggr_name="a", timeout=10))
+
+    assert seen == [None]
+
+
+def test_event_priority_is_the_highest_among_its_handlers():
+    async def audit(ev: Ev) -> None: ...
+
+    async def deliver(ev: Ev) -> None: ...
+
+    audit.__event_options__ = EventHandlerOptions(priority=Priority.BACKGROUND)  # type: ignore[attr-defined]
+    deliver.__event_options__ = EventHandlerOptions(priority=Priority.CRITICAL)  # type: ignore[attr-defined]
+
+    bus = MessageBus(command_handlers={}, event_handlers={Ev: [audit, deliver]})
+
+    assert bus.event_priority(Ev(aggr_id=1)) is Priority.CRITICAL
+    assert MessageBus({}, {}).event_priority(Ev(aggr_id=1)) is Priority.NORMAL
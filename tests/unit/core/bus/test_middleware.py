@@ -0,0 +1,192 @@
+import asyncio
+import concurrent.futures
+import dataclasses
+
+import pytest
+
+from fastup.core.bus import (
+    BackgroundDispatcher,
+    MessageBus,
+    MetricsMiddleware,
+    OffloadExecutor,
+    Priority,
+    handler_name,
+)
+from fastup.core.commands import Command
+from fastup.core.entities import Entity
+from fastup.core.events import Event
+from fastup.core.metrics import MetricsRegistry
+
+
+@dataclasses.dataclass(frozen=True)
+class Cmd(Command):
+    fail: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class Ev(Event): ...
+
+
+class Ntt(Entity): ...
+
+
+async def test_middleware_wraps_command_and_event_handlers_in_order():
+    """The first middleware is the outermost one."""
+    calls: list[str] = []
+
+    def make(name: str):
+        async def middleware(message, handler, call_next):
+            calls.append(f"{name}>{message.name}")
+            result = await call_next()
+            calls.append(f"{name}<{message.name}")
+            return result
+
+        return middleware
+
+    async def handle_cmd(cmd: Cmd) -> Ntt:
+        return Ntt()
+
+    async def handle_ev(ev: Ev) -> None:
+        calls.append("handler")
+
+    bus = MessageBus(
+        command_handlers={Cmd: handle_cmd},
+        event_handlers={Ev: [handle_ev]},
+        middleware=[make("outer"), make("inner")],
+    )
+
+    assert isinstance(await bus.handle(Cmd()), Ntt)
+    await bus.dispatch(Ev())
+
+    assert calls == [
+        "outer>Cmd",
+        "inner>Cmd",
+        "inner<Cmd",
+        "outer<Cmd",
+        "outer>Ev",
+        "inner>Ev",
+        "handler",
+        "inner<Ev",
+        "outer<Ev",
+    ]
+
+
+async def test_metrics_middleware_records_latency_and_errors():
+    """Each invocation is timed; failures are counted and still raised."""
+    registry = MetricsRegistry()
+    metrics = MetricsMiddleware(registry)
+
+    async def handle_cmd(cmd: Cmd) -> Ntt:
+        if cmd.fail:
+            raise RuntimeError("boom")
+        return Ntt()
+
+    bus = MessageBus(
+        command_handlers={Cmd: handle_cmd}, event_handlers={}, middleware=[metrics]
+    )
+
+    await bus.handle(Cmd())
+    with pytest.raises(RuntimeError):
+        await bus.handle(Cmd(fail=True))
+
+    labels = ("command", "Cmd", handler_name(handle_cmd))
+    assert metrics.duration.count(labels) == 2
+    assert metrics.errors.value(labels) == 1
+    assert metrics.in_flight.value(labels) == 0
+
+
+async def test_metrics_middleware_counts_swallowed_event_handler_errors():
+    """Event handler errors are recorded even though the bus logs and drops them."""
+    registry = MetricsRegistry()
+    metrics = MetricsMiddleware(registry)
+
+    async def failing(ev: Ev) -> None:
+        raise RuntimeError("boom")
+
+    bus = MessageBus(
+        command_handlers={}, event_handlers={Ev: [failing]}, middleware=[metrics]
+    )
+
+    await bus.dispatch(Ev())
+
+    assert metrics.errors.value(("event", "Ev", handler_name(failing))) == 1
+    assert "fastup_bus_handler_errors_total{" in registry.render()
+
+
+async def test_metrics_middleware_tracks_in_flight_invocations():
+    """The in-flight gauge reflects handlers currently running."""
+    metrics = MetricsMiddleware(MetricsRegistry())
+    gate = asyncio.Event()
+
+    async def slow(ev: Ev) -> None:
+        await gate.wait()
+
+    bus = MessageBus(
+        command_handlers={}, event_handlers={Ev: [slow]}, middleware=[metrics]
+    )
+
+    tasks = [asyncio.create_task(bus.dispatch(Ev())) for _ in range(3)]
+    await asyncio.sleep(0)
+    labels = ("event", "Ev", handler_name(slow))
+    assert metrics.in_flight.value(labels) == 3
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert metrics.in_flight.value(labels) == 0
+
+
+async def test_observe_queues_reports_dispatcher_depth():
+    """Queue depth is sampled from the bus when metrics are rendered."""
+    registry = MetricsRegistry()
+    metrics = MetricsMiddleware(registry)
+    bus = MessageBus(command_handlers={}, event_handlers={})
+    bus.dispatcher = BackgroundDispatcher(bus.dispatch, workers=1, maxsize=10)
+    metrics.observe_queues(bus.queue_depths)
+
+    bus.queue.put_nowait(Ev())
+
+    rendered = registry.render()
+    assert 'fastup_bus_queue_depth{queue="shared"} 1' in rendered
+    assert 'fastup_bus_queue_depth{queue="dispatcher"} 0' in rendered
+
+
+async def test_metrics_report_lane_depths_and_wait_times():
+    """Lane depths are sampled on render; waits are observed as events are taken."""
+    registry = MetricsRegistry()
+    metrics = MetricsMiddleware(registry)
+
+    async def dispatch(event: Event) -> None: ...
+
+    dispatcher = BackgroundDispatcher(
+        dispatch, workers=1, maxsize=10, on_wait=metrics.observe_lane_wait
+    )
+    metrics.observe_lanes(lambda: dispatcher.stats().lanes)
+    dispatcher.start()
+    await dispatcher.submit(Ev())
+
+    assert 'fastup_bus_lane_depth{lane="normal"} 1' in registry.render()
+    await dispatcher.stop(timeout=1)
+
+    rendered = registry.render()
+    assert 'fastup_bus_lane_depth{lane="normal"} 0' in rendered
+    assert metrics.lane_wait.count((Priority.NORMAL.label,)) == 1
+
+
+async def test_metrics_report_executor_saturation_and_wait_times():
+    registry = MetricsRegistry()
+    metrics = MetricsMiddleware(registry)
+    executor = OffloadExecutor(
+        "thread",
+        concurrent.futures.ThreadPoolExecutor(2),
+        workers=2,
+        on_wait=metrics.observe_executor_wait,
+    )
+    metrics.observe_executors([executor])
+
+    await executor.run(sum, [1, 2])
+    executor.shutdown()
+
+    rendered = registry.render()
+    assert 'fastup_executor_pending{executor="thread"} 0' in rendered
+    assert 'fastup_executor_saturation{executor="thread"} 0' in rendered
+    assert metrics.executor_wait.count(("thread",)) == 1
@@ -0,0 +1,109 @@
+import asyncio
+import dataclasses
+
+import pytest
+
+from fastup.core.bus import MessageBus, PartitionedDispatcher
+from fastup.core.events import Event
+
+
+@dataclasses.dataclass(frozen=True)
+class Ev(Event):
+    key: int | None
+    n: int = 0
+
+
+def key_of(event: Event) -> int | None:
+    assert isinstance(event, Ev)
+    return event.key
+
+
+async def test_events_with_the_same_key_are_handled_in_order():
+    """Same-key events never overlap, even when earlier ones are slower."""
+    handled: list[tuple[int | None, int]] = []
+    running: set[int | None] = set()
+
+    async def dispatch(event: Event) -> None:
+        assert isinstance(event, Ev)
+        assert event.key not in running
+        running.add(event.key)
+        await asyncio.sleep(0.01 if event.n == 0 else 0)
+        running.discard(event.key)
+        handled.append((event.key, event.n))
+
+    dispatcher = PartitionedDispatcher(dispatch, key_of, workers=4)
+    dispatcher.start()
+    for n in range(5):
+        for key in (1, 2):
+            await dispatcher.submit(Ev(key=key, n=n))
+    await dispatcher.stop(timeout=1)
+
+    for key in (1, 2):
+        assert [n for k, n in handled if k == key] == [0, 1, 2, 3, 4]
+
+
+async def test_events_with_different_keys_run_in_parallel():
+    """A slow partition does not hold back the others."""
+    gate = asyncio.Event()
+    handled: list[int | None] = []
+
+    async def dispatch(event: Event) -> None:
+        assert isinstance(event, Ev)
+        if event.key == 0:
+            await gate.wait()
+        handled.append(event.key)
+
+    dispatcher = PartitionedDispatcher(dispatch, key_of, workers=2)
+    assert dispatcher.partition_of(Ev(key=0)) != dispatcher.partition_of(Ev(key=1))
+    dispatcher.start()
+    await dispatcher.submit(Ev(key=0))
+    await dispatcher.submit(Ev(key=1))
+    await asyncio.sleep(0.01)
+
+    assert handled == [1]
+    assert dispatcher.stats().depth == 0
+    gate.set()
+    await dispatcher.stop(timeout=1)
+    assert handled == [1, 0]
+
+
+async def test_events_without_a_key_are_spread_round_robin():
+    async def dispatch(event: Event) -> None: ...
+
+    dispatcher = PartitionedDispatcher(dispatch, key_of, workers=3)
+
+    assert [dispatcher.partition_of(Ev(key=None)) for _ in range(4)] == [0, 1, 2, 0]
+
+
+async def test_failures_are_counted_and_the_partition_keeps_running():
+    async def dispatch(event: Event) -> None:
+        assert isinstance(event, Ev)
+        if event.n == 0:
+            raise ValueError("boom")
+
+    dispatcher = PartitionedDispatcher(dispatch, key_of, workers=1)
+    dispatcher.start()
+    await dispatcher.submit(Ev(key=1, n=0))
+    await dispatcher.submit(Ev(key=1, n=1))
+    await dispatcher.stop(timeout=1)
+
+    stats = dispatcher.stats()
+    assert (stats.submitted, stats.processed, stats.failed) == (2, 1, 1)
+
+
+async def test_submit_raises_when_not_running():
+    async def dispatch(event: Event) -> None: ...
+
+    with pytest.raises(RuntimeError):
+        await PartitionedDispatcher(dispatch, key_of).submit(Ev(key=1))
+
+
+def test_bus_partition_key_uses_the_function_of_the_event_type():
+    bus = MessageBus({}, {}, partition_keys={Ev: key_of})
+
+    assert bus.partition_key(Ev(key=7)) == 7
+
+    @dataclasses.dataclass(frozen=True)
+    class Other(Event): ...
+
+    assert bus.partition_key(Other()) is None
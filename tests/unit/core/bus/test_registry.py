@@ -3,7 +3,18 @@ from unittest.mock import patch
 
 import pytest
 
-from fastup.core.bus import register_command, register_event
+from fastup.core.bus import (
+    CommandHandlerOptions,
+    EventHandlerOptions,
+    Priority,
+    RetryPolicy,
+    command_handler_options,
+    event_handler_options,
+    handler_name,
+    register_command,
+    register_event,
+    register_partition_key,
+)
 from fastup.core.commands import Command
 from fastup.core.entities import Entity
 from fastup.core.events import Event
@@ -117,3 +128,101 @@ async def test_registered_event_handler_is_async_callable(event_handlers_mock: d
     registered = event_handlers_mock[Ev1][0]
     assert asyncio.iscoroutinefunction(registered)
     assert await registered(Ev1()) is None
+
+
+@patch("fastup.core.bus.registry.EVENT_HANDLERS", new_callable=dict)
+async def test_register_event_records_dispatch_options(event_handlers_mock: dict):
+    """Options declared at registration are readable from the handler."""
+
+    @register_event(Ev1, sequential=True, max_concurrency=2)
+    async def h1(event: Ev1): ...
+
+    @register_event(Ev1)
+    async def h2(event: Ev1): ...
+
+    assert event_handler_options(h1) == EventHandlerOptions(
+        sequential=True, max_concurrency=2
+    )
+    assert event_handler_options(h2) == EventHandlerOptions()
+
+
+def test_register_event_rejects_non_positive_concurrency():
+    """A concurrency cap below one would block the handler forever."""
+    with pytest.raises(ValueError):
+        register_event(Ev1, max_concurrency=0)
+
+
+@patch("fastup.core.bus.registry.EVENT_HANDLERS", new_callable=dict)
+async def test_register_event_records_retry_policy(event_handlers_mock: dict):
+    """A retry policy declared at registration is part of the handler options."""
+    policy = RetryPolicy(max_attempts=5)
+
+    @register_event(Ev1, retry=policy)
+    async def h1(event: Ev1): ...
+
+    assert event_handler_options(h1).retry is policy
+    assert event_handler_options(h1).retry.max_attempts == 5
+
+
+def test_handler_name_is_the_dotted_path_of_the_handler():
+    """Dead letters identify their handler by module and qualified name."""
+
+    async def handler(event: Ev1): ...
+
+    assert handler_name(handler) == (
+        f"{__name__}.test_handler_name_is_the_dotted_path_of_the_handler"
+        ".<locals>.handler"
+    )
+
+
+@patch("fastup.core.bus.registry.COMMAND_HANDLERS", new_callable=dict)
+async def test_register_command_records_coalesce_key(command_handlers_mock: dict):
+    """The coalesce key is readable from the registered handler."""
+
+    def key(cmd: Cmd1) -> str:
+        return "k"
+
+    @register_command(Cmd1, coalesce_key=key)
+    async def h1(cmd: Cmd1) -> Entity: ...
+
+    @register_command(Cmd2)
+    async def h2(cmd: Cmd2) -> Entity: ...
+
+    assert command_handler_options(h1).coalesce_key is key
+    assert command_handler_options(h2) == CommandHandlerOptions()
+
+
+@patch("fastup.core.bus.registry.COMMAND_HANDLERS", new_callable=dict)
+async def test_register_command_records_timeout(command_handlers_mock: dict):
+    """The default deadline of a command type is read from its handler."""
+
+    @register_command(Cmd1, timeout=2.5)
+    async def h1(cmd: Cmd1) -> Entity: ...
+
+    assert command_handler_options(h1).timeout == 2.5
+    with pytest.raises(ValueError):
+        register_command(Cmd2, timeout=0)
+
+
+@patch("fastup.core.bus.registry.EVENT_HANDLERS", new_callable=dict)
+async def test_register_event_records_priority(event_handlers_mock: dict):
+    @register_event(Ev1, priority=Priority.CRITICAL)
+    async def h1(ev: Ev1) -> None: ...
+
+    @register_event(Ev1)
+    async def h2(ev: Ev1) -> None: ...
+
+    assert event_handler_options(h1).priority is Priority.CRITICAL
+    assert event_handler_options(h2).priority is Priority.NORMAL
+
+
+@patch("fastup.core.bus.registry.EVENT_PARTITION_KEYS", new_callable=dict)
+async def test_register_partition_key_once_per_event_type(partition_keys: dict):
+    def key(ev: Ev1) -> int:
+        return 1
+
+    register_partition_key(Ev1, key)
+
+    assert partition_keys == {Ev1: key}
+    with pytest.raises(RuntimeError):
+        register_partition_key(Ev1, key)
@@ -0,0 +1,46 @@
+import pytest
+
+from fastup.core.bus import RetryPolicy
+from fastup.core.exceptions import SmsSendFailed
+
+
+def test_backoff_grows_exponentially_up_to_max_delay():
+    """Without jitter, delays double per attempt and stop at the cap."""
+    policy = RetryPolicy(base_delay=1, max_delay=5, multiplier=2, jitter=False)
+
+    assert [policy.backoff(a) for a in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_backoff_with_jitter_stays_below_the_exponential_delay():
+    """Full jitter draws each delay between zero and the un-jittered value."""
+    policy = RetryPolicy(base_delay=1, max_delay=60, multiplier=2)
+
+    delays = [policy.backoff(4) for _ in range(200)]
+
+    assert all(0 <= d <= 8 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_should_retry_only_listed_exceptions_within_max_attempts():
+    """Unlisted exceptions and exhausted attempts are not retried."""
+    policy = RetryPolicy(max_attempts=3, retry_on=(SmsSendFailed,))
+
+    assert policy.should_retry(SmsSendFailed(), attempt=1)
+    assert policy.should_retry(SmsSendFailed(), attempt=2)
+    assert not policy.should_retry(SmsSendFailed(), attempt=3)
+    assert not policy.should_retry(ValueError(), attempt=1)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_attempts": 0},
+        {"base_delay": -1},
+        {"base_delay": 10, "max_delay": 1},
+        {"multiplier": 0.5},
+    ],
+)
+def test_invalid_policies_are_rejected(kwargs: dict):
+    """Policies that could never back off sensibly fail at registration time."""
+    with pytest.raises(ValueError):
+        RetryPolicy(**kwargs)
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from fastup.core.bus import SingleFlight
+
+
+async def test_concurrent_calls_with_the_same_key_share_one_execution():
+    """Only the first call runs the work; the others get its result."""
+    runs = 0
+
+    async def work() -> int:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return runs
+
+    group = SingleFlight()
+
+    results = await asyncio.gather(*(group.do("k", work) for _ in range(10)))
+
+    assert results == [1] * 10
+    assert runs == 1
+    assert len(group) == 0
+
+
+async def test_different_keys_run_separately():
+    """Coalescing never crosses keys."""
+    group = SingleFlight()
+
+    async def work(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        group.do("a", lambda: work("a")), group.do("b", lambda: work("b"))
+    )
+
+    assert results == ["a", "b"]
+
+
+async def test_result_is_reused_within_the_window_only():
+    """A completed result is shared until the dedupe window elapses."""
+    runs = 0
+
+    async def work() -> int:
+        nonlocal runs
+        runs += 1
+        return runs
+
+    group = SingleFlight(window=0.02)
+
+    assert await group.do("k", work) == 1
+    assert await group.do("k", work) == 1
+    await asyncio.sleep(0.03)
+    assert await group.do("k", work) == 2
+
+
+async def test_failures_are_shared_but_not_remembered():
+    """Waiting callers see the error; the next call runs the work again."""
+    runs = 0
+
+    async def work() -> int:
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0)
+        if runs == 1:
+            raise ConnectionError("down")
+        return runs
+
+    group = SingleFlight(window=10)
+
+    results = await asyncio.gather(
+        group.do("k", work), group.do("k", work), return_exceptions=True
+    )
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert await group.do("k", work) == 2
+
+
+async def test_cancelling_a_caller_does_not_cancel_the_shared_execution():
+    """Other callers still get the result when the first one goes away."""
+    gate = asyncio.Event()
+
+    async def work() -> str:
+        await gate.wait()
+        return "done"
+
+    group = SingleFlight()
+    first = asyncio.create_task(group.do("k", work))
+    second = asyncio.create_task(group.do("k", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    gate.set()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+def test_negative_window_is_rejected():
+    with pytest.raises(ValueError):
+        SingleFlight(window=-1)
@@ -1,7 +1,10 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
+from fastup.core.bus import deadline_scope
+
 from fastup.core.enums import OtpIntent
 from fastup.core.exceptions import SmsSendFailed
 from fastup.core.services.sms_service import SMSService
@@ -10,8 +13,8 @@ from fastup.core.services.sms_service import SMSService
 class MockSMS(SMSService):
     """Mock implementation of SMSService for testing."""
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, timeout: float | None = None) -> None:
+        super().__init__(timeout)
         self.send_sms_mock = AsyncMock()
 
     async def send_sms(self, phone: str, text: str) -> int:
@@ -40,3 +43,27 @@ async def test_send_otp_handles_send_sms_exception(mock_sms: MockSMS):
         await mock_sms.send_otp(
             phone="+1234567890", otp_code="5678", intent=OtpIntent.SIGN_UP
         )
+
+
+async def hang(*args) -> int:
+    await asyncio.sleep(1)
+    return 0
+
+
+async def test_send_otp_fails_when_send_sms_exceeds_its_timeout():
+    """A hanging provider is cancelled after `timeout` seconds."""
+    sms = MockSMS(timeout=0.01)
+    sms.send_sms_mock.side_effect = hang
+
+    with pytest.raises(SmsSendFailed) as exc_info:
+        await sms.send_otp(phone="+1", otp_code="1234", intent=OtpIntent.SIGN_UP)
+    assert isinstance(exc_info.value.__cause__, TimeoutError)
+
+
+async def test_send_otp_is_bounded_by_the_current_deadline():
+    """The time left before the deadline caps the configured timeout."""
+    sms = MockSMS(timeout=60)
+    sms.send_sms_mock.side_effect = hang
+
+    with deadline_scope(0.01), pytest.raises(SmsSendFailed):
+        await sms.send_otp(phone="+1", otp_code="1234", intent=OtpIntent.SIGN_UP)
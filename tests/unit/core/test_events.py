@@ -0,0 +1,35 @@
+import dataclasses
+
+import pytest
+
+from fastup.core.events import Event, OtpIssuedEvent
+
+
+@dataclasses.dataclass(frozen=True)
+class OtpIssuedEventV2(OtpIssuedEvent):
+    """Nested subclass, to check lookup walks the whole hierarchy."""
+
+    channel: str
+
+
+def test_event_payload_round_trip_rebuilds_equal_event():
+    """An event rebuilt from its type key and payload equals the original."""
+    event = OtpIssuedEvent(otp_id=1)
+
+    rebuilt = Event.from_payload(event.type_key, event.to_payload())
+
+    assert rebuilt == event
+    assert type(rebuilt) is OtpIssuedEvent
+
+
+def test_event_from_payload_resolves_nested_subclasses():
+    """Subclasses of concrete events are resolved by their qualified name."""
+    event = OtpIssuedEventV2(otp_id=1, channel="sms")
+
+    assert Event.from_payload(event.type_key, event.to_payload()) == event
+
+
+def test_event_from_payload_raises_for_unknown_type():
+    """Unknown type keys raise LookupError rather than returning a bare Event."""
+    with pytest.raises(LookupError):
+        Event.from_payload("nowhere.Missing", {})
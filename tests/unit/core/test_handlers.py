@@ -0,0 +1,38 @@
+import pkgutil
+
+from fastup.core import bus, handlers
+
+
+def test_manifest_lists_every_handler_module():
+    """A handler module missing from the manifest would never be loaded."""
+    listed = {module for modules in handlers.MANIFEST.values() for module in modules}
+    modules = {
+        f"{handlers.__name__}.{info.name}"
+        for info in pkgutil.iter_modules(handlers.__path__)
+    }
+
+    assert listed == modules
+
+
+def test_load_all_registers_the_handlers_of_every_manifest_entry():
+    handlers.load_all()
+
+    for message_type in handlers.MANIFEST:
+        assert (
+            message_type in bus.COMMAND_HANDLERS or message_type in bus.EVENT_HANDLERS
+        )
+
+
+def test_handlers_are_importable_from_the_package():
+    from fastup.core.handlers import handle_signup
+
+    assert handle_signup.__name__ == "handle_signup"
+
+
+def test_password_handlers_hash_on_the_process_policy():
+    """Argon2 runs on the executor the bus binds for these handlers."""
+    from fastup.core.handlers import handle_authentication, handle_signup
+
+    for handler in (handle_signup, handle_authentication):
+        options = bus.command_handler_options(handler)
+        assert options.execution is bus.ExecutionPolicy.PROCESS
@@ -0,0 +1,75 @@
+import pytest
+
+from fastup.core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_render_counter_and_gauge_in_prometheus_text_format():
+    """Counters get the `_total` suffix, in their HELP and TYPE lines too."""
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("jobs", "Jobs done.", ("queue",)))
+    gauge = registry.register(Gauge("depth", "Queue depth."))
+    counter.inc(("default",))
+    counter.inc(("default",), 2)
+    gauge.set((), 7)
+
+    assert registry.render() == (
+        "# HELP jobs_total Jobs done.\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{queue="default"} 3\n'
+        "# HELP depth Queue depth.\n"
+        "# TYPE depth gauge\n"
+        "depth 7\n"
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    """Each bucket counts observations less than or equal to its bound."""
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("latency", "Latency.", buckets=(0.1, 1)))
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe((), value)
+
+    lines = registry.render().splitlines()[2:]
+
+    assert lines == [
+        'latency_bucket{le="0.1"} 2',
+        'latency_bucket{le="1"} 3',
+        'latency_bucket{le="+Inf"} 4',
+        "latency_sum 3.65",
+        "latency_count 4",
+    ]
+
+
+def test_gauge_callback_is_read_at_render_time():
+    """Callback gauges report the value current when metrics are scraped."""
+    registry = MetricsRegistry()
+    depth = {"shared": 1}
+    registry.register(
+        Gauge(
+            "depth",
+            "Depth.",
+            ("queue",),
+            collect=lambda: [(("shared",), depth["shared"])],
+        )
+    )
+    depth["shared"] = 5
+
+    assert 'depth{queue="shared"} 5' in registry.render()
+
+
+def test_label_values_are_escaped():
+    """Quotes, backslashes and newlines cannot break the exposition format."""
+    registry = MetricsRegistry()
+    registry.register(Counter("c", "C.", ("name",))).inc(('a"b\\c\nd',))
+
+    assert 'c_total{name="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+
+def test_register_returns_existing_metric_of_the_same_type():
+    """Registering twice shares one series store; a type clash is an error."""
+    registry = MetricsRegistry()
+    first = registry.register(Counter("c", "C."))
+
+    assert registry.register(Counter("c", "C.")) is first
+    with pytest.raises(ValueError):
+        registry.register(Gauge("c", "C."))
@@ -0,0 +1,18 @@
+from fastup.core.otp_codes import otp_code, otp_codes
+from fastup.infra.hash_services import HMACHasher
+
+
+def test_otp_codes_are_digits_of_the_requested_length():
+    codes = otp_codes(HMACHasher(key=b"key"), range(100), 6)
+
+    assert all(len(code) == 6 and code.isdigit() for code in codes)
+    assert len(set(codes)) > 90
+
+
+def test_otp_codes_are_derived_again_only_with_the_same_key():
+    hasher = HMACHasher(key=b"key")
+
+    assert otp_code(hasher, 42, 4) == otp_code(HMACHasher(key=b"key"), 42, 4)
+    assert otp_codes(hasher, [1, 2, 3], 8) != otp_codes(
+        HMACHasher(key=b"other"), [1, 2, 3], 8
+    )
@@ -1,6 +1,13 @@
+import asyncio
+import concurrent.futures
+import multiprocessing
+
 import pytest
 
+from fastup.core.bus import AdmissionController, OffloadExecutor, bind_executor
+from fastup.core.exceptions import TooManyRequestsExc
 from fastup.core.services import HashService
+from fastup.infra.hash_services import Argon2PasswordHasher
 
 # A list of the fixture names to avoid repetition in parametrize calls
 HASHER_FIXTURE_NAMES = ["argon2_hasher", "hmac_hasher"]
@@ -114,3 +121,149 @@ def test_verify_handles_malformed_hash(
 
     # Assert
     assert result is False, "Verification should fail for a malformed hash."
+
+
+@pytest.mark.parametrize("hasher_fixture_name", HASHER_FIXTURE_NAMES)
+async def test_async_variants_hash_and_verify_like_the_sync_ones(
+    hasher_fixture_name: str, request: pytest.FixtureRequest
+):
+    hasher: HashService = request.getfixturevalue(hasher_fixture_name)
+
+    hashed_text = await hasher.ahash("correct-password")
+
+    assert hasher.verify("correct-password", hashed_text) is True
+    assert await hasher.averify("correct-password", hashed_text) is True
+    assert await hasher.averify("wrong-password", hashed_text) is False
+    assert await hasher.averify("any-password", "not-a-valid-hash") is False
+
+
+@pytest.mark.parametrize("hasher_fixture_name", HASHER_FIXTURE_NAMES)
+async def test_async_variants_raise_errors_for_invalid_input(
+    hasher_fixture_name: str, request: pytest.FixtureRequest
+):
+    hasher: HashService = request.getfixturevalue(hasher_fixture_name)
+
+    with pytest.raises(TypeError, match="must be a string"):
+        await hasher.ahash(None)  # type: ignore
+    with pytest.raises(ValueError, match="cannot be empty"):
+        await hasher.averify("", "hashed")
+
+
+async def test_argon2_hasher_runs_async_hashes_on_its_executor():
+    """The hasher is pickled to the pool's worker processes with each call."""
+    executor = OffloadExecutor(
+        "process",
+        concurrent.futures.ProcessPoolExecutor(
+            1, mp_context=multiprocessing.get_context("forkserver")
+        ),
+        workers=1,
+    )
+    hasher = Argon2PasswordHasher(executor=executor)
+    try:
+        hashed_text = await hasher.ahash("a-password")
+        assert await hasher.averify("a-password", hashed_text) is True
+    finally:
+        executor.shutdown()
+
+    assert executor.stats().completed == 2
+
+
+async def test_argon2_hasher_sheds_hashes_beyond_its_admission_limits():
+    hasher = Argon2PasswordHasher(
+        admission=AdmissionController("argon2", limit=1, max_queue=0)
+    )
+
+    results = await asyncio.gather(
+        hasher.ahash("first-password"),
+        hasher.ahash("second-password"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], TooManyRequestsExc)
+
+
+async def test_argon2_hasher_admits_a_batch_as_one_hash_per_item():
+    hasher = Argon2PasswordHasher(
+        admission=AdmissionController("argon2", limit=3, max_queue=0)
+    )
+
+    results = await asyncio.gather(
+        hasher.ahash_many(["first-password", "second-password"]),
+        hasher.ahash("third-password"),
+        hasher.ahash("fourth-password"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], list) and isinstance(results[1], str)
+    assert isinstance(results[2], TooManyRequestsExc)
+
+
+async def test_argon2_hasher_uses_the_executor_of_the_calling_handler():
+    """Without one of its own, hashes run where the handler's policy says."""
+    executor = OffloadExecutor("process", concurrent.futures.ThreadPoolExecutor(1), 1)
+    hasher = Argon2PasswordHasher()
+    try:
+        with bind_executor(executor):
+            await hasher.ahash("a-password")
+    finally:
+        executor.shutdown()
+
+    assert executor.stats().completed == 1
+
+
+@pytest.mark.parametrize("hasher_fixture_name", HASHER_FIXTURE_NAMES)
+def test_batch_variants_match_the_per_item_ones(
+    hasher_fixture_name: str, request: pytest.FixtureRequest
+):
+    hasher: HashService = request.getfixturevalue(hasher_fixture_name)
+
+    hashes = hasher.hash_many(["first", "second"])
+
+    assert hasher.verify_many(
+        [("first", hashes[0]), ("second", hashes[1]), ("first", hashes[1])]
+    ) == [True, True, False]
+    with pytest.raises(ValueError, match="cannot be empty"):
+        hasher.hash_many(["valid", ""])
+
+
+def test_hmac_hasher_batch_hashes_equal_per_item_hashes(hmac_hasher: HashService):
+    assert hmac_hasher.hash_many(["1234", "5678"]) == [
+        hmac_hasher.hash("1234"),
+        hmac_hasher.hash("5678"),
+    ]
+
+
+async def test_argon2_hasher_splits_batches_across_the_executor_workers():
+    """One call per worker, each hashing a contiguous chunk, results in order."""
+    executor = OffloadExecutor(
+        "thread", concurrent.futures.ThreadPoolExecutor(2), workers=2
+    )
+    hasher = Argon2PasswordHasher(
+        executor=executor, time_cost=1, memory_cost=1024, parallelism=1
+    )
+    texts = ["first", "second", "third"]
+
+    hashes = await hasher.ahash_many(texts)
+    valid = await hasher.averify_many(list(zip(texts, reversed(hashes))))
+    executor.shutdown()
+
+    assert [hasher.verify(text, h) for text, h in zip(texts, hashes)] == [True] * 3
+    assert valid == [False, True, False]
+    assert executor.stats().completed == 4
+    assert await hasher.ahash_many([]) == []
+
+
+def test_hashers_can_be_shared_by_threads(hmac_hasher: HashService):
+    """One instance serves every thread, as on free-threaded builds."""
+    argon2_hasher = Argon2PasswordHasher(time_cost=1, memory_cost=1024, parallelism=1)
+    texts = [f"text-{index}" for index in range(16)]
+
+    for hasher in (argon2_hasher, hmac_hasher):
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            hashes = list(pool.map(hasher.hash, texts))
+            valid = list(pool.map(hasher.verify, texts, hashes))
+            swapped = list(pool.map(hasher.verify, texts, reversed(hashes)))
+
+        assert valid == [True] * 16
+        assert swapped == [False] * 16
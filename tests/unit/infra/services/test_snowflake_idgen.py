@@ -1,6 +1,8 @@
 import asyncio
+import concurrent.futures
 
 from fastup.core.services import IDGenerator
+from fastup.infra.snowflake_idgen import SnowflakeIDGenerator
 
 
 async def test_ids_generated_in_a_batch_are_all_unique(idgen: IDGenerator):
@@ -37,3 +39,32 @@ async def test_a_sequence_of_generated_ids_is_correctly_sorted(idgen: IDGenerato
 
     # A list of monotonically increasing numbers should already be sorted
     assert ids == sorted(ids)
+
+
+def test_ids_generated_from_many_threads_and_event_loops_are_all_unique():
+    """
+    One instance is shared by threads, each running its own event loop, as on
+    free-threaded builds offloading work to threads.
+    """
+    idgen = SnowflakeIDGenerator()
+
+    async def batch() -> list[int]:
+        return [await idgen.next_id() for _ in range(2_000)]
+
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        batches = list(pool.map(lambda _: asyncio.run(batch()), range(8)))
+
+    ids = [id_ for ids in batches for id_ in ids]
+    assert len(set(ids)) == len(ids) == 16_000
+    assert all(ids == sorted(ids) for ids in batches)
+
+
+def test_ids_keep_the_node_and_worker_in_their_bits():
+    idgen = SnowflakeIDGenerator(node_id=3, worker_id=17)
+    config = idgen.config
+
+    id_ = idgen.generate()
+
+    assert (id_ >> config.sequence_bits) & ((1 << config.worker_bits) - 1) == 17
+    node = id_ >> (config.sequence_bits + config.worker_bits)
+    assert node & ((1 << config.node_bits) - 1) == 3
@@ -1,12 +1,24 @@
+import concurrent.futures
 from types import SimpleNamespace
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
 
 import pytest
 
-from fastup.bootstrap import bootstrap
-from fastup.core.bus import MessageBus
+from fastup.bootstrap import abootstrap, bootstrap, build_executors
+from fastup.core.bus import (
+    ExecutionPolicy,
+    MessageBus,
+    MetricsMiddleware,
+    PartitionedDispatcher,
+)
 from fastup.core.commands import Command
+from fastup.core.otp_codes import otp_code
+from fastup.core.services import HashService
 from fastup.core.unit_of_work import UnitOfWork
+from fastup.infra import db
+from fastup.infra.hash_services import HMACHasher
+from fastup.infra.pydantic_config import PydanticConfig
+from fastup.infra.redis_stream_transport import RedisStreamTransport
 
 
 class Cmd(Command): ...
@@ -20,6 +32,40 @@ async def bad_handler(cmd: Cmd, missing_dep: str):
     raise NotImplementedError
 
 
+def test_build_executors_runs_the_process_policy_on_threads_without_the_gil():
+    config = PydanticConfig(thread_executor_workers=0, process_executor_workers=2)
+
+    with patch("fastup.core.bus.gil_enabled", return_value=False):
+        [executor] = build_executors(config).values()
+
+    assert isinstance(executor.executor, concurrent.futures.ThreadPoolExecutor)
+    assert (executor.name, executor.workers) == ("process", 2)
+    executor.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("use_threads", "pool"),
+    [
+        (True, concurrent.futures.ThreadPoolExecutor),
+        (False, concurrent.futures.ProcessPoolExecutor),
+    ],
+)
+def test_build_executors_honours_the_configured_process_policy_pool(
+    use_threads: bool, pool: type
+):
+    config = PydanticConfig(
+        thread_executor_workers=0,
+        process_executor_workers=1,
+        process_executor_use_threads=use_threads,
+    )
+
+    with patch("fastup.core.bus.gil_enabled", return_value=use_threads):
+        [executor] = build_executors(config).values()
+
+    assert isinstance(executor.executor, pool)
+    executor.shutdown()
+
+
 @patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: handler})
 async def test_bootstrap_wires_command_handlers_with_injected_dependencies():
     """Ensure command handlers are wrapped with dependency injection
@@ -50,3 +96,151 @@ def test_bootstrap_starts_orm_when_requested(mock_start_orm: Mock):
     """Ensure ORM is initialized when start_orm is True."""
     bootstrap(start_orm=True)
     mock_start_orm.assert_called_once()
+
+
+@patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: handler})
+def test_bootstrap_attaches_background_dispatcher_when_workers_configured():
+    """Ensure a positive `event_workers` setting enables background dispatch."""
+    config = PydanticConfig(event_workers=2)
+
+    assert bootstrap(start_orm=False).dispatcher is None
+    assert bootstrap(config=config, start_orm=False).dispatcher is not None
+
+
+@patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: handler})
+def test_bootstrap_uses_partitioned_workers_when_enabled():
+    """Ordered workers replace the shared pool; registered keys reach the bus."""
+    config = PydanticConfig(event_workers=2, event_partitioned=True)
+
+    bus = bootstrap(config=config, start_orm=False)
+
+    assert isinstance(bus.dispatcher, PartitionedDispatcher)
+    assert bus.partition_keys
+
+
+@patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: handler})
+def test_bootstrap_uses_redis_stream_transport_when_enabled():
+    """Ensure the stream transport takes precedence over local workers."""
+    config = PydanticConfig(
+        event_stream_enabled=True, event_workers=2, hmac_secret_key=b"k" * 32
+    )
+
+    bus = bootstrap(config=config, start_orm=False)
+
+    assert isinstance(bus.dispatcher, RedisStreamTransport)
+
+
+@pytest.mark.parametrize("enabled", ["outbox_enabled", "event_stream_enabled"])
+def test_bootstrap_requires_a_shared_hmac_key_when_events_leave_the_process(
+    enabled: str,
+):
+    """A random per-process key would make other processes send wrong codes."""
+    with pytest.raises(RuntimeError, match="hmac_secret_key"):
+        bootstrap(config=PydanticConfig(**{enabled: True}), start_orm=False)
+
+
+@patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: handler})
+def test_processes_configured_alike_derive_the_same_otp_codes(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """The API and the relay build their configs separately, from the env."""
+    monkeypatch.setenv("FASTUP_HMAC_SECRET_KEY", "a-shared-secret-key")
+    codes = []
+    for _ in range(2):
+        config = PydanticConfig(outbox_enabled=True)
+        bus = bootstrap(config=config, start_orm=False)
+        assert bus.container is not None
+        hmac_hasher = bus.container.resolve(HashService, "hmac")
+        codes.append(otp_code(hmac_hasher, 42, config.otp_length))
+
+    assert codes[0] == codes[1]
+    assert codes[0] != otp_code(HMACHasher(b"another-key"), 42, config.otp_length)
+
+
+@patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: handler})
+def test_bootstrap_hashes_passwords_with_the_given_config():
+    """The Argon2 costs come from the config passed in, not the global one."""
+    config = PydanticConfig(
+        argon2_time_cost=1, argon2_memory_cost_kib=1024, argon2_parallelism=1
+    )
+
+    bus = bootstrap(config=config, start_orm=False)
+
+    assert bus.container is not None
+    hasher = bus.container.resolve(HashService, "argon2")
+    argon2 = hasher.hasher.current_hasher._hasher
+    assert (argon2.time_cost, argon2.memory_cost, argon2.parallelism) == (1, 1024, 1)
+
+
+@patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: handler})
+def test_bootstrap_installs_metrics_middleware_only_when_enabled():
+    """Without metrics, handlers are called without any middleware."""
+    config = PydanticConfig(metrics_enabled=True)
+
+    assert bootstrap(start_orm=False).middleware == ()
+    [middleware] = bootstrap(config=config, start_orm=False).middleware
+    assert isinstance(middleware, MetricsMiddleware)
+
+
+def test_build_executors_leaves_out_policies_without_workers():
+    config = PydanticConfig(thread_executor_workers=3, process_executor_workers=0)
+
+    executors = build_executors(config)
+
+    assert list(executors) == [ExecutionPolicy.THREAD]
+    assert executors[ExecutionPolicy.THREAD].workers == 3
+    executors[ExecutionPolicy.THREAD].shutdown()
+
+
+def test_build_executors_bounds_the_process_pool_calls_in_flight():
+    config = PydanticConfig(
+        thread_executor_workers=0,
+        process_executor_workers=1,
+        process_executor_max_in_flight=4,
+    )
+
+    [executor] = build_executors(config).values()
+
+    assert executor.max_in_flight == 4
+    executor.shutdown()
+
+
+@patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: handler})
+@patch.multiple(
+    "fastup.infra.warmup",
+    new_callable=AsyncMock,
+    warm_database=DEFAULT,
+    warm_redis=DEFAULT,
+    warm_hashers=DEFAULT,
+)
+async def test_abootstrap_warms_up_alongside_building_the_bus(
+    caplog: pytest.LogCaptureFixture, **mocks: AsyncMock
+):
+    """Warm-up steps run with the configured sizes; failing ones are only logged."""
+    config = PydanticConfig(warmup_db_connections=3, warmup_redis_connections=0)
+    mocks["warm_hashers"].side_effect = OSError("no argon2")
+
+    with caplog.at_level("INFO", logger="fastup.bootstrap"):
+        bus = await abootstrap(config=config, start_orm=False)
+
+    assert Cmd in bus.command_handlers
+    mocks["warm_database"].assert_awaited_once_with(db.get_sessionmaker(), 3)
+    mocks["warm_redis"].assert_not_called()
+    assert bus.container is not None
+    mocks["warm_hashers"].assert_awaited_once_with(
+        bus.container.resolve(HashService, "hmac"),
+        bus.container.resolve(HashService, "argon2"),
+        bus.executors.get(ExecutionPolicy.PROCESS),
+    )
+    assert "Startup step bus took" in caplog.text
+    assert "Startup step hashers failed" in caplog.text
+
+
+@patch("fastup.core.bus.COMMAND_HANDLERS", {Cmd: bad_handler})
+async def test_abootstrap_raises_when_dependency_injection_fails():
+    config = PydanticConfig(
+        warmup_db_connections=0, warmup_redis_connections=0, warmup_hashers=False
+    )
+
+    with pytest.raises(RuntimeError):
+        await abootstrap(config=config, start_orm=False)
@@ -0,0 +1,46 @@
+import pathlib
+
+from fastup.calibrate_argon2 import MIN_MEMORY_COST, calibrate, update_env_file
+
+
+def linear(time_cost: int, memory_cost: int, parallelism: int) -> float:
+    """Hashing time model: 1 ms per pass over each MiB."""
+    return time_cost * memory_cost / 1024 * 1e-3
+
+
+def test_calibrate_keeps_the_memory_and_adds_passes_within_the_target():
+    params = calibrate(0.250, max_memory_cost=64 * 1024, parallelism=4, measure=linear)
+
+    assert (params.time_cost, params.memory_cost) == (3, 64 * 1024)
+    assert params.seconds == linear(3, 64 * 1024, 4)
+
+
+def test_calibrate_halves_the_memory_while_one_pass_is_too_slow():
+    params = calibrate(0.050, max_memory_cost=256 * 1024, parallelism=1, measure=linear)
+
+    assert (params.time_cost, params.memory_cost) == (1, 32 * 1024)
+
+
+def test_calibrate_never_goes_below_the_minimum_memory():
+    params = calibrate(0.001, max_memory_cost=64 * 1024, parallelism=1, measure=linear)
+
+    assert (params.time_cost, params.memory_cost) == (1, MIN_MEMORY_COST)
+    assert params.seconds > 0.001
+
+
+def test_update_env_file_replaces_previous_values_and_keeps_other_lines(
+    tmp_path: pathlib.Path,
+):
+    env_file = tmp_path / ".env"
+    env_file.write_text("fastup_db_name=app\nfastup_argon2_time_cost=2\n")
+
+    update_env_file(
+        env_file,
+        {"FASTUP_ARGON2_TIME_COST": "4", "FASTUP_ARGON2_PARALLELISM": "2"},
+    )
+
+    assert env_file.read_text().splitlines() == [
+        "fastup_db_name=app",
+        "FASTUP_ARGON2_TIME_COST=4",
+        "FASTUP_ARGON2_PARALLELISM=2",
+    ]
@@ -0,0 +1,24 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from fastup import dead_letters
+
+
+@pytest.mark.parametrize(
+    "replay", [AsyncMock(return_value=(2, 0)), AsyncMock(side_effect=ConnectionError)]
+)
+async def test_replay_letters_always_stops_the_bus(replay: AsyncMock):
+    bus = Mock(stop=AsyncMock())
+    with (
+        patch("fastup.bootstrap.bootstrap", return_value=bus),
+        patch.object(dead_letters, "DeadLetterStore") as store,
+    ):
+        store.return_value.replay = replay
+        try:
+            await dead_letters.replay_letters(limit=10, ids=None)
+        except ConnectionError:
+            pass
+
+    replay.assert_awaited_once_with(bus.redeliver, limit=10, ids=None)
+    bus.stop.assert_awaited_once()
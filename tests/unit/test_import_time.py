@@ -0,0 +1,72 @@
+"""Import-time regression tests, based on `python -X importtime`.
+
+Each test imports a module in a fresh interpreter, so nothing is cached.
+"""
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+# microseconds spent importing fastup's own modules, excluding dependencies;
+# about 100 ms for the whole app, so only real regressions trip it
+FASTUP_SELF_TIME_BUDGET_US = 500_000
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+HTTP_STACK = ("fastapi", "starlette", "jwt", "phonenumbers", "pydantic_extra_types")
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Import `module` in a new interpreter; returns (self, cumulative) µs by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        match[3]: (int(match[1]), int(match[2]))
+        for match in map(LINE.match, result.stderr.splitlines())
+        if match
+    }
+
+
+def test_importing_the_db_module_neither_creates_the_engine_nor_loads_the_driver():
+    assert "asyncpg" not in import_times("fastup.infra.db")
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "fastup.relay",
+        "fastup.stream_worker",
+        "fastup.dead_letters",
+        "fastup.serve",
+        "fastup.calibrate_argon2",
+    ],
+)
+def test_workers_and_cli_tools_do_not_import_the_http_stack(module: str):
+    imported = import_times(module)
+
+    assert not [name for name in HTTP_STACK if name in imported]
+
+
+def test_listing_dead_letters_does_not_build_the_bus():
+    imported = import_times("fastup.dead_letters")
+
+    assert "fastup.bootstrap" not in imported
+    assert "redis" not in imported
+    assert "pwdlib" not in imported
+
+
+def test_fastup_modules_import_within_budget():
+    imported = import_times("fastup.api.app")
+
+    own = sum(
+        self_time
+        for name, (self_time, _) in imported.items()
+        if name.split(".")[0] == "fastup"
+    )
+    assert own < FASTUP_SELF_TIME_BUDGET_US
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from fastup.memory_report import children, read_memory, report
+
+pytestmark = pytest.mark.skipif(
+    not os.path.exists("/proc/self/smaps_rollup"), reason="needs Linux /proc"
+)
+
+
+def test_read_memory_splits_resident_memory_into_shared_and_private():
+    usage = read_memory(os.getpid())
+
+    assert usage.pid == os.getpid()
+    assert usage.rss == usage.shared + usage.private
+    assert 0 < usage.pss <= usage.rss
+
+
+def test_report_lists_the_master_then_its_children():
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert child.pid in children(os.getpid())
+        usages = report(os.getpid())
+    finally:
+        child.kill()
+        child.wait()
+
+    assert usages[0].pid == os.getpid()
+    assert child.pid in [usage.pid for usage in usages[1:]]
@@ -0,0 +1,51 @@
+import asyncio
+import signal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from fastup import relay
+from fastup.infra.pydantic_config import PydanticConfig
+
+
+@pytest.fixture
+async def bus():
+    yield Mock(stop=AsyncMock())
+    # the entry point installs its shutdown handlers on the shared test loop
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.remove_signal_handler(sig)
+
+
+async def test_run_relay_delivers_through_the_bus_and_stops_it(bus: Mock):
+    config = PydanticConfig(event_drain_timeout_sec=3)
+    with (
+        patch.object(relay, "get_config", return_value=config),
+        patch.object(relay, "bootstrap", return_value=bus) as bootstrap,
+        patch.object(relay, "OutboxRelay") as outbox_relay,
+    ):
+        outbox_relay.return_value.run = AsyncMock()
+        await relay.run_relay()
+
+    bootstrap.assert_called_once_with(config)
+    assert outbox_relay.call_args.kwargs["deliver"] is bus.deliver
+    bus.stop.assert_awaited_once_with(3)
+
+
+async def test_run_relay_stops_the_bus_when_the_relay_fails(bus: Mock):
+    with (
+        patch.object(relay, "bootstrap", return_value=bus),
+        patch.object(relay, "OutboxRelay") as outbox_relay,
+    ):
+        outbox_relay.return_value.run = AsyncMock(side_effect=ConnectionError)
+        with pytest.raises(ConnectionError):
+            await relay.run_relay()
+
+    bus.stop.assert_awaited_once()
+
+
+def test_main_runs_the_relay_until_it_returns():
+    with patch.object(relay, "run_relay", new_callable=AsyncMock) as run_relay:
+        relay.main()
+
+    run_relay.assert_awaited_once()
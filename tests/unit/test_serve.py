@@ -0,0 +1,44 @@
+import gc
+import socket
+from unittest.mock import Mock
+
+from fastup.infra.pydantic_config import PydanticConfig
+from fastup.serve import bind_socket, preload, server_config
+
+
+def test_server_config_takes_tuning_from_the_app_config():
+    config = PydanticConfig(
+        server_backlog=512, server_keep_alive_sec=15, server_http="h11"
+    )
+
+    uv_config = server_config(config, "127.0.0.1", 9000)
+
+    assert (uv_config.host, uv_config.port) == ("127.0.0.1", 9000)
+    assert uv_config.backlog == 512
+    assert uv_config.timeout_keep_alive == 15
+    assert uv_config.http == "h11"
+
+
+def test_bind_socket_with_reuse_port_lets_workers_share_the_port():
+    """Every worker binds its own SO_REUSEPORT socket to the same port."""
+    first = bind_socket("127.0.0.1", 0, reuse_port=True)
+    port = first.getsockname()[1]
+    second = bind_socket("127.0.0.1", port, reuse_port=True)
+    try:
+        assert second.getsockname()[1] == port
+        assert second.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+    finally:
+        first.close()
+        second.close()
+
+
+def test_preload_freezes_the_imported_objects():
+    """Objects preloaded with gc_freeze end up in the permanent generation."""
+    uv_config = Mock(load=lambda: [object() for _ in range(10)])
+    try:
+        preload(uv_config, PydanticConfig(server_gc_freeze=True))
+        assert gc.get_freeze_count() > 0
+        assert not gc.isenabled()
+    finally:
+        gc.unfreeze()
+        gc.enable()
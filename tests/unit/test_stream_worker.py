@@ -0,0 +1,54 @@
+import asyncio
+import signal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from fastup import stream_worker
+from fastup.infra.pydantic_config import PydanticConfig
+
+
+@pytest.fixture
+async def bus():
+    yield Mock(stop=AsyncMock())
+    # the entry point installs its shutdown handlers on the shared test loop
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.remove_signal_handler(sig)
+
+
+async def test_run_worker_consumes_into_the_bus_and_stops_it(bus: Mock):
+    config = PydanticConfig(event_drain_timeout_sec=3, event_stream_group="g")
+    with (
+        patch.object(stream_worker, "get_config", return_value=config),
+        patch.object(stream_worker, "bootstrap", return_value=bus) as bootstrap,
+        patch.object(stream_worker, "redis_client_provider"),
+        patch.object(stream_worker, "RedisStreamTransport") as transport,
+    ):
+        transport.return_value.consume = AsyncMock()
+        await stream_worker.run_worker()
+
+    bootstrap.assert_called_once_with(config)
+    assert transport.call_args.kwargs["group"] == "g"
+    transport.return_value.consume.assert_awaited_once_with(bus.deliver)
+    bus.stop.assert_awaited_once_with(3)
+
+
+async def test_run_worker_stops_the_bus_when_consuming_fails(bus: Mock):
+    with (
+        patch.object(stream_worker, "bootstrap", return_value=bus),
+        patch.object(stream_worker, "redis_client_provider"),
+        patch.object(stream_worker, "RedisStreamTransport") as transport,
+    ):
+        transport.return_value.consume = AsyncMock(side_effect=ConnectionError)
+        with pytest.raises(ConnectionError):
+            await stream_worker.run_worker()
+
+    bus.stop.assert_awaited_once()
+
+
+def test_main_runs_the_worker_until_it_returns():
+    with patch.object(stream_worker, "run_worker", new_callable=AsyncMock) as run:
+        stream_worker.main()
+
+    run.assert_awaited_once()